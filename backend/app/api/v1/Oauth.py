@@ -7,7 +7,6 @@ from app.services import oauth_service
 from app.db.session import get_session
 from app.models.users import User
 from app.services.auth_service import AuthService
-from app.utils.jwt import create_access_token
 from app.core.config import get_settings
 
 settings = get_settings()
@@ -86,8 +85,8 @@ async def google_callback(request: Request, session: AsyncSession = Depends(get_
             await session.refresh(user)
 
     # 3️⃣ Generate tokens
-    access_token = create_access_token(user.id)
-    refresh_token = await auth_service.create_and_store_refresh_token(user, revoke_old=False)
+    access_token = await auth_service.issue_access_token(user.id)
+    refresh_token = await auth_service.create_and_store_refresh_token(user.id, revoke_old=False)
 
     return JSONResponse(
         {
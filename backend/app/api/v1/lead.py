@@ -1,11 +1,94 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.db.session import get_session
-from app.services.lead_service import chat
+from app.core.config import get_settings
+from app.db.session import async_session, get_session
+from app.schemas.lead import LeadGenerationJobRead
+from app.services.lead_service import chat, chat_stream, llm_client, llm_flights
+from app.services.lead_cache import lead_cache
+from app.services.lead_jobs import ACTIVE_STATUSES, get_job
 
+settings = get_settings()
 router = APIRouter()
 
 @router.post("/chat")
-async def chat_leads(user_id: str, message: str = None, db: AsyncSession=Depends(get_session)):
-    response = await chat(user_id=user_id, message=message, db=db)
-    return response
\ No newline at end of file
+async def chat_leads(
+    request: Request,
+    user_id: str,
+    message: str = None,
+    no_cache: bool = False,
+    limit: int | None = Query(default=None, ge=1, le=settings.LEAD_MAX_LIMIT),
+    db: AsyncSession=Depends(get_session),
+):
+    response = await chat(
+        user_id=user_id, message=message, db=db, request=request, use_cache=not no_cache, limit=limit
+    )
+    return response
+
+@router.post("/chat/stream")
+async def chat_leads_stream(
+    request: Request,
+    user_id: str,
+    message: str = None,
+    no_cache: bool = False,
+    limit: int | None = Query(default=None, ge=1, le=settings.LEAD_MAX_LIMIT),
+    db: AsyncSession=Depends(get_session),
+):
+    """
+    Same conversation as /chat, but the lead preview is pushed row by row
+    as Server-Sent Events.
+    """
+    return StreamingResponse(
+        chat_stream(
+            user_id=user_id, message=message, db=db, request=request, use_cache=not no_cache, limit=limit
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/chat/cache/stats")
+async def lead_cache_stats():
+    return lead_cache.stats()
+
+
+@router.get("/chat/llm/stats")
+async def lead_llm_stats():
+    return {"flights": llm_flights.stats(), **llm_client.stats()}
+
+
+@router.get("/chat/jobs/{job_id}", response_model=LeadGenerationJobRead)
+async def get_generation_job(job_id: uuid.UUID, db: AsyncSession=Depends(get_session)):
+    job = await get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/chat/jobs/{job_id}/events")
+async def generation_job_events(request: Request, job_id: uuid.UUID):
+    """
+    Server-Sent Events feed of a generation job: one "status" event per
+    change and a final "done" or "failed" event carrying the result.
+    """
+    async def events():
+        last_status = None
+        while not await request.is_disconnected():
+            async with async_session() as session:
+                job = await get_job(session, job_id)
+            if not job:
+                yield f"event: error\ndata: {json.dumps({'detail': 'Job not found'})}\n\n"
+                return
+            if job.status != last_status:
+                last_status = job.status
+                payload = LeadGenerationJobRead.model_validate(job).model_dump_json()
+                event = job.status if job.status not in ACTIVE_STATUSES else "status"
+                yield f"event: {event}\ndata: {payload}\n\n"
+            if job.status not in ACTIVE_STATUSES:
+                return
+            await asyncio.sleep(1)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
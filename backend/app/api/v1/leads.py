@@ -0,0 +1,210 @@
+import os
+import uuid
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.session import get_session
+from app.models.lead_import import LeadImportJob
+from app.models.lead_merge import LeadMergeRun
+from app.models.lead_scoring import LeadScoringRun
+from app.schemas.lead import (
+    LeadFilter,
+    LeadImportJobRead,
+    LeadMergeRunRead,
+    LeadPage,
+    LeadScoringRunRead,
+    LeadSearchResult,
+)
+from app.services.lead_export import EXPORT_FORMATS, EXPORTERS
+from app.services.lead_import import (
+    IMPORT_FORMATS,
+    claim_import_for_resume,
+    create_import_job,
+    run_import,
+    save_upload,
+)
+from app.services.lead_query import LeadQueryService, parse_fields
+from app.services.lead_resolution import create_merge_run, run_merge
+from app.services.lead_scoring import create_scoring_run, run_scoring
+
+router = APIRouter(prefix="/leads", tags=["Leads"])
+
+
+@router.get("/", response_model=LeadPage)
+async def list_leads(
+    filters: LeadFilter = Depends(),
+    fields: str | None = Query(default=None, description="Comma-separated columns to return"),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = None,
+    order: str = Query(default="desc", pattern="^(asc|desc)$"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    List leads ordered by lead_score, created_at and id.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    service = LeadQueryService(session)
+    return await service.list_leads(
+        filters,
+        parse_fields(fields),
+        limit=limit,
+        cursor=cursor,
+        descending=order == "desc",
+    )
+
+
+@router.get("/search", response_model=LeadSearchResult)
+async def search_leads(
+    q: str = Query(min_length=2, max_length=200),
+    filters: LeadFilter = Depends(),
+    limit: int = Query(default=20, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Ranked full-text and fuzzy search over business name, summary, industry,
+    contact person and website, with industry/country/verified facet counts.
+    """
+    service = LeadQueryService(session)
+    return await service.search_leads(q, filters, limit=limit)
+
+
+
+@router.get("/export")
+async def export_leads(
+    format: str = Query(default="csv", pattern="^(csv|ndjson|parquet)$"),
+    filters: LeadFilter = Depends(),
+    fields: str | None = Query(default=None, description="Comma-separated columns to export"),
+):
+    """
+    Stream every lead matching the listing filters as CSV, NDJSON or Parquet.
+    Rows are read through a server-side cursor, so memory use does not grow
+    with the size of the export.
+    """
+    columns = parse_fields(fields)
+    if format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+
+    return StreamingResponse(
+        EXPORTERS[format](filters, columns),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="leads.{format}"'},
+    )
+
+# ----------------- Bulk import -----------------
+@router.post("/import", response_model=LeadImportJobRead)
+async def import_leads(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: str | None = Query(default=None, pattern="^(csv|ndjson)$"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Upload a CSV or NDJSON lead file. The file is spooled to disk and
+    imported in the background; poll the returned job for progress.
+    """
+    fmt = format or os.path.splitext(file.filename or "")[1].lstrip(".").lower()
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported import format, expected csv or ndjson")
+
+    job_id = uuid.uuid4()
+    source_path = await save_upload(file, fmt, job_id)
+    job = await create_import_job(session, file.filename or source_path, fmt, source_path, job_id)
+    background_tasks.add_task(run_import, job.id)
+    return job
+
+
+async def _get_import_job(job_id: uuid.UUID, session: AsyncSession) -> LeadImportJob:
+    job = await session.get(LeadImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+
+@router.get("/import/{job_id}", response_model=LeadImportJobRead)
+async def get_import_job(job_id: uuid.UUID, session: AsyncSession = Depends(get_session)):
+    return await _get_import_job(job_id, session)
+
+
+@router.post("/import/{job_id}/resume", response_model=LeadImportJobRead)
+async def resume_import_job(
+    job_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Continue a pending or failed import, or a running one whose worker
+    stopped making progress for LEAD_IMPORT_STALE_SECONDS.
+    """
+    job = await _get_import_job(job_id, session)
+    if not await claim_import_for_resume(session, job_id):
+        raise HTTPException(status_code=409, detail=f"Import job is already {job.status}")
+    await session.refresh(job)
+    background_tasks.add_task(run_import, job.id)
+    return job
+
+
+@router.get("/import/{job_id}/rejects")
+async def download_import_rejects(job_id: uuid.UUID, session: AsyncSession = Depends(get_session)):
+    job = await _get_import_job(job_id, session)
+    if not os.path.exists(job.rejects_path):
+        raise HTTPException(status_code=404, detail="No rejected rows")
+    return FileResponse(job.rejects_path, media_type="application/x-ndjson")
+
+
+# ----------------- Scoring -----------------
+@router.post("/scoring/runs", response_model=LeadScoringRunRead)
+async def start_scoring_run(
+    background_tasks: BackgroundTasks,
+    profile: str = "default",
+    full: bool = False,
+    filters: LeadFilter = Depends(),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Recompute lead scores in the background. Without `full`, only leads
+    updated since the last completed run of the profile are rescored.
+    """
+    filtered = bool(filters.model_dump(exclude_none=True))
+    try:
+        run = await create_scoring_run(session, profile, full, filtered)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    background_tasks.add_task(run_scoring, run.id, filters if filtered else None)
+    return run
+
+
+@router.get("/scoring/runs/{run_id}", response_model=LeadScoringRunRead)
+async def get_scoring_run(run_id: uuid.UUID, session: AsyncSession = Depends(get_session)):
+    run = await session.get(LeadScoringRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Scoring run not found")
+    return run
+
+
+# ----------------- Duplicates -----------------
+@router.post("/duplicates/merge", response_model=LeadMergeRunRead)
+async def start_merge_run(
+    background_tasks: BackgroundTasks,
+    dry_run: bool = False,
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Find leads describing the same company (shared domain or similar name)
+    and merge each group into its best lead in the background.
+    """
+    run = await create_merge_run(session, dry_run)
+    background_tasks.add_task(run_merge, run.id)
+    return run
+
+
+@router.get("/duplicates/merge/{run_id}", response_model=LeadMergeRunRead)
+async def get_merge_run(run_id: uuid.UUID, session: AsyncSession = Depends(get_session)):
+    run = await session.get(LeadMergeRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Merge run not found")
+    return run
@@ -0,0 +1,55 @@
+"""
+Measure how long importing the app takes and list the slowest imports.
+
+    python -m app.cli.import_budget
+    python -m app.cli.import_budget --module app.cli.lead_worker --budget-ms 800 --top 30
+
+Runs the import in a fresh interpreter with `-X importtime` and exits with
+status 1 when the total exceeds the budget, so it can guard cold start in CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+def measure(module: str) -> list[tuple[int, int, str]]:
+    """(self_us, cumulative_us, name) for every module imported by `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main(args: argparse.Namespace):
+    rows = measure(args.module)
+    total_ms = next(cum for _, cum, name in reversed(rows) if name.strip() == args.module) / 1000
+
+    print(f"Importing {args.module}: {total_ms:.0f} ms (budget {args.budget_ms} ms)\n")
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"\nImport budget exceeded by {total_ms - args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check import time against a budget")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=int, default=2000)
+    parser.add_argument("--top", type=int, default=20, help="How many of the slowest imports to list")
+    main(parser.parse_args())
@@ -0,0 +1,53 @@
+"""
+Import a CSV or NDJSON lead file from the command line.
+
+    python -m app.cli.import_leads leads.csv
+    python -m app.cli.import_leads --resume <job_id>
+"""
+import argparse
+import asyncio
+import os
+import uuid
+
+from app.db.session import async_session
+from app.models.lead_import import LeadImportJob
+from app.services.lead_import import IMPORT_FORMATS, claim_import_for_resume, create_import_job, run_import
+
+
+async def main(args: argparse.Namespace):
+    if args.resume:
+        job_id = uuid.UUID(args.resume)
+        async with async_session() as session:
+            if not await claim_import_for_resume(session, job_id):
+                raise SystemExit("Import job not found, completed, or still running")
+    else:
+        fmt = args.format or os.path.splitext(args.path)[1].lstrip(".").lower()
+        if fmt not in IMPORT_FORMATS:
+            raise SystemExit("Unsupported import format, expected csv or ndjson")
+        async with async_session() as session:
+            job = await create_import_job(session, os.path.basename(args.path), fmt, os.path.abspath(args.path))
+        job_id = job.id
+        print(f"Created import job {job_id}")
+
+    await run_import(job_id)
+
+    async with async_session() as session:
+        job = await session.get(LeadImportJob, job_id)
+        print(
+            f"Import {job.id} {job.status}: {job.rows_processed} processed, "
+            f"{job.rows_inserted} inserted, {job.rows_updated} updated, "
+            f"{job.rows_skipped} skipped, {job.rows_rejected} rejected"
+        )
+        if job.rows_rejected:
+            print(f"Rejected rows written to {job.rejects_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import leads")
+    parser.add_argument("path", nargs="?", help="CSV or NDJSON file to import")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--resume", metavar="JOB_ID", help="Resume an existing import job")
+    args = parser.parse_args()
+    if not args.path and not args.resume:
+        parser.error("a file path or --resume is required")
+    asyncio.run(main(args))
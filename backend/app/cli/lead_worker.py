@@ -0,0 +1,44 @@
+"""
+Standalone lead generation worker. Claims jobs from the shared
+lead_generation_jobs queue, so generation can be scaled separately from
+the API processes (run those with LEAD_JOB_WORKERS=0).
+
+    python -m app.cli.lead_worker --concurrency 8
+
+Requires LEAD_GENERATION_MODE=job with CHAT_STATE_BACKEND=database so
+results reach the API processes; settings refuse job mode otherwise.
+"""
+import argparse
+import asyncio
+import signal
+
+from app.core.config import get_settings
+from app.services.lead_jobs import LeadJobWorkerPool
+from app.services.lead_service import run_generation_job
+
+settings = get_settings()
+
+
+async def main(args: argparse.Namespace):
+    pool = LeadJobWorkerPool(
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+        requeue_interval=settings.LEAD_JOB_REQUEUE_INTERVAL_SECONDS,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await pool.start(run_generation_job)
+    print(f"Lead worker started with {args.concurrency} slots")
+    await stop.wait()
+    await pool.stop()
+    print("Lead worker stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run lead generation jobs")
+    parser.add_argument("--concurrency", type=int, default=max(settings.LEAD_JOB_WORKERS, 1))
+    parser.add_argument("--poll-interval", type=float, default=settings.LEAD_JOB_POLL_INTERVAL_SECONDS)
+    asyncio.run(main(parser.parse_args()))
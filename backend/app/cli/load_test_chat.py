@@ -0,0 +1,155 @@
+"""
+Drive the /chat conversation with many concurrent users and report
+throughput and latency percentiles.
+
+    python -m app.cli.load_test_chat --users 200 --segments 20
+    python -m app.cli.load_test_chat --base-url http://localhost:8000 --users 50
+
+Without --base-url the app runs in-process (lifespan included) and, unless
+APP_LLM_PROVIDER is set, with the fake LLM provider, so no network access is
+needed. The database from APP_DATABASE_URL is still used.
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+import numpy as np
+
+INDUSTRIES = ["Fintech", "Healthcare", "Logistics", "SaaS", "Retail", "Manufacturing", "Edtech", "Energy"]
+LOCATIONS = ["Berlin", "London", "New York", "Singapore", "Kathmandu", "Toronto", "Sydney", "Paris"]
+CLIENTS = ["startups", "small businesses", "mid-sized companies", "enterprises"]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.flows_completed = 0
+        self.requests = 0
+
+    def record(self, step: str, seconds: float, ok: bool):
+        self.requests += 1
+        self.latencies[step].append(seconds)
+        if not ok:
+            self.errors[step] += 1
+
+    def report(self, wall_seconds: float):
+        print(f"\n{self.flows_completed} conversations in {wall_seconds:.2f}s "
+              f"({self.flows_completed / wall_seconds:.2f}/s), "
+              f"{self.requests} requests ({self.requests / wall_seconds:.2f}/s)")
+        print(f"{'step':<12}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for step, values in self.latencies.items():
+            ms = np.array(values) * 1000
+            p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+            print(f"{step:<12}{len(ms):>8}{self.errors[step]:>8}{p50:>10.1f}{p90:>10.1f}{p99:>10.1f}{ms.max():>10.1f}")
+
+
+async def _post_chat(client: httpx.AsyncClient, user_id: str, message: str, args) -> tuple[dict, bool]:
+    params = {"user_id": user_id, "message": message}
+    if args.no_cache:
+        params["no_cache"] = "true"
+    if args.limit:
+        params["limit"] = args.limit
+    response = await client.post("/chat", params=params)
+    if response.status_code != 200:
+        return {}, False
+    return response.json(), True
+
+
+async def _wait_for_job(client: httpx.AsyncClient, job_id: str, args) -> bool:
+    deadline = time.monotonic() + args.timeout
+    while time.monotonic() < deadline:
+        response = await client.get(f"/chat/jobs/{job_id}")
+        if response.status_code != 200:
+            return False
+        job = response.json()
+        if job["status"] == "done":
+            return True
+        if job["status"] == "failed":
+            return False
+        await asyncio.sleep(args.poll_interval)
+    return False
+
+
+async def run_user(client: httpx.AsyncClient, index: int, run_id: str, recorder: Recorder, args):
+    segment = index % args.segments
+    user_id = f"loadtest-{run_id}-{index}"
+    script = [
+        ("greeting", "hi"),
+        ("clients", CLIENTS[segment % len(CLIENTS)]),
+        ("industry", INDUSTRIES[segment % len(INDUSTRIES)]),
+        ("location", LOCATIONS[(segment // len(INDUSTRIES)) % len(LOCATIONS)]),
+    ]
+    if args.save:
+        script.append(("save", "save"))
+
+    flow_started = time.monotonic()
+    for step, message in script:
+        started = time.monotonic()
+        try:
+            body, ok = await _post_chat(client, user_id, message, args)
+            if ok and "job_id" in body:
+                ok = await _wait_for_job(client, body["job_id"], args)
+        except httpx.HTTPError:
+            body, ok = {}, False
+        recorder.record(step, time.monotonic() - started, ok)
+        if not ok:
+            return
+        # One-shot mode may skip questions the opening message already answered
+        if "table" in body or "job_id" in body:
+            if not args.save:
+                break
+    recorder.record("flow", time.monotonic() - flow_started, True)
+    recorder.flows_completed += 1
+
+
+async def main(args: argparse.Namespace):
+    recorder = Recorder()
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.users)
+    timeout = httpx.Timeout(args.timeout)
+
+    async def drive(client: httpx.AsyncClient):
+        semaphore = asyncio.Semaphore(args.concurrency or args.users)
+
+        async def one(i):
+            async with semaphore:
+                await run_user(client, i, run_id, recorder, args)
+
+        started = time.monotonic()
+        await asyncio.gather(*(one(i) for i in range(args.users)))
+        recorder.report(time.monotonic() - started)
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as client:
+            await drive(client)
+        return
+
+    os.environ.setdefault("APP_LLM_PROVIDER", "fake")
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=timeout) as client:
+            await drive(client)
+
+        from app.services.lead_service import llm_client, llm_flights
+        print(f"\nLLM: {llm_flights.stats()} hedges={llm_client.stats()['hedges']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the lead chat flow")
+    parser.add_argument("--users", type=int, default=50, help="Simulated users (one conversation each)")
+    parser.add_argument("--concurrency", type=int, default=0, help="Conversations in flight at once (default: all)")
+    parser.add_argument("--segments", type=int, default=10, help="Distinct industry/location combinations")
+    parser.add_argument("--limit", type=int, help="Leads per preview")
+    parser.add_argument("--save", action="store_true", help="Also save the previewed leads")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the lead generation cache")
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    asyncio.run(main(parser.parse_args()))
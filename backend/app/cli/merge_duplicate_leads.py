@@ -0,0 +1,35 @@
+"""
+Merge duplicate leads from the command line.
+
+    python -m app.cli.merge_duplicate_leads --dry-run
+    python -m app.cli.merge_duplicate_leads
+"""
+import argparse
+import asyncio
+
+from app.db.session import async_session
+from app.models.lead_merge import LeadMergeRun
+from app.services.lead_resolution import create_merge_run, run_merge
+
+
+async def main(args: argparse.Namespace):
+    async with async_session() as session:
+        run = await create_merge_run(session, args.dry_run)
+    print(f"Started merge run {run.id}{' (dry run)' if args.dry_run else ''}")
+
+    await run_merge(run.id)
+
+    async with async_session() as session:
+        run = await session.get(LeadMergeRun, run.id)
+        print(
+            f"Merge run {run.id} {run.status}: {run.rows_scanned} scanned, "
+            f"{run.clusters_found} duplicate groups, {run.leads_merged} leads merged"
+        )
+        if run.error:
+            print(f"Error: {run.error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge duplicate leads")
+    parser.add_argument("--dry-run", action="store_true", help="Only count duplicate groups")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,36 @@
+"""
+Delete expired and revoked refresh tokens once, e.g. from cron when the
+in-process purge is disabled (REFRESH_TOKEN_PURGE_INTERVAL_SECONDS=0).
+
+    python -m app.cli.purge_refresh_tokens --batch-size 5000 --max-batches 1000
+"""
+import argparse
+import asyncio
+
+from app.core.config import get_settings
+from app.services.refresh_token_purge import RefreshTokenPurger
+
+settings = get_settings()
+
+
+async def main(args: argparse.Namespace):
+    purger = RefreshTokenPurger(
+        interval_seconds=0,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+        pause_seconds=args.pause,
+    )
+    deleted = await purger.run_once()
+    stats = purger.stats()
+    print(f"Deleted {deleted} refresh tokens in {stats['last_run_batches']} batches ({stats['last_run_seconds']}s)")
+    if stats["last_error"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Purge expired and revoked refresh tokens")
+    parser.add_argument("--batch-size", type=int, default=settings.REFRESH_TOKEN_PURGE_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=settings.REFRESH_TOKEN_PURGE_MAX_BATCHES)
+    parser.add_argument("--pause", type=float, default=settings.REFRESH_TOKEN_PURGE_PAUSE_SECONDS,
+                        help="Seconds to sleep between batches")
+    asyncio.run(main(parser.parse_args()))
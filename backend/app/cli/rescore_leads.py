@@ -0,0 +1,39 @@
+"""
+Recompute lead scores from the command line.
+
+    python -m app.cli.rescore_leads --profile default
+    python -m app.cli.rescore_leads --full --industry Fintech
+"""
+import argparse
+import asyncio
+
+from app.db.session import async_session
+from app.models.lead_scoring import LeadScoringRun
+from app.schemas.lead import LeadFilter
+from app.services.lead_scoring import create_scoring_run, run_scoring
+
+
+async def main(args: argparse.Namespace):
+    filters = LeadFilter(industry=args.industry, country=args.country)
+    filtered = bool(filters.model_dump(exclude_none=True))
+
+    async with async_session() as session:
+        run = await create_scoring_run(session, args.profile, args.full, filtered)
+    print(f"Started scoring run {run.id} ({'full' if args.full else 'incremental'})")
+
+    await run_scoring(run.id, filters if filtered else None)
+
+    async with async_session() as session:
+        run = await session.get(LeadScoringRun, run.id)
+        print(f"Scoring run {run.id} {run.status}: {run.rows_scored} scored, {run.rows_changed} changed")
+        if run.error:
+            print(f"Error: {run.error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute lead scores")
+    parser.add_argument("--profile", default="default")
+    parser.add_argument("--full", action="store_true", help="Rescore every lead, not only changed ones")
+    parser.add_argument("--industry")
+    parser.add_argument("--country")
+    asyncio.run(main(parser.parse_args()))
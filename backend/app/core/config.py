@@ -1,3 +1,6 @@
+from typing import Literal
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
@@ -9,12 +12,116 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int
     DEBUG: bool
     DATABASE_URL: str
-    GEMINI_API_KEY: str
+    GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
 
+    # bcrypt cost; stored hashes with a different cost are replaced on the next login
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # Hashing runs on its own threads; calls beyond workers + queue are rejected with 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
+    # Expired and revoked refresh tokens are deleted in batches every interval (0 disables)
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: float = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    REFRESH_TOKEN_PURGE_MAX_BATCHES: int = 100  # per run
+    REFRESH_TOKEN_PURGE_PAUSE_SECONDS: float = 0.05
+
+    # Principals (user + permission codes) cached per worker for authenticated requests
+    AUTHZ_CACHE_TTL_SECONDS: int = 300
+    AUTHZ_CACHE_MAX_ENTRIES: int = 10_000
+    # Embed "module:name" permission codes and the authz version in access tokens
+    ACCESS_TOKEN_PERMISSION_CLAIMS: bool = False
+    # How stale a worker's view of authz_state.version may get before it is re-read
+    AUTHZ_VERSION_CHECK_SECONDS: float = 1.0
+
+    # "gemini", or "fake" for deterministic offline responses (load tests, local development)
+    LLM_PROVIDER: str = "gemini"
+    LLM_FAKE_LATENCY: str = "lognormal:800:0.5"  # fixed:<ms> | uniform:<min>:<max> | exponential:<mean> | lognormal:<median>:<sigma>
+    LLM_FAKE_TOKENS_PER_SECOND: float = 150
+    LLM_FAKE_ERROR_RATE: float = 0.0
+    LLM_FAKE_SEED: int = 0
+    # Load the LLM client and open its connection during startup instead of on the first request
+    LLM_WARM_UP: bool = False
+
+    # LLM call limits
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 0  # 0 disables rate limiting
+    # Comma-separated models (may repeat GEMINI_MODEL) used as hedges and fallbacks, in order
+    LLM_HEDGE_MODELS: str = ""
+    # Start the next model once the current one is slower than this latency percentile (0 disables hedging)
+    LLM_HEDGE_PERCENTILE: float = 95
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 2.0
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS: float = 15.0
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5
+    LLM_BREAKER_RESET_SECONDS: float = 30.0
+
+    # Leads per chat request; requests above LEAD_SHARD_SIZE are split into parallel prompts
+    LEAD_DEFAULT_LIMIT: int = 5
+    LEAD_MAX_LIMIT: int = 1000
+    LEAD_SHARD_SIZE: int = 25
+    # Lead response format requested from the LLM: "tsv" (header + tab-separated rows) or "json"
+    LEAD_WIRE_FORMAT: Literal["tsv", "json"] = "tsv"
+    # Serve matching stored leads before asking Gemini for the shortfall
+    LEAD_RETRIEVAL_FIRST: bool = True
+    # Entity resolution: minimum trigram similarity of canonical names to treat leads as one company
+    LEAD_MATCH_NAME_SIMILARITY: float = 0.8
+    # Leads sharing a domain are one company only if their names are at least this similar
+    LEAD_MATCH_DOMAIN_NAME_SIMILARITY: float = 0.3
+    LEAD_MERGE_BATCH_SIZE: int = 1000
+
+    # Lead generation cache
+    LEAD_CACHE_TTL_SECONDS: int = 86400
+    LEAD_CACHE_MAX_ENTRIES: int = 1024
+    LEAD_CACHE_SQLITE_PATH: str | None = None
+    LEAD_CACHE_DISK_MAX_ENTRIES: int = 100_000
+
+    # Chat conversation state ("memory" or "database")
+    CHAT_STATE_BACKEND: str = "memory"
+    CHAT_STATE_TTL_SECONDS: int = 3600
+    CHAT_STATE_MAX_ENTRIES: int = 10_000
+    CHAT_STATE_MAX_BYTES: int = 64_000
+    # The budget grows to LEAD_MAX_LIMIT * this so a full preview always fits
+    CHAT_STATE_BYTES_PER_LEAD: int = 1024
+    # Total serialized state the memory backend keeps per process before evicting old conversations
+    CHAT_STATE_MEMORY_MAX_BYTES: int = 256_000_000
+
+    # Rows per INSERT statement when bulk saving leads
+    LEAD_BULK_CHUNK_SIZE: int = 1000
+
+    # Bulk lead import
+    LEAD_IMPORT_DIR: str = "imports"
+    LEAD_IMPORT_BATCH_SIZE: int = 5000
+    # A running import whose progress has not moved for this long is treated as crashed and may be resumed
+    LEAD_IMPORT_STALE_SECONDS: int = 600
+
+    # Rows fetched per server-side cursor round trip when exporting leads
+    LEAD_EXPORT_BATCH_SIZE: int = 2000
+
+    # Deterministic lead scoring
+    LEAD_SCORING_BATCH_SIZE: int = 10_000
+    LEAD_SCORING_PROFILES_PATH: str | None = None
+    # Incremental runs re-read rows this far behind the last watermark to catch late commits
+    LEAD_SCORING_WATERMARK_OVERLAP_SECONDS: int = 300
+
+    # Let the first chat message fill clients/industry/location at once, asking only for what is missing
+    LEAD_CHAT_ONE_SHOT: bool = True
+    LEAD_INTENT_LLM_FALLBACK: bool = True
+
+    # Lead generation jobs ("job" queues /chat generations, "inline" runs them in the request).
+    # Job mode needs CHAT_STATE_BACKEND=database: any process may claim a job and must load its conversation
+    LEAD_GENERATION_MODE: str = "inline"
+    LEAD_JOB_WORKERS: int = 4
+    LEAD_JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    LEAD_JOB_MAX_QUEUED: int = 1000
+    LEAD_JOB_MAX_PER_USER: int = 2
+    LEAD_JOB_STALE_SECONDS: int = 900
+    # How often each worker pool looks for running jobs older than LEAD_JOB_STALE_SECONDS
+    LEAD_JOB_REQUEUE_INTERVAL_SECONDS: int = 60
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -22,6 +129,15 @@ class Settings(BaseSettings):
         env_prefix="APP_"
     )
 
+    @model_validator(mode="after")
+    def check_generation_mode(self):
+        if self.LEAD_GENERATION_MODE == "job" and self.CHAT_STATE_BACKEND != "database":
+            raise ValueError(
+                "LEAD_GENERATION_MODE=job requires CHAT_STATE_BACKEND=database, "
+                "otherwise a job claimed by another process cannot find its conversation"
+            )
+        return self
+
 
 @lru_cache()
 def get_settings():
@@ -1,12 +1,122 @@
 # app/core/security.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import get_settings
+from app.utils.latency import LatencyTracker
+
+settings = get_settings()
+
+# Hashes made with other rounds are reported by needs_update and replaced on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS
+)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated thread pool so hashing never blocks the event
+    loop (bcrypt releases the GIL while it works). At most max_workers calls
+    run and max_queue wait; further calls are rejected with 503 at once
+    instead of piling up behind a login burst.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait = LatencyTracker()
+        self.run_time = LatencyTracker()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _finished(self, waited: float, ran: float):
+        self._pending -= 1
+        self.completed += 1
+        self.queue_wait.record(waited)
+        self.run_time.record(ran)
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.capacity:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+
+        def timed():
+            started = time.monotonic()
+            try:
+                return fn(*args)
+            finally:
+                # Release the slot when the work ends, even if the caller was cancelled
+                loop.call_soon_threadsafe(
+                    self._finished, started - submitted, time.monotonic() - started
+                )
+
+        self._pending += 1
+        try:
+            future = self._pool().submit(timed)
+        except Exception:
+            self._pending -= 1
+            raise
+        return await asyncio.wrap_future(future)
 
-def hash_password(password: str) -> str:
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(pwd_context.verify, password, password_hash)
+
+    async def verify_and_update(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        return await self._run(pwd_context.verify_and_update, password, password_hash)
+
+    def stats(self) -> dict:
+        def ms(tracker: LatencyTracker, q: float):
+            value = tracker.percentile(q)
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "workers": self.max_workers,
+            "capacity": self.capacity,
+            "in_flight": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait_ms": {"p50": ms(self.queue_wait, 50), "p95": ms(self.queue_wait, 95)},
+            "hash_ms": {"p50": ms(self.run_time, 50), "p95": ms(self.run_time, 95)},
+        }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def hash_password(password: str) -> str:
     """Hash a plain password"""
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
+
 
-def verify_password(password: str, password_hash: str) -> bool:
+async def verify_password(password: str, password_hash: str) -> bool:
     """Verify a plain password against its hash"""
-    return pwd_context.verify(password, password_hash)
+    return await password_hasher.verify(password, password_hash)
+
+
+async def verify_and_update_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a new hash when the stored one uses outdated parameters"""
+    return await password_hasher.verify_and_update(password, password_hash)
@@ -2,4 +2,9 @@ from sqlmodel import SQLModel
 from app.models.users import User
 from app.models.timestamp import TimestampMixin
 from app.models.refresh_token import RefreshToken
-from app.models.lead import Lead
\ No newline at end of file
+from app.models.lead import Lead
+from app.models.conversation import ChatConversation
+from app.models.lead_import import LeadImportJob
+from app.models.lead_scoring import LeadScoringRun
+from app.models.lead_job import LeadGenerationJob
+from app.models.lead_merge import LeadMergeRun
@@ -1,13 +1,11 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
-from sqlalchemy.orm import selectinload
 from uuid import UUID
-from app.models.authorization import Role, Permission
-from app.models.users import User
+from app.schemas.users import UserRead
+from app.services.authz_cache import Principal, load_principal, permission_cache
 from app.db.session import get_session
-from app.utils.jwt import verify_token
+from app.utils.jwt import decode_token, verify_token
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
@@ -16,25 +14,26 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 # --------------------------
 # Get current user dependency
 # --------------------------
-async def get_current_user(
+async def get_current_principal(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session)
-) -> User:
+) -> Principal:
+    """
+    The authenticated user and their permission codes. Served from the
+    per-worker permission cache while the authz version is unchanged.
+    """
     user_id = verify_token(token)
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    result = await session.exec(
-        select(User)
-        .where(User.id == user_id)
-        .options(
-            selectinload(User.roles).selectinload(Role.permissions)  # class-bound attribute here!
-        )
-    )
-    user = result.one_or_none()
-    if not user:
+    principal = await load_principal(session, user_id)
+    if not principal:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return principal
+
+
+async def get_current_user(principal: Principal = Depends(get_current_principal)) -> UserRead:
+    return principal.user
 
 
 # --------------------------
@@ -46,18 +45,23 @@ def require_permission(module: str, action: str):
     Example: require_permission("user", "create")
     """
 
-    async def dependency(current_user: User = Depends(get_current_user)):
+    async def dependency(
+        token: str = Depends(oauth2_scheme),
+        session: AsyncSession = Depends(get_session),
+    ):
         # Build the full permission code: e.g. "user:create"
         required_code = f"{module}:{action}"
 
-        # roles and permissions are already loaded on current_user
-        user_permissions = {
-            f"{perm.module}:{perm.name}"
-            for role in current_user.roles
-            for perm in role.permissions
-        }
+        # Trust the token's permission claim unless roles or permissions changed since it was issued
+        claims = decode_token(token)
+        permissions = claims.get("perms")
+        if permissions is None or (claims.get("azv") or 0) < await permission_cache.current_version(session):
+            principal = await load_principal(session, UUID(claims.get("sub")))
+            if not principal:
+                raise HTTPException(status_code=404, detail="User not found")
+            permissions = principal.permissions
 
-        if required_code not in user_permissions:
+        if required_code not in permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Missing permission: {required_code}",
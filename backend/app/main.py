@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -9,7 +10,14 @@ from app.api.v1.auth import router as authentication_router
 from app.api.v1.user import router as user_router
 from app.api.v1.authorization import router as authorization_router
 from app.api.v1.lead import router as lead_router
+from app.api.v1.leads import router as leads_router
 from app.api.v1.Oauth import router as oauth_router
+from app.core.config import get_settings
+from app.services.lead_jobs import worker_pool
+from app.services.refresh_token_purge import refresh_token_purger
+from app.services.lead_service import llm_client, run_generation_job
+
+settings = get_settings()
 
 # @asynccontextmanager
 # async def lifespan(app: FastAPI):
@@ -25,7 +33,26 @@ from app.api.v1.Oauth import router as oauth_router
 #     yield
 
 # app = FastAPI(title="RBAC App", lifespan=lifespan)
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.LLM_WARM_UP:
+        try:
+            await asyncio.wait_for(llm_client.warm_up(), timeout=settings.LLM_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            print("[LLM] Warm-up timed out, continuing startup")
+    # Set LEAD_JOB_WORKERS=0 when generation runs in `python -m app.cli.lead_worker`
+    if settings.LEAD_GENERATION_MODE == "job" and worker_pool.concurrency > 0:
+        await worker_pool.start(run_generation_job)
+    if refresh_token_purger.interval_seconds > 0:
+        refresh_token_purger.start()
+    yield
+    await refresh_token_purger.stop()
+    await worker_pool.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,4 +66,5 @@ app.include_router(authentication_router)
 app.include_router(user_router)
 app.include_router(authorization_router)
 app.include_router(lead_router)
+app.include_router(leads_router)
 app.include_router(oauth_router)
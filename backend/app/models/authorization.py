@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Column, Relationship, String
+from sqlalchemy import BigInteger, DateTime, Integer, func
 from typing import List, TYPE_CHECKING
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
@@ -45,5 +46,21 @@ class Permission(SQLModel, table=True):
     roles: List[Role] = Relationship(back_populates="permissions", link_model=RolePermission)
 
 
+class AuthzState(SQLModel, table=True):
+    """
+    Single row holding the authorization version. Every change to roles,
+    permissions or user role assignments increments it in the same
+    transaction, so cached principals can be checked with one cheap read.
+    """
+    __tablename__ = "authz_state"
+
+    id: int = Field(default=1, sa_column=Column(Integer, primary_key=True))
+    version: int = Field(default=1, sa_column=Column(BigInteger, nullable=False))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+
+
 Role.model_rebuild()
 Permission.model_rebuild() 
\ No newline at end of file
@@ -0,0 +1,16 @@
+from sqlmodel import SQLModel, Field, Column, String, Text, DateTime
+from datetime import datetime, timezone
+
+
+class ChatConversation(SQLModel, table=True):
+    __tablename__ = "chat_conversations"
+
+    user_id: str = Field(sa_column=Column(String, primary_key=True))
+    state: str = Field(sa_column=Column(Text, nullable=False))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
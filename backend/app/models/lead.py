@@ -1,6 +1,7 @@
 import uuid
 from sqlmodel import SQLModel, Field, Column, String, Integer, Boolean, Relationship, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Index, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from app.models.timestamp import TimestampMixin
 from app.models.users import User
 from datetime import datetime, timezone
@@ -8,6 +9,24 @@ from datetime import datetime, timezone
 
 class Lead(SQLModel, table=True):
     __tablename__ = "leads"
+    __table_args__ = (
+        # Keyset pagination on (lead_score, created_at, id), optionally pre-filtered
+        Index("ix_leads_score_created_id", "lead_score", "created_at", "id"),
+        Index("ix_leads_industry_score_created_id", "industry", "lead_score", "created_at", "id"),
+        Index("ix_leads_country_score_created_id", "country", "lead_score", "created_at", "id"),
+        # Retrieval-first chat lookups by case-insensitive industry
+        Index("ix_leads_lower_industry_score", func.lower(text("industry")), text("lead_score DESC")),
+        # Incremental rescoring scans rows changed since the last run
+        Index("ix_leads_updated_at_id", "updated_at", "id"),
+        # Entity resolution: fuzzy blocking on the canonical business name
+        Index("ix_leads_name_key_trgm", "name_key", postgresql_using="gin", postgresql_ops={"name_key": "gin_trgm_ops"}),
+        # Full-text and trigram search
+        Index("ix_leads_search_vector", "search_vector", postgresql_using="gin"),
+        *[
+            Index(f"ix_leads_{col}_trgm", col, postgresql_using="gin", postgresql_ops={col: "gin_trgm_ops"})
+            for col in ("business_name", "contact_person", "website")
+        ],
+    )
 
     # Required fields
     id: uuid.UUID = Field(
@@ -28,6 +47,9 @@ class Lead(SQLModel, table=True):
     country: str | None = Field(default=None, sa_column=Column(String, nullable=True))
     website: str | None = Field(default=None, sa_column=Column(String, nullable=True))
     summary: str | None = Field(default=None, sa_column=Column(String, nullable=True))
+    # Normalised entity-resolution keys, see app.utils.lead_normalize.resolution_keys
+    domain_key: str | None = Field(default=None, sa_column=Column(String, nullable=True, index=True))
+    name_key: str | None = Field(default=None, sa_column=Column(String, nullable=True))
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(DateTime(timezone=True), nullable=False)
@@ -36,3 +58,6 @@ class Lead(SQLModel, table=True):
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(DateTime(timezone=True), nullable=False, onupdate=lambda: datetime.now(timezone.utc))
     )
+
+    # Weighted full-text document, filled by the leads_search_vector_update trigger on every write
+    search_vector: str | None = Field(default=None, sa_column=Column(TSVECTOR, nullable=True))
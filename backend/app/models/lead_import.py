@@ -0,0 +1,36 @@
+import uuid
+from sqlmodel import SQLModel, Field, Column, String, BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+
+
+class LeadImportJob(SQLModel, table=True):
+    __tablename__ = "lead_import_jobs"
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
+    )
+    filename: str = Field(sa_column=Column(String, nullable=False))
+    format: str = Field(sa_column=Column(String(10), nullable=False))
+    source_path: str = Field(sa_column=Column(String, nullable=False))
+    rejects_path: str = Field(sa_column=Column(String, nullable=False))
+    # pending -> running -> completed | failed
+    status: str = Field(default="pending", sa_column=Column(String(20), nullable=False, index=True))
+
+    # Progress counters; rows_processed is also the resume offset
+    rows_processed: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_inserted: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_updated: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_skipped: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_rejected: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    error: str | None = Field(default=None, sa_column=Column(String, nullable=True))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False, onupdate=lambda: datetime.now(timezone.utc))
+    )
@@ -0,0 +1,32 @@
+import uuid
+from sqlmodel import SQLModel, Field, Column, String, DateTime, JSON
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+
+
+class LeadGenerationJob(SQLModel, table=True):
+    __tablename__ = "lead_generation_jobs"
+    __table_args__ = (
+        # Claiming scans queued jobs oldest first
+        Index("ix_lead_generation_jobs_status_created", "status", "created_at"),
+        Index("ix_lead_generation_jobs_user_status", "user_id", "status"),
+    )
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
+    )
+    user_id: str = Field(sa_column=Column(String, nullable=False))
+    # queued -> running -> done | failed
+    status: str = Field(default="queued", sa_column=Column(String(20), nullable=False))
+    params: dict = Field(sa_column=Column(JSON, nullable=False))
+    # Chat response produced by the job (preview table)
+    result: dict | None = Field(default=None, sa_column=Column(JSON, nullable=True))
+    error: str | None = Field(default=None, sa_column=Column(String, nullable=True))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    started_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
+    finished_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
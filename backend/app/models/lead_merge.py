@@ -0,0 +1,27 @@
+import uuid
+from sqlmodel import SQLModel, Field, Column, String, Boolean, BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+
+
+class LeadMergeRun(SQLModel, table=True):
+    __tablename__ = "lead_merge_runs"
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
+    )
+    # pending -> running -> completed | failed
+    status: str = Field(default="pending", sa_column=Column(String(20), nullable=False))
+    # Dry runs only report the clusters they would merge
+    dry_run: bool = Field(default=False, sa_column=Column(Boolean, nullable=False, default=False))
+    rows_backfilled: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_scanned: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    clusters_found: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    leads_merged: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    error: str | None = Field(default=None, sa_column=Column(String, nullable=True))
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    finished_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
@@ -0,0 +1,29 @@
+import uuid
+from sqlmodel import SQLModel, Field, Column, String, Boolean, BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+
+
+class LeadScoringRun(SQLModel, table=True):
+    __tablename__ = "lead_scoring_runs"
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
+    )
+    profile: str = Field(sa_column=Column(String(50), nullable=False, index=True))
+    # pending -> running -> completed | failed
+    status: str = Field(default="pending", sa_column=Column(String(20), nullable=False))
+    full: bool = Field(default=False, sa_column=Column(Boolean, nullable=False, default=False))
+    # Filtered runs never advance the incremental watermark
+    filtered: bool = Field(default=False, sa_column=Column(Boolean, nullable=False, default=False))
+    rows_scored: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    rows_changed: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    # Highest leads.updated_at covered by this run
+    watermark: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
+    error: str | None = Field(default=None, sa_column=Column(String, nullable=True))
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    finished_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
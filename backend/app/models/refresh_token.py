@@ -1,11 +1,17 @@
-from sqlmodel import SQLModel, Field, Column, String, Boolean, DateTime
+from sqlmodel import SQLModel, Field, Column, Boolean, DateTime
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, LargeBinary, text
 from datetime import datetime, timezone, timedelta
 import uuid
 
 class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Unrevoked tokens per user, for single-session revocation
+        Index("ix_refresh_tokens_active_user_id", "user_id", postgresql_where=text("NOT revoked")),
+        # Revoked rows waiting for the purge job; expired ones are found through expires_at
+        Index("ix_refresh_tokens_revoked_expires_at", "expires_at", postgresql_where=text("revoked")),
+    )
 
     # Primary key
     id: uuid.UUID = Field(
@@ -15,12 +21,12 @@ class RefreshToken(SQLModel, table=True):
 
     # Foreign key to users
     user_id: uuid.UUID = Field(
-        sa_column=Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     )
 
-    # Token string
-    token: str = Field(
-        sa_column=Column(String, nullable=False, unique=True, index=True)
+    # sha256 of the token's jti; the token itself is never stored
+    jti_hash: bytes = Field(
+        sa_column=Column(LargeBinary(32), nullable=False, unique=True, index=True)
     )
 
     # Revocation flag
@@ -37,5 +43,5 @@ class RefreshToken(SQLModel, table=True):
 
     expires_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc) + timedelta(days=7),
-        sa_column=Column("expires_at", DateTime(timezone=True), nullable=False)
+        sa_column=Column("expires_at", DateTime(timezone=True), nullable=False, index=True)
     )
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import Any, List, Optional
+from datetime import datetime
 import uuid
 
 
@@ -28,4 +29,85 @@ class LeadCreate(BaseModel):
 
 class LeadResponse(LeadPreview):
     id: uuid.UUID
-    verified: bool
\ No newline at end of file
+    verified: bool
+
+
+class LeadFilter(BaseModel):
+    industry: Optional[str] = None
+    country: Optional[str] = None
+    verified: Optional[bool] = None
+    min_score: Optional[int] = Field(default=None, ge=0)
+    max_score: Optional[int] = Field(default=None, ge=0)
+
+
+class LeadPage(BaseModel):
+    items: List[dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel):
+    value: Optional[Any] = None
+    count: int
+
+
+class LeadSearchResult(BaseModel):
+    items: List[dict[str, Any]]
+    total: int
+    facets: dict[str, List[FacetCount]]
+
+
+class LeadImportJobRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    filename: str
+    format: str
+    status: str
+    rows_processed: int
+    rows_inserted: int
+    rows_updated: int
+    rows_skipped: int
+    rows_rejected: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class LeadScoringRunRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    profile: str
+    status: str
+    full: bool
+    filtered: bool
+    rows_scored: int
+    rows_changed: int
+    watermark: Optional[datetime] = None
+    error: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class LeadGenerationJobRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    user_id: str
+    status: str
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class LeadMergeRunRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    status: str
+    dry_run: bool
+    rows_backfilled: int
+    rows_scanned: int
+    clusters_found: int
+    leads_merged: int
+    error: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
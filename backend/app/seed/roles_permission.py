@@ -6,6 +6,7 @@ from sqlalchemy.orm import selectinload
 from app.models.authorization import Role, Permission
 from app.models.users import User
 from app.core.security import hash_password
+from app.services.authz_cache import bump_authz_version, permission_cache
 
 
 async def seed_roles_permissions(db: AsyncSession):
@@ -50,7 +51,9 @@ async def seed_roles_permissions(db: AsyncSession):
         # Always ensure superadmin has ALL permissions
         superadmin_role.permissions = list(perm_objs.values())
         db.add(superadmin_role)
+        version = await bump_authz_version(db)
         await db.commit()
+        permission_cache.advance(version)
 
     print("✅ Roles and permissions seeded successfully!")
 
@@ -79,7 +82,7 @@ async def seed_default_superadmin(
     user = User(
         username=username,
         email=email,
-        password_hash=hash_password(password),
+        password_hash=await hash_password(password),
         is_active=True,
     )
 
@@ -2,15 +2,21 @@ from fastapi import HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from typing import Optional
+import uuid
 from datetime import datetime, timedelta, timezone
 from app.models.users import User
 from app.models.authorization import Role
 from app.models.refresh_token import RefreshToken
-from app.core.security import hash_password, verify_password
-from app.utils.jwt import create_refresh_token
+from app.core.security import hash_password, verify_and_update_password
+from app.core.config import get_settings
+from app.services.authz_cache import load_principal
+from app.utils.jwt import create_access_token, create_refresh_token, hash_jti, refresh_token_jti
+from sqlalchemy import func, update
 from sqlalchemy.orm import selectinload
 from app.schemas.users import UserRead
 
+settings = get_settings()
+
 
 class AuthService:
     def __init__(self, session: AsyncSession):
@@ -53,7 +59,7 @@ class AuthService:
         user = User(
             username=username,
             email=email,
-            password_hash=hash_password(password) if password else None,
+            password_hash=await hash_password(password) if password else None,
             roles=[default_role],
             google_sub=google_sub,
             profile_pic=profile_pic,
@@ -88,30 +94,47 @@ class AuthService:
 
         # User must have password set to use password login
         if user and user.password_hash:
-            if verify_password(password, user.password_hash):
+            verified, new_hash = await verify_and_update_password(password, user.password_hash)
+            if verified:
+                # Stored hash used an older cost; replace it while we have the plain password
+                if new_hash:
+                    user.password_hash = new_hash
+                    self.session.add(user)
+                    await self.session.commit()
                 return user
 
         return None
 
+    async def issue_access_token(self, user_id: uuid.UUID) -> str:
+        """Access token, carrying the user's permission claims when ACCESS_TOKEN_PERMISSION_CLAIMS is on."""
+        if not settings.ACCESS_TOKEN_PERMISSION_CLAIMS:
+            return create_access_token(user_id)
+        principal = await load_principal(self.session, user_id)
+        if not principal:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        return create_access_token(
+            user_id, permissions=principal.permissions, authz_version=principal.version
+        )
+
     async def create_and_store_refresh_token(
-        self, user: User, revoke_old: bool = False
+        self, user_id: uuid.UUID, revoke_old: bool = False
     ) -> str:
         """
         revoke_old: if True, old refresh tokens are revoked (single-session)
+        Commits together with anything already pending on the session.
         """
         if revoke_old:
-            result = await self.session.exec(
-                select(RefreshToken).where(
-                    RefreshToken.user_id == user.id, RefreshToken.revoked == False
-                )
+            await self.session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
+                .values(revoked=True)
             )
-            for old_token in result.all():
-                old_token.revoked = True
 
-        token_str = create_refresh_token(user.id)
+        jti = str(uuid.uuid4())
+        token_str = create_refresh_token(user_id, jti=jti)
         expires_at = datetime.now(timezone.utc) + timedelta(days=7)
         refresh_token = RefreshToken(
-            user_id=user.id, token=token_str, expires_at=expires_at
+            user_id=user_id, jti_hash=hash_jti(jti), expires_at=expires_at
         )
         try:
             self.session.add(refresh_token)
@@ -121,11 +144,45 @@ class AuthService:
             raise HTTPException(status_code=500, detail="DB Error: cannot store refresh token")
         return token_str
 
-    async def revoke_refresh_token(self, token_str: str):
+    async def rotate_refresh_token(self, token_str: str, user_id: uuid.UUID) -> str:
+        """
+        Revoke a live refresh token and issue its replacement in one
+        transaction. The conditional UPDATE lets exactly one of several
+        concurrent refreshes with the same token succeed.
+        """
+        jti = refresh_token_jti(token_str)
+        if not jti:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.jti_hash == hash_jti(jti),
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked == False,
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(revoked=True)
+            .returning(RefreshToken.user_id)
+        )
+        if result.scalar_one_or_none() is None:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired or revoked"
+            )
+        return await self.create_and_store_refresh_token(user_id)
+
+    async def _find_refresh_token(self, token_str: str) -> RefreshToken | None:
+        jti = refresh_token_jti(token_str)
+        if not jti:
+            return None
         result = await self.session.exec(
-            select(RefreshToken).where(RefreshToken.token == token_str)
+            select(RefreshToken).where(RefreshToken.jti_hash == hash_jti(jti))
         )
-        db_token = result.one_or_none()
+        return result.one_or_none()
+
+    async def revoke_refresh_token(self, token_str: str):
+        db_token = await self._find_refresh_token(token_str)
         if db_token:
             db_token.revoked = True
             try:
@@ -138,10 +195,7 @@ class AuthService:
         """
         Revoke a specific refresh token (logout from one session)
         """
-        result = await self.session.exec(
-            select(RefreshToken).where(RefreshToken.token == token_str)
-        )
-        db_token = result.one_or_none()
+        db_token = await self._find_refresh_token(token_str)
         if not db_token:
             raise HTTPException(status_code=404, detail="Refresh token not found")
         db_token.revoked = True
@@ -2,6 +2,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
 from app.models.authorization import Role, Permission
+from app.services.authz_cache import bump_authz_version, permission_cache
 import uuid
 from typing import List, Optional
 
@@ -31,7 +32,9 @@ class RoleService:
     async def update_role(self, role: Role, new_name: str) -> Role:
         role.name = new_name
         self.session.add(role)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
         await self.session.refresh(role)
         return role
 
@@ -40,7 +43,9 @@ class RoleService:
         if not role:
             return False
         await self.session.delete(role)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
         return True
 
     async def assign_permissions(self, role_id: uuid.UUID, permission_ids: List[uuid.UUID]) -> Role:
@@ -53,7 +58,9 @@ class RoleService:
 
         role.permissions = permissions
         self.session.add(role)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
         await self.session.refresh(role)
         return role
 
@@ -82,7 +89,9 @@ class PermissionService:
     async def update_permission(self, permission: Permission, new_name: str) -> Permission:
         permission.name = new_name
         self.session.add(permission)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
         await self.session.refresh(permission)
         return permission
 
@@ -91,5 +100,7 @@ class PermissionService:
         if not permission:
             return False
         await self.session.delete(permission)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
         return True
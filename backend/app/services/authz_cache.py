@@ -0,0 +1,149 @@
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.authorization import Role
+from app.models.users import User
+from app.schemas.users import UserRead
+
+settings = get_settings()
+
+READ_VERSION_SQL = text("SELECT version FROM authz_state WHERE id = 1")
+
+# Runs inside the transaction that changes roles or permissions
+BUMP_VERSION_SQL = text(
+    """
+    INSERT INTO authz_state (id, version) VALUES (1, 1)
+    ON CONFLICT (id) DO UPDATE SET version = authz_state.version + 1, updated_at = now()
+    RETURNING version
+    """
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    user: UserRead
+    permissions: frozenset[str]
+    # authz version read before the user was loaded
+    version: int
+
+
+def permission_codes(user) -> frozenset[str]:
+    """"module:name" codes granted to a user through any of their roles."""
+    return frozenset(f"{perm.module}:{perm.name}" for role in user.roles for perm in role.permissions)
+
+
+class PermissionCache:
+    """
+    Per-worker LRU of principals keyed by user id.
+
+    Entries are tagged with the authz version read before the user was
+    loaded and are served only while that version is current. The version
+    itself is re-read from authz_state at most every version_check_seconds,
+    so a warm cache answers authenticated requests without any query.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int, version_check_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version_check_seconds = version_check_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[float, Principal]] = OrderedDict()
+        self._version: int | None = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.version_reads = 0
+
+    async def current_version(self, session: AsyncSession) -> int:
+        if self._version is None or time.monotonic() - self._checked_at >= self.version_check_seconds:
+            result = await session.execute(READ_VERSION_SQL)
+            self.version_reads += 1
+            self.advance(result.scalar_one_or_none() or 0)
+        return self._version
+
+    def advance(self, version: int):
+        """Record a version seen in the database; older entries stop being served."""
+        if self._version is None or version > self._version:
+            self._version = version
+        self._checked_at = time.monotonic()
+
+    def get(self, user_id: uuid.UUID, version: int) -> Principal | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic() or entry[1].version != version:
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user_id: uuid.UUID, principal: Principal):
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, user_id: uuid.UUID):
+        """Drop one user's entry so the next request reloads it."""
+        self._entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "version": self._version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "version_reads": self.version_reads,
+            "entries": len(self._entries),
+        }
+
+
+permission_cache = PermissionCache(
+    ttl_seconds=settings.AUTHZ_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTHZ_CACHE_MAX_ENTRIES,
+    version_check_seconds=settings.AUTHZ_VERSION_CHECK_SECONDS,
+)
+
+
+async def bump_authz_version(session: AsyncSession) -> int:
+    """
+    Increment the authz version as part of the caller's transaction. Pass
+    the result to `permission_cache.advance` once the transaction commits.
+    """
+    result = await session.execute(BUMP_VERSION_SQL)
+    return result.scalar_one()
+
+
+async def load_principal(session: AsyncSession, user_id: uuid.UUID) -> Principal | None:
+    """The user's principal from the permission cache, loading it on a miss."""
+    # Read the version before loading so a concurrent change invalidates this entry
+    version = await permission_cache.current_version(session)
+    principal = permission_cache.get(user_id, version)
+    if principal:
+        return principal
+
+    result = await session.exec(
+        select(User)
+        .where(User.id == user_id)
+        .options(selectinload(User.roles).selectinload(Role.permissions))
+    )
+    user = result.one_or_none()
+    if not user:
+        return None
+
+    principal = Principal(
+        user=UserRead.model_validate(user, from_attributes=True),
+        permissions=permission_codes(user),
+        version=version,
+    )
+    permission_cache.set(user_id, principal)
+    return principal
@@ -0,0 +1,194 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.conversation import ChatConversation
+from app.schemas.lead import LeadCreate
+
+settings = get_settings()
+
+
+def state_max_bytes() -> int:
+    """Per-conversation budget, large enough for a LEAD_MAX_LIMIT preview."""
+    return max(settings.CHAT_STATE_MAX_BYTES, settings.LEAD_MAX_LIMIT * settings.CHAT_STATE_BYTES_PER_LEAD)
+
+
+def serialize_state(state: dict, max_bytes: int) -> tuple[str, int]:
+    """
+    Encode a conversation state as JSON. Preview leads are dumped without
+    empty fields, and trailing preview rows are dropped until the payload
+    fits in max_bytes. Returns the payload and the number of rows dropped.
+    """
+    data = dict(state)
+    preview = [
+        lead.model_dump(exclude_none=True) if isinstance(lead, LeadCreate) else lead
+        for lead in state.get("preview", [])
+    ]
+    while True:
+        if "preview" in state:
+            data["preview"] = preview
+        encoded = json.dumps(data, separators=(",", ":"), default=str)
+        if len(encoded.encode()) <= max_bytes or not preview:
+            return encoded, len(state.get("preview", [])) - len(preview)
+        preview = preview[:-1]
+
+
+def deserialize_state(raw: str) -> dict:
+    data = json.loads(raw)
+    if "preview" in data:
+        data["preview"] = [LeadCreate(**lead) for lead in data["preview"]]
+    return data
+
+
+class ConversationStore(ABC):
+    """Backend for per-user /chat conversation state."""
+
+    def __init__(self, ttl_seconds: int, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @abstractmethod
+    async def load(self, user_id: str) -> dict | None:
+        ...
+
+    @abstractmethod
+    async def save(self, user_id: str, state: dict) -> int:
+        """Store the state; returns how many preview rows did not fit in max_bytes."""
+        ...
+
+    @abstractmethod
+    async def delete(self, user_id: str) -> None:
+        ...
+
+
+class InMemoryConversationStore(ConversationStore):
+    """
+    Per-process LRU store with TTL. State is kept serialized to bound memory:
+    least recently used conversations are evicted once there are more than
+    max_entries or their payloads add up to more than max_total_bytes.
+    """
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, max_entries: int, max_total_bytes: int):
+        super().__init__(ttl_seconds, max_bytes)
+        self.max_entries = max_entries
+        self.max_total_bytes = max_total_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def _remove(self, user_id: str):
+        entry = self._entries.pop(user_id, None)
+        if entry:
+            self.total_bytes -= len(entry[1])
+
+    async def load(self, user_id: str) -> dict | None:
+        entry = self._entries.get(user_id)
+        if not entry:
+            return None
+        expires_at, raw = entry
+        if expires_at < time.time():
+            self._remove(user_id)
+            return None
+        self._entries.move_to_end(user_id)
+        return deserialize_state(raw)
+
+    async def save(self, user_id: str, state: dict) -> int:
+        raw, dropped = serialize_state(state, self.max_bytes)
+        self._remove(user_id)
+        self._entries[user_id] = (time.time() + self.ttl_seconds, raw)
+        self.total_bytes += len(raw)
+        # The newest conversation is never evicted, even if it alone exceeds the cap
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_total_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+        return dropped
+
+    async def delete(self, user_id: str) -> None:
+        self._remove(user_id)
+
+
+class DatabaseConversationStore(ConversationStore):
+    """
+    Store backed by the chat_conversations table, shared by every worker
+    process and node that uses the same database.
+    """
+
+    PURGE_EVERY = 100
+    PURGE_BATCH = 500
+
+    def __init__(self, ttl_seconds: int, max_bytes: int):
+        super().__init__(ttl_seconds, max_bytes)
+        self._saves = 0
+
+    async def load(self, user_id: str) -> dict | None:
+        async with async_session() as session:
+            result = await session.exec(
+                select(ChatConversation.state).where(
+                    ChatConversation.user_id == user_id,
+                    ChatConversation.expires_at > datetime.now(timezone.utc),
+                )
+            )
+            raw = result.one_or_none()
+        return deserialize_state(raw) if raw else None
+
+    async def save(self, user_id: str, state: dict) -> int:
+        now = datetime.now(timezone.utc)
+        raw, dropped = serialize_state(state, self.max_bytes)
+        values = {
+            "user_id": user_id,
+            "state": raw,
+            "updated_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        stmt = insert(ChatConversation).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ChatConversation.user_id],
+            set_={k: stmt.excluded[k] for k in ("state", "updated_at", "expires_at")},
+        )
+        async with async_session() as session:
+            await session.execute(stmt)
+            self._saves += 1
+            if self._saves % self.PURGE_EVERY == 0:
+                await self._purge_expired(session, now)
+            await session.commit()
+        return dropped
+
+    async def delete(self, user_id: str) -> None:
+        async with async_session() as session:
+            await session.execute(delete(ChatConversation).where(ChatConversation.user_id == user_id))
+            await session.commit()
+
+    async def _purge_expired(self, session, now: datetime):
+        expired = (
+            select(ChatConversation.user_id)
+            .where(ChatConversation.expires_at < now)
+            .limit(self.PURGE_BATCH)
+        )
+        await session.execute(delete(ChatConversation).where(ChatConversation.user_id.in_(expired)))
+
+
+def build_conversation_store() -> ConversationStore:
+    if settings.CHAT_STATE_BACKEND == "database":
+        return DatabaseConversationStore(
+            ttl_seconds=settings.CHAT_STATE_TTL_SECONDS,
+            max_bytes=state_max_bytes(),
+        )
+    if settings.CHAT_STATE_BACKEND == "memory":
+        return InMemoryConversationStore(
+            ttl_seconds=settings.CHAT_STATE_TTL_SECONDS,
+            max_bytes=state_max_bytes(),
+            max_entries=settings.CHAT_STATE_MAX_ENTRIES,
+            max_total_bytes=settings.CHAT_STATE_MEMORY_MAX_BYTES,
+        )
+    raise ValueError(f"Unknown CHAT_STATE_BACKEND: {settings.CHAT_STATE_BACKEND}")
+
+
+conversation_store = build_conversation_store()
@@ -0,0 +1,134 @@
+import asyncio
+import hashlib
+import json
+import random
+from typing import AsyncIterator
+
+from app.services.lead_intent import extract_intent_rules
+from app.services.llm_client import LLMClient, LLMPrompt
+from app.utils.lead_wire import LEAD_WIRE_FIELDS
+
+_NAME_PARTS = [
+    "Apex", "Blue", "Cedar", "Delta", "Echo", "Falcon", "Granite", "Harbor", "Iris", "Juniper",
+    "Keystone", "Lumen", "Maple", "Nova", "Orbit", "Pioneer", "Quartz", "Ridge", "Summit", "Vertex",
+]
+_NAME_SUFFIXES = ["Labs", "Systems", "Group", "Partners", "Works", "Solutions", "Digital", "Holdings"]
+_ROLES = ["CEO", "CTO", "Head of Sales", "Founder", "COO", "VP Marketing"]
+_FIRST_NAMES = ["Alex", "Sam", "Priya", "Jonas", "Mei", "Omar", "Lena", "Diego", "Aisha", "Noah"]
+_LAST_NAMES = ["Berg", "Sharma", "Okafor", "Novak", "Chen", "Silva", "Keller", "Haddad", "Moreau", "Ito"]
+_CHARS_PER_TOKEN = 4
+
+
+class FakeLLMError(RuntimeError):
+    pass
+
+
+class LatencyDistribution:
+    """
+    Seconds sampled from a spec string:
+    "fixed:<ms>", "uniform:<min_ms>:<max_ms>", "exponential:<mean_ms>"
+    or "lognormal:<median_ms>:<sigma>".
+    """
+
+    def __init__(self, spec: str, rng: random.Random):
+        kind, *params = spec.split(":")
+        self.kind = kind
+        self.params = [float(p) for p in params]
+        self.rng = rng
+        if kind not in ("fixed", "uniform", "exponential", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+
+    def sample(self) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            ms = p[0]
+        elif self.kind == "uniform":
+            ms = self.rng.uniform(p[0], p[1])
+        elif self.kind == "exponential":
+            ms = self.rng.expovariate(1 / p[0])
+        else:
+            ms = self.rng.lognormvariate(0, p[1]) * p[0]
+        return max(ms, 0) / 1000
+
+
+class FakeLLMClient(LLMClient):
+    """
+    Offline stand-in for Gemini. Responses are a pure function of the
+    prompt inputs (synthetic leads in the prompt's wire format, or intent
+    JSON); latency, streaming speed and failures follow the configured
+    distribution, tokens-per-second and error rate from a seeded RNG.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        latency: str = "fixed:0",
+        tokens_per_second: float = 0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.model = model
+        self.rng = random.Random(f"{seed}:{model}")
+        self.latency = LatencyDistribution(latency, self.rng)
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+
+    # ---------- content ----------
+    def render(self, prompt: LLMPrompt, inputs: dict) -> str:
+        if "message" in inputs:
+            slots = extract_intent_rules(inputs["message"])
+            return json.dumps({slot: slots.get(slot) for slot in ("clients", "industry", "location")})
+
+        seed = hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+        rng = random.Random(seed)
+        leads = [self._lead(rng, inputs, i) for i in range(int(inputs.get("limit", 5)))]
+        if "tab-separated" in prompt.format(**inputs):
+            rows = ["\t".join(LEAD_WIRE_FIELDS)]
+            rows += ["\t".join(str(lead[f] or "") for f in LEAD_WIRE_FIELDS) for lead in leads]
+            return "\n".join(rows)
+        return json.dumps(leads)
+
+    @staticmethod
+    def _lead(rng: random.Random, inputs: dict, index: int) -> dict:
+        name = f"{rng.choice(_NAME_PARTS)} {rng.choice(_NAME_PARTS)} {rng.choice(_NAME_SUFFIXES)} {index + 1}"
+        domain = name.lower().replace(" ", "") + ".example.com"
+        person = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        return {
+            "business_name": name,
+            "industry": inputs.get("industry") or "Unknown",
+            "contact_person": person,
+            "designation": rng.choice(_ROLES),
+            "address": f"{rng.randint(1, 999)} Market Street, {inputs.get('location') or 'Unknown'}",
+            "country": inputs.get("location"),
+            "contact_number": f"+1-555-{rng.randint(1000, 9999)}",
+            "email": f"{person.split()[0].lower()}@{domain}",
+            "website": f"https://{domain}",
+            "summary": f"{inputs.get('clients') or 'Company'} serving the {inputs.get('industry')} market.",
+            "lead_score": rng.randint(1, 100),
+        }
+
+    # ---------- timing ----------
+    def _maybe_fail(self):
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise FakeLLMError(f"Injected failure from fake model {self.model}")
+
+    def _token_delay(self, chars: int) -> float:
+        if not self.tokens_per_second:
+            return 0
+        return chars / _CHARS_PER_TOKEN / self.tokens_per_second
+
+    async def generate(self, prompt: LLMPrompt, inputs: dict) -> str:
+        content = self.render(prompt, inputs)
+        await asyncio.sleep(self.latency.sample() + self._token_delay(len(content)))
+        self._maybe_fail()
+        return content
+
+    async def stream(self, prompt: LLMPrompt, inputs: dict) -> AsyncIterator[str]:
+        content = self.render(prompt, inputs)
+        await asyncio.sleep(self.latency.sample())
+        self._maybe_fail()
+        step = _CHARS_PER_TOKEN * 4
+        for start in range(0, len(content), step):
+            chunk = content[start:start + step]
+            await asyncio.sleep(self._token_delay(len(chunk)))
+            yield chunk
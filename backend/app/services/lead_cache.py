@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def _normalise(value) -> str:
+    return " ".join(str(value or "").lower().split())
+
+
+class LeadGenerationCache:
+    """
+    Two-tier cache for raw lead generation output.
+
+    The memory tier is an LRU bounded by max_entries; the optional SQLite
+    tier survives restarts and is trimmed back to disk_max_entries every
+    DISK_TRIM_EVERY writes. Both tiers expire entries after ttl_seconds.
+    """
+
+    DISK_TRIM_EVERY = 100
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_entries: int,
+        sqlite_path: str | None = None,
+        disk_max_entries: int = 100_000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.sqlite_path = sqlite_path
+        self.disk_max_entries = disk_max_entries
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._disk_writes = 0
+        if sqlite_path:
+            self._init_disk()
+
+    @staticmethod
+    def make_key(
+        clients: str, industry: str, location: str, limit: int, model: str, variant: str = ""
+    ) -> str:
+        """Build a key that ignores case and whitespace differences in the prompt inputs."""
+        payload = json.dumps(
+            [_normalise(clients), _normalise(industry), _normalise(location), int(limit), model, _normalise(variant)]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ---------- memory tier ----------
+    def _memory_get(self, key: str) -> str | None:
+        entry = self._memory.get(key)
+        if not entry:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: str, expires_at: float):
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ---------- disk tier ----------
+    def _connect(self):
+        """Connection closed on exit; `with conn:` inside it commits the transaction."""
+        return closing(sqlite3.connect(self.sqlite_path, timeout=5))
+
+    def _init_disk(self):
+        with self._connect() as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lead_generation_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_lead_generation_cache_last_access "
+                "ON lead_generation_cache (last_access)"
+            )
+
+    def _disk_get(self, key: str) -> tuple[float, str] | None:
+        now = time.time()
+        with self._connect() as conn, conn:
+            row = conn.execute(
+                "SELECT expires_at, value FROM lead_generation_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            if row[0] < now:
+                conn.execute("DELETE FROM lead_generation_cache WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE lead_generation_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            return row[0], row[1]
+
+    def _disk_set(self, key: str, value: str, expires_at: float):
+        now = time.time()
+        self._disk_writes += 1
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO lead_generation_cache (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            if self._disk_writes % self.DISK_TRIM_EVERY == 0:
+                self._disk_trim(conn, now)
+
+    def _disk_trim(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then the least recently used beyond disk_max_entries."""
+        conn.execute("DELETE FROM lead_generation_cache WHERE expires_at < ?", (now,))
+        conn.execute(
+            """
+            DELETE FROM lead_generation_cache WHERE key IN (
+                SELECT key FROM lead_generation_cache
+                ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.disk_max_entries,),
+        )
+
+    # ---------- public API ----------
+    async def get(self, key: str) -> str | None:
+        value = self._memory_get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.sqlite_path:
+            entry = await asyncio.to_thread(self._disk_get, key)
+            if entry:
+                expires_at, value = entry
+                self._memory_set(key, value, expires_at)
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str):
+        expires_at = time.time() + self.ttl_seconds
+        self._memory_set(key, value, expires_at)
+        if self.sqlite_path:
+            await asyncio.to_thread(self._disk_set, key, value, expires_at)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+
+lead_cache = LeadGenerationCache(
+    ttl_seconds=settings.LEAD_CACHE_TTL_SECONDS,
+    max_entries=settings.LEAD_CACHE_MAX_ENTRIES,
+    sqlite_path=settings.LEAD_CACHE_SQLITE_PATH,
+    disk_max_entries=settings.LEAD_CACHE_DISK_MAX_ENTRIES,
+)
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+import uuid
+
+from sqlalchemy import Boolean, DateTime, Integer
+from sqlmodel import select
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.schemas.lead import LeadFilter
+from app.services.lead_query import LEAD_COLUMNS, SORT_KEY, apply_lead_filters
+
+settings = get_settings()
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+async def _iter_batches(filters: LeadFilter, fields: list[str]):
+    """
+    Yield lists of row mappings from a server-side cursor, LEAD_EXPORT_BATCH_SIZE
+    rows at a time. The export uses its own session because it outlives the
+    request handler.
+    """
+    stmt = apply_lead_filters(select(*[LEAD_COLUMNS[f] for f in fields]), filters)
+    stmt = stmt.order_by(*[LEAD_COLUMNS[c].desc() for c in SORT_KEY])
+    stmt = stmt.execution_options(yield_per=settings.LEAD_EXPORT_BATCH_SIZE)
+
+    async with async_session() as session:
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield partition
+
+
+async def export_csv(filters: LeadFilter, fields: list[str]):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for batch in _iter_batches(filters, fields):
+        writer.writerows([row[f] for f in fields] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def export_ndjson(filters: LeadFilter, fields: list[str]):
+    async for batch in _iter_batches(filters, fields):
+        yield "".join(json.dumps(dict(row), default=str) + "\n" for row in batch)
+
+
+class _ChunkSink:
+    """Write-only file object that hands Parquet bytes back as they are produced."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(pa, fields: list[str]):
+    def arrow_type(column):
+        if isinstance(column.type, Integer):
+            return pa.int64()
+        if isinstance(column.type, Boolean):
+            return pa.bool_()
+        if isinstance(column.type, DateTime):
+            return pa.timestamp("us", tz="UTC")
+        return pa.string()
+
+    return pa.schema([(f, arrow_type(LEAD_COLUMNS[f])) for f in fields])
+
+
+async def export_parquet(filters: LeadFilter, fields: list[str]):
+    """Write one Parquet row group per cursor batch and stream it out."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(pa, fields)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for batch in _iter_batches(filters, fields):
+            rows = [
+                {f: str(v) if isinstance(v, uuid.UUID) else v for f, v in row.items()}
+                for row in batch
+            ]
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+EXPORTERS = {
+    "csv": export_csv,
+    "ndjson": export_ndjson,
+    "parquet": export_parquet,
+}
@@ -0,0 +1,266 @@
+import asyncio
+import csv
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import or_, text, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.lead_import import LeadImportJob
+from app.schemas.lead import LeadCreate
+from app.services.lead_persistence import UPSERT_UPDATE_COLUMNS, lead_row
+from app.services.lead_resolution import match_existing_sql, use_match_threshold
+from app.utils.lead_normalize import LeadDeduplicator
+
+settings = get_settings()
+
+IMPORT_FORMATS = ("csv", "ndjson")
+STAGING_COLUMNS = [
+    "row_no", "id", "business_name", "industry", "contact_person", "designation",
+    "address", "country", "contact_number", "email", "website", "summary",
+    "lead_score", "verified", "domain_key", "name_key", "created_at", "updated_at",
+]
+LEAD_COLUMNS = STAGING_COLUMNS[1:]
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE leads_import_staging (
+    row_no BIGINT NOT NULL,
+    id UUID NOT NULL,
+    business_name TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    contact_person TEXT,
+    designation TEXT,
+    address TEXT,
+    country TEXT,
+    contact_number TEXT,
+    email TEXT,
+    website TEXT,
+    summary TEXT,
+    lead_score INTEGER NOT NULL,
+    verified BOOLEAN NOT NULL,
+    domain_key TEXT,
+    name_key TEXT,
+    created_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL,
+    match_id UUID
+) ON COMMIT DROP
+"""
+
+# Point staged rows at the stored lead for the same company, if any
+RESOLVE_STAGING_SQL = f"""
+UPDATE leads_import_staging s SET match_id = {match_existing_sql("s")}
+WHERE s.domain_key IS NOT NULL OR s.name_key IS NOT NULL
+"""
+
+# Resolved rows refresh their match, keeping stored values the import lacks
+MERGE_MATCHED_SQL = f"""
+WITH merged AS (
+    UPDATE leads SET
+        {", ".join(f"{col} = coalesce(s.{col}, leads.{col})" for col in UPSERT_UPDATE_COLUMNS)},
+        updated_at = now()
+    FROM (
+        SELECT DISTINCT ON (match_id) * FROM leads_import_staging
+        WHERE match_id IS NOT NULL
+        ORDER BY match_id, row_no DESC
+    ) s
+    WHERE leads.id = s.match_id
+    RETURNING leads.id
+)
+SELECT count(*) FROM merged
+"""
+
+# Keep the last occurrence of each email in the batch; rows without email are never merged
+MERGE_SQL = f"""
+WITH merged AS (
+    INSERT INTO leads ({", ".join(LEAD_COLUMNS)})
+    SELECT {", ".join(LEAD_COLUMNS)} FROM (
+        SELECT DISTINCT ON (coalesce(email, id::text)) *
+        FROM leads_import_staging
+        WHERE match_id IS NULL
+        ORDER BY coalesce(email, id::text), row_no DESC
+    ) deduped
+    ON CONFLICT (email) DO UPDATE SET
+        {", ".join(f"{col} = excluded.{col}" for col in UPSERT_UPDATE_COLUMNS)},
+        updated_at = now()
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted) AS inserted,
+    count(*) FILTER (WHERE NOT inserted) AS updated
+FROM merged
+"""
+
+
+def _open_rows(path: str, fmt: str):
+    """Yield raw row dicts from the source file one at a time."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield {k: (v if v != "" else None) for k, v in row.items() if k}
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield {"__error__": f"Invalid JSON: {e}"}
+
+
+def _validate_batch(raw_rows: list[tuple[int, dict]]):
+    """
+    Split a batch into COPY records and rejected rows. Of several rows for
+    the same company (email, domain or canonical name) only the last is kept.
+    """
+    records, rejects = [], []
+    dedup = LeadDeduplicator()
+    for row_no, raw in reversed(raw_rows):
+        if "__error__" in raw:
+            rejects.append({"row": row_no, "error": raw["__error__"]})
+            continue
+        try:
+            lead = LeadCreate.model_validate(raw)
+        except ValidationError as e:
+            rejects.append({"row": row_no, "error": e.errors(include_url=False), "data": raw})
+            continue
+        if not dedup.add(lead):
+            continue
+        row = lead_row(lead)
+        records.append(tuple([row_no, *[row[col] for col in LEAD_COLUMNS]]))
+    records.reverse()
+    rejects.reverse()
+    return records, rejects
+
+
+async def _load_batch(session: AsyncSession, records: list[tuple]) -> tuple[int, int]:
+    """
+    COPY a batch into a temp staging table, resolve it against stored leads
+    and merge it into leads. Returns (inserted, updated) counts.
+    """
+    await session.execute(text(CREATE_STAGING_SQL))
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "leads_import_staging", records=records, columns=STAGING_COLUMNS
+    )
+    await use_match_threshold(session)
+    await session.execute(text(RESOLVE_STAGING_SQL))
+    result = await session.execute(text(MERGE_MATCHED_SQL))
+    merged = result.scalar_one()
+    result = await session.execute(text(MERGE_SQL))
+    counts = result.one()
+    return counts.inserted, counts.updated + merged
+
+
+async def create_import_job(
+    session: AsyncSession, filename: str, fmt: str, source_path: str, job_id: uuid.UUID | None = None
+) -> LeadImportJob:
+    job_id = job_id or uuid.uuid4()
+    job = LeadImportJob(
+        id=job_id,
+        filename=filename,
+        format=fmt,
+        source_path=source_path,
+        rejects_path=os.path.join(settings.LEAD_IMPORT_DIR, f"{job_id}.rejects.ndjson"),
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
+
+async def claim_import_for_resume(session: AsyncSession, job_id: uuid.UUID) -> bool:
+    """
+    Mark a job as being resumed if it is pending, failed, or running without
+    progress for LEAD_IMPORT_STALE_SECONDS (its worker died). The conditional
+    update lets only one of several concurrent resume requests win.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.LEAD_IMPORT_STALE_SECONDS)
+    result = await session.execute(
+        update(LeadImportJob)
+        .where(
+            LeadImportJob.id == job_id,
+            or_(
+                LeadImportJob.status.in_(("pending", "failed")),
+                (LeadImportJob.status == "running") & (LeadImportJob.updated_at < stale_before),
+            ),
+        )
+        .values(status="running", error=None, updated_at=datetime.now(timezone.utc))
+        .returning(LeadImportJob.id)
+    )
+    claimed = result.scalar_one_or_none() is not None
+    await session.commit()
+    return claimed
+
+
+async def save_upload(upload: UploadFile, fmt: str, job_id: uuid.UUID) -> str:
+    """Spool an uploaded file to LEAD_IMPORT_DIR in fixed-size chunks."""
+    os.makedirs(settings.LEAD_IMPORT_DIR, exist_ok=True)
+    path = os.path.join(settings.LEAD_IMPORT_DIR, f"{job_id}.{fmt}")
+    with open(path, "wb") as out:
+        while chunk := await upload.read(1024 * 1024):
+            await asyncio.to_thread(out.write, chunk)
+    return path
+
+
+async def run_import(job_id: uuid.UUID):
+    """
+    Process an import job from its last committed row. Each batch is copied,
+    merged and recorded on the job in a single transaction, so a crashed or
+    failed job can be resumed by calling this again.
+    """
+    batch_size = settings.LEAD_IMPORT_BATCH_SIZE
+
+    async with async_session() as session:
+        job = await session.get(LeadImportJob, job_id)
+        if not job or job.status == "completed":
+            return
+        job.status = "running"
+        job.error = None
+        await session.commit()
+
+        try:
+            rows = enumerate(_open_rows(job.source_path, job.format), start=1)
+            await asyncio.to_thread(lambda: next(islice(rows, job.rows_processed, job.rows_processed), None))
+            os.makedirs(os.path.dirname(job.rejects_path) or ".", exist_ok=True)
+
+            while True:
+                batch = await asyncio.to_thread(lambda: list(islice(rows, batch_size)))
+                if not batch:
+                    break
+                records, rejects = await asyncio.to_thread(_validate_batch, batch)
+
+                inserted = updated = 0
+                if records:
+                    inserted, updated = await _load_batch(session, records)
+                job.rows_processed += len(batch)
+                job.rows_inserted += inserted
+                job.rows_updated += updated
+                job.rows_skipped += len(batch) - len(rejects) - inserted - updated
+                job.rows_rejected += len(rejects)
+                session.add(job)
+                await session.commit()
+
+                if rejects:
+                    with open(job.rejects_path, "a", encoding="utf-8") as f:
+                        f.writelines(json.dumps(r, default=str) + "\n" for r in rejects)
+                print(f"[Import {job.id}] {job.rows_processed} rows processed")
+
+            job.status = "completed"
+            session.add(job)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            job = await session.get(LeadImportJob, job_id)
+            job.status = "failed"
+            job.error = str(e)
+            session.add(job)
+            await session.commit()
+            print(f"[Error] Import {job_id} failed: {e}")
@@ -0,0 +1,137 @@
+import json
+import re
+
+from app.services.llm_client import LLMPrompt
+
+INTENT_SLOTS = ("clients", "industry", "location")
+
+# Canonical industry names keyed by how people write them
+INDUSTRIES = {
+    "fintech": "Fintech",
+    "saas": "SaaS",
+    "software": "Software",
+    "it services": "IT Services",
+    "cybersecurity": "Cybersecurity",
+    "healthcare": "Healthcare",
+    "healthtech": "Healthtech",
+    "health tech": "Healthtech",
+    "biotech": "Biotech",
+    "pharma": "Pharmaceuticals",
+    "pharmaceutical": "Pharmaceuticals",
+    "edtech": "Edtech",
+    "education": "Education",
+    "e-commerce": "E-commerce",
+    "ecommerce": "E-commerce",
+    "retail": "Retail",
+    "real estate": "Real Estate",
+    "proptech": "Proptech",
+    "construction": "Construction",
+    "logistics": "Logistics",
+    "manufacturing": "Manufacturing",
+    "automotive": "Automotive",
+    "agriculture": "Agriculture",
+    "agritech": "Agritech",
+    "energy": "Energy",
+    "renewable energy": "Renewable Energy",
+    "telecom": "Telecommunications",
+    "insurance": "Insurance",
+    "insurtech": "Insurtech",
+    "banking": "Banking",
+    "finance": "Finance",
+    "hospitality": "Hospitality",
+    "travel": "Travel",
+    "food and beverage": "Food & Beverage",
+    "media": "Media",
+    "marketing": "Marketing",
+    "advertising": "Advertising",
+    "legal": "Legal",
+    "consulting": "Consulting",
+    "gaming": "Gaming",
+}
+CLIENT_NOUNS = (
+    "startups", "companies", "businesses", "firms", "agencies", "enterprises", "smes", "smbs",
+    "manufacturers", "retailers", "distributors", "suppliers", "providers", "vendors", "brands",
+    "stores", "shops", "clinics", "hospitals", "practices", "labs", "restaurants", "hotels",
+    "schools", "universities", "banks", "studios", "developers", "organizations",
+    "organisations", "nonprofits",
+)
+_FILLER_WORDS = {
+    "i", "we", "me", "us", "find", "get", "show", "give", "list", "need", "want", "looking",
+    "look", "for", "some", "any", "leads", "lead", "of", "the", "a", "an", "to", "target",
+    "targeting", "please", "can", "you", "generate", "search", "with", "on", "at", "are", "is",
+}
+
+_INDUSTRY_RE = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, INDUSTRIES), key=len, reverse=True)) + r")\b", re.I
+)
+_SECTOR_RE = re.compile(r"\b(?:in|from) the ([\w&\- ]+?) (?:industry|sector|space|vertical|market)\b", re.I)
+_CLIENTS_RE = re.compile(r"\b(" + "|".join(CLIENT_NOUNS) + r")\b", re.I)
+# Locations are proper nouns after a preposition: "in Berlin", "based in New York, USA".
+# The preposition may start the sentence; the name stops at a lowercase word or "I".
+_PLACE_WORD = r"(?!I\b)[A-Z][\w.'\-]*"
+_LOCATION_RE = re.compile(
+    r"\b(?i:in|based in|located in|from|near|around|across|within)\s+(?i:the\s+)?"
+    r"(" + _PLACE_WORD + r"(?:(?:\s+|,\s*)" + _PLACE_WORD + r")*)"
+)
+_WORD_RE = re.compile(r"[\w&\-]+")
+
+
+def _extract_clients(message: str) -> str | None:
+    match = _CLIENTS_RE.search(message)
+    if not match:
+        return None
+    words = _WORD_RE.findall(message[:match.start()])[-3:]
+    while words and words[0].lower() in _FILLER_WORDS:
+        words.pop(0)
+    return " ".join([*words, match.group(1)])
+
+
+def extract_intent_rules(message: str) -> dict[str, str]:
+    """
+    Pull whichever of clients, industry and location a free-text message
+    states outright, e.g. "fintech startups in Berlin". Missing slots are
+    simply absent from the result.
+    """
+    message = " ".join((message or "").split())
+    slots = {}
+
+    sector = _SECTOR_RE.search(message)
+    industry = _INDUSTRY_RE.search(message)
+    if sector:
+        slots["industry"] = INDUSTRIES.get(sector.group(1).lower(), sector.group(1).strip().title())
+    elif industry:
+        slots["industry"] = INDUSTRIES[industry.group(1).lower()]
+
+    # Place names are not part of the client description ("In Germany I want banks")
+    clients = _extract_clients(_LOCATION_RE.sub(" ", message))
+    if clients:
+        slots["clients"] = clients
+
+    locations = [m.group(1) for m in _LOCATION_RE.finditer(message)]
+    if locations:
+        slots["location"] = locations[-1].rstrip(".,")
+    return slots
+
+
+intent_prompt = LLMPrompt(
+    """
+    Extract the lead search target from the message below.
+    Reply with a JSON object with the keys "clients", "industry" and "location".
+    Use null for anything the message does not state. Do not guess.
+
+    Message: {message}
+    """
+)
+
+
+def parse_intent(content: str) -> dict[str, str]:
+    """Read the intent JSON returned by the LLM, keeping only filled slots."""
+    cleaned_content = content.strip().replace("```json", "").replace("```", "")
+    data = json.loads(cleaned_content)
+    if not isinstance(data, dict):
+        return {}
+    return {
+        slot: str(data[slot]).strip()
+        for slot in INTENT_SLOTS
+        if data.get(slot) and str(data[slot]).strip()
+    }
@@ -0,0 +1,187 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, text, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.lead_job import LeadGenerationJob
+
+settings = get_settings()
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# Oldest queued job, preferring users with the fewest jobs already running
+CLAIM_JOB_SQL = text(
+    """
+    UPDATE lead_generation_jobs SET status = 'running', started_at = now()
+    WHERE id = (
+        SELECT j.id FROM lead_generation_jobs j
+        WHERE j.status = 'queued'
+        ORDER BY (
+            SELECT count(*) FROM lead_generation_jobs r
+            WHERE r.user_id = j.user_id AND r.status = 'running'
+        ), j.created_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id
+    """
+)
+
+
+async def submit_job(
+    session: AsyncSession, user_id: str, params: dict, job_id: uuid.UUID | None = None
+) -> LeadGenerationJob:
+    """
+    Persist a queued lead generation job. Rejects the job when the user
+    already has LEAD_JOB_MAX_PER_USER active jobs or the global queue holds
+    LEAD_JOB_MAX_QUEUED jobs.
+    """
+    result = await session.exec(
+        select(func.count()).where(
+            LeadGenerationJob.user_id == user_id,
+            LeadGenerationJob.status.in_(ACTIVE_STATUSES),
+        )
+    )
+    if result.one() >= settings.LEAD_JOB_MAX_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many lead generation jobs in progress",
+        )
+
+    result = await session.exec(select(func.count()).where(LeadGenerationJob.status == "queued"))
+    if result.one() >= settings.LEAD_JOB_MAX_QUEUED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Lead generation queue is full, try again later",
+        )
+
+    job = LeadGenerationJob(id=job_id or uuid.uuid4(), user_id=user_id, params=params)
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    worker_pool.notify()
+    return job
+
+
+async def get_job(session: AsyncSession, job_id: uuid.UUID) -> LeadGenerationJob | None:
+    return await session.get(LeadGenerationJob, job_id)
+
+
+async def claim_next_job() -> uuid.UUID | None:
+    async with async_session() as session:
+        result = await session.execute(CLAIM_JOB_SQL)
+        job_id = result.scalar_one_or_none()
+        await session.commit()
+        return job_id
+
+
+async def finish_job(job_id: uuid.UUID, result: dict | None = None, error: str | None = None):
+    async with async_session() as session:
+        await session.execute(
+            update(LeadGenerationJob)
+            .where(LeadGenerationJob.id == job_id)
+            .values(
+                status="failed" if error else "done",
+                result=result,
+                error=error,
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await session.commit()
+
+
+async def requeue_stale_jobs(older_than: timedelta) -> int:
+    """Put back jobs left running by a worker that died."""
+    async with async_session() as session:
+        result = await session.execute(
+            update(LeadGenerationJob)
+            .where(
+                LeadGenerationJob.status == "running",
+                LeadGenerationJob.started_at < datetime.now(timezone.utc) - older_than,
+            )
+            .values(status="queued", started_at=None)
+        )
+        await session.commit()
+        return result.rowcount
+
+
+class LeadJobWorkerPool:
+    """
+    Asyncio workers that claim queued jobs from lead_generation_jobs.
+    Claims use SKIP LOCKED, so any number of API processes and standalone
+    workers can share one queue.
+    """
+
+    def __init__(self, concurrency: int, poll_interval: float, requeue_interval: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.requeue_interval = requeue_interval
+        self._handler: Callable[[uuid.UUID], Awaitable[None]] | None = None
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def notify(self):
+        self._wakeup.set()
+
+    async def start(self, handler: Callable[[uuid.UUID], Awaitable[None]]):
+        self._handler = handler
+        await self._requeue_stale()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._requeue_loop()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _requeue_stale(self):
+        requeued = await requeue_stale_jobs(timedelta(seconds=settings.LEAD_JOB_STALE_SECONDS))
+        if requeued:
+            print(f"[Jobs] Requeued {requeued} stale lead generation jobs")
+            self.notify()
+
+    async def _requeue_loop(self):
+        """Keep putting back jobs orphaned by workers that die while this pool runs."""
+        while True:
+            await asyncio.sleep(self.requeue_interval)
+            try:
+                await self._requeue_stale()
+            except Exception as e:
+                print(f"[Error] Failed to requeue stale lead generation jobs: {e}")
+
+    async def _worker(self):
+        while True:
+            try:
+                job_id = await claim_next_job()
+            except Exception as e:
+                print(f"[Error] Failed to claim lead generation job: {e}")
+                job_id = None
+
+            if job_id is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            try:
+                await self._handler(job_id)
+            except Exception as e:
+                print(f"[Error] Lead generation job {job_id} failed: {e}")
+                await finish_job(job_id, error=str(e))
+
+
+worker_pool = LeadJobWorkerPool(
+    concurrency=settings.LEAD_JOB_WORKERS,
+    poll_interval=settings.LEAD_JOB_POLL_INTERVAL_SECONDS,
+    requeue_interval=settings.LEAD_JOB_REQUEUE_INTERVAL_SECONDS,
+)
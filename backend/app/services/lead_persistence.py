@@ -0,0 +1,143 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, func, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.lead import Lead
+from app.schemas.lead import LeadCreate
+from app.services.lead_resolution import resolve_existing
+from app.utils.lead_normalize import LeadDeduplicator, resolution_keys
+
+settings = get_settings()
+
+# Columns refreshed when an incoming lead collides with an existing email
+UPSERT_UPDATE_COLUMNS = [
+    "business_name", "industry", "contact_person", "designation", "address",
+    "country", "contact_number", "website", "summary", "lead_score",
+    "domain_key", "name_key",
+]
+# Refresh a lead resolved as the same company, keeping stored values the incoming lead lacks
+_leads = Lead.__table__
+MERGE_INTO_EXISTING = (
+    update(_leads)
+    .where(_leads.c.id == bindparam("match_id"))
+    .values(
+        {
+            **{
+                col: func.coalesce(bindparam(f"new_{col}", type_=_leads.c[col].type), _leads.c[col])
+                for col in UPSERT_UPDATE_COLUMNS
+            },
+            "updated_at": func.now(),
+        }
+    )
+)
+
+
+def lead_row(lead: LeadCreate) -> dict:
+    """Map a LeadCreate onto a `leads` row for Core inserts."""
+    now = datetime.now(timezone.utc)
+    domain_key, name_key = resolution_keys(lead)
+    return {
+        "id": uuid.uuid4(),
+        "business_name": lead.business_name,
+        "industry": lead.industry or "Unknown",
+        "contact_person": lead.contact_person,
+        "designation": lead.designation,
+        "address": lead.address,
+        "country": lead.country,
+        "contact_number": lead.contact_number,
+        "email": lead.email,
+        "website": lead.website,
+        "summary": lead.summary,
+        "lead_score": lead.lead_score or 0,
+        "verified": bool(lead.verified),
+        "domain_key": domain_key,
+        "name_key": name_key,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def bulk_upsert_leads(
+    db: AsyncSession,
+    leads: list[LeadCreate],
+    on_conflict: str = "update",
+    chunk_size: int | None = None,
+) -> list[str]:
+    """
+    Persist leads with one INSERT ... ON CONFLICT (email) ... RETURNING per chunk.
+
+    Each chunk is first resolved against stored leads by domain and canonical
+    name; matches are merged into the existing row instead of inserted.
+    on_conflict: "update" refreshes the existing row, "ignore" leaves it untouched.
+    Returns one outcome per input lead: "inserted", "updated", "merged" or "skipped".
+    Leads repeating a company already seen in the same batch are skipped.
+    """
+    if on_conflict not in ("update", "ignore"):
+        raise ValueError(f"Unknown on_conflict mode: {on_conflict}")
+    chunk_size = chunk_size or settings.LEAD_BULK_CHUNK_SIZE
+
+    outcomes = ["skipped"] * len(leads)
+    dedup = LeadDeduplicator()
+    pending = [(index, lead_row(lead)) for index, lead in enumerate(leads) if dedup.add(lead)]
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        matches = await resolve_existing(db, [row for _, row in chunk])
+        if matches and on_conflict == "update":
+            await db.execute(
+                MERGE_INTO_EXISTING,
+                [
+                    {"match_id": matches[i], **{f"new_{col}": row[col] for col in UPSERT_UPDATE_COLUMNS}}
+                    for i, (_, row) in enumerate(chunk) if i in matches
+                ],
+            )
+        for i, (index, _) in enumerate(chunk):
+            if i in matches:
+                outcomes[index] = "merged" if on_conflict == "update" else "skipped"
+        chunk = [item for i, item in enumerate(chunk) if i not in matches]
+        if not chunk:
+            continue
+
+        stmt = insert(Lead).values([row for _, row in chunk])
+        if on_conflict == "update":
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    **{col: stmt.excluded[col] for col in UPSERT_UPDATE_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["email"])
+        # xmax is 0 only for freshly inserted tuples
+        stmt = stmt.returning(Lead.email, literal_column("(xmax = 0)").label("inserted"))
+
+        result = await db.execute(stmt)
+        returned = {row.email: row.inserted for row in result.all() if row.email is not None}
+
+        for index, row in chunk:
+            if row["email"] is None:
+                outcomes[index] = "inserted"
+            elif row["email"] in returned:
+                outcomes[index] = "inserted" if returned[row["email"]] else "updated"
+
+    await db.commit()
+    return outcomes
+
+
+def summarize_outcomes(leads: list[LeadCreate], outcomes: list[str]) -> dict:
+    return {
+        "inserted": outcomes.count("inserted"),
+        "updated": outcomes.count("updated"),
+        "merged": outcomes.count("merged"),
+        "skipped": outcomes.count("skipped"),
+        "existing": outcomes.count("existing"),
+        "results": [
+            {"business_name": lead.business_name, "email": lead.email, "status": outcome}
+            for lead, outcome in zip(leads, outcomes)
+        ],
+    }
@@ -0,0 +1,216 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func, literal_column, or_, text, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.lead import Lead
+from app.schemas.lead import FacetCount, LeadCreate, LeadFilter, LeadPage, LeadPreview, LeadSearchResult
+
+# Columns a client may request through `fields`
+LEAD_COLUMNS = {
+    name: column for name, column in Lead.__table__.columns.items() if name != "search_vector"
+}
+DEFAULT_FIELDS = ["id", *LeadPreview.model_fields.keys()]
+SORT_KEY = ["lead_score", "created_at", "id"]
+SEARCH_FIELDS = [
+    "id", "business_name", "industry", "country", "email", "website",
+    "contact_person", "summary", "lead_score", "verified",
+]
+FACET_FIELDS = ["industry", "country", "verified"]
+TRGM_FIELDS = ["business_name", "contact_person", "website"]
+
+
+def apply_lead_filters(stmt, filters: LeadFilter):
+    """Add the WHERE clauses shared by listing, export and search."""
+    if filters.industry is not None:
+        stmt = stmt.where(Lead.industry == filters.industry)
+    if filters.country is not None:
+        stmt = stmt.where(Lead.country == filters.country)
+    if filters.verified is not None:
+        stmt = stmt.where(Lead.verified == filters.verified)
+    if filters.min_score is not None:
+        stmt = stmt.where(Lead.lead_score >= filters.min_score)
+    if filters.max_score is not None:
+        stmt = stmt.where(Lead.lead_score <= filters.max_score)
+    return stmt
+
+
+def parse_fields(fields: str | None) -> list[str]:
+    """Validate a comma-separated sparse fieldset, defaulting to the preview columns."""
+    if not fields:
+        return list(DEFAULT_FIELDS)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in LEAD_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown lead fields: {', '.join(unknown)}")
+    return requested
+
+
+def encode_cursor(lead_score: int, created_at: datetime, lead_id: uuid.UUID) -> str:
+    raw = json.dumps([lead_score, created_at.isoformat(), str(lead_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[int, datetime, uuid.UUID]:
+    try:
+        score, created_at, lead_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(score), datetime.fromisoformat(created_at), uuid.UUID(lead_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class LeadQueryService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_leads(
+        self,
+        filters: LeadFilter,
+        fields: list[str],
+        limit: int = 50,
+        cursor: str | None = None,
+        descending: bool = True,
+    ) -> LeadPage:
+        """
+        Page through leads ordered by (lead_score, created_at, id) using a
+        seek predicate on the last row of the previous page instead of OFFSET.
+        """
+        selected = list(dict.fromkeys([*fields, *SORT_KEY]))
+        sort_columns = [LEAD_COLUMNS[c] for c in SORT_KEY]
+
+        stmt = apply_lead_filters(select(*[LEAD_COLUMNS[c] for c in selected]), filters)
+        if cursor:
+            key = tuple_(*sort_columns)
+            after = tuple_(*decode_cursor(cursor))
+            stmt = stmt.where(key < after if descending else key > after)
+        stmt = stmt.order_by(
+            *[c.desc() if descending else c.asc() for c in sort_columns]
+        ).limit(limit + 1)
+
+        result = await self.session.exec(stmt)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.lead_score, last.created_at, last.id)
+
+        items = [{f: row._mapping[f] for f in fields} for row in rows]
+        return LeadPage(items=items, next_cursor=next_cursor)
+
+    async def search_leads(self, query: str, filters: LeadFilter, limit: int = 20) -> LeadSearchResult:
+        """
+        Rank leads by full-text relevance plus trigram similarity and return
+        the top matches together with facet counts, all in one statement.
+        """
+        tsquery = func.websearch_to_tsquery("english", query)
+        similarity = func.greatest(
+            *[func.coalesce(func.similarity(LEAD_COLUMNS[c], query), 0) for c in TRGM_FIELDS]
+        )
+        rank = func.ts_rank_cd(Lead.search_vector, tsquery) + similarity
+
+        matches = apply_lead_filters(
+            select(*[LEAD_COLUMNS[c] for c in SEARCH_FIELDS], rank.label("rank")).where(
+                or_(
+                    Lead.search_vector.op("@@")(tsquery),
+                    *[LEAD_COLUMNS[c].op("%")(query) for c in TRGM_FIELDS],
+                )
+            ),
+            filters,
+        ).cte("matches")
+
+        top = (
+            select(matches)
+            .order_by(matches.c.rank.desc(), matches.c.id)
+            .limit(limit)
+            .subquery("top")
+        )
+        items = select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(func.row_to_json(literal_column("top")), top.c.rank.desc())),
+                text("'[]'::json"),
+            )
+        ).select_from(top)
+
+        def facet(column: str):
+            counts = (
+                select(matches.c[column].label("value"), func.count().label("count"))
+                .group_by(matches.c[column])
+                .subquery(f"{column}_facet")
+            )
+            return select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object("value", counts.c.value, "count", counts.c["count"]),
+                            counts.c["count"].desc(),
+                        )
+                    ),
+                    text("'[]'::json"),
+                )
+            ).select_from(counts).scalar_subquery()
+
+        stmt = select(
+            items.scalar_subquery().label("items"),
+            select(func.count()).select_from(matches).scalar_subquery().label("total"),
+            *[facet(c).label(c) for c in FACET_FIELDS],
+        )
+
+        result = await self.session.exec(stmt)
+        row = result.one()
+        return LeadSearchResult(
+            items=row.items,
+            total=row.total,
+            facets={c: [FacetCount(**f) for f in getattr(row, c)] for c in FACET_FIELDS},
+        )
+
+    async def find_segment_leads(
+        self, industry: str, location: str, clients: str, limit: int
+    ) -> list[LeadCreate]:
+        """
+        Stored leads for a chat segment: same industry (case-insensitive),
+        country or address matching the location, best lead_score first.
+        Leads whose text matches the client description are ranked ahead.
+
+        The client match runs as its own LIMITed query instead of a leading
+        sort key, so the score-ordered query can walk
+        ix_leads_lower_industry_score and stop after `limit` rows.
+        """
+        location = (location or "").strip()
+        stmt = select(Lead).where(func.lower(Lead.industry) == (industry or "").strip().lower())
+        if location:
+            stmt = stmt.where(
+                or_(
+                    func.lower(Lead.country) == location.lower(),
+                    Lead.address.icontains(location, autoescape=True),
+                )
+            )
+        order = [Lead.lead_score.desc(), Lead.created_at.desc()]
+
+        rows: dict[uuid.UUID, Lead] = {}
+        if clients and clients.strip():
+            matches_clients = Lead.search_vector.op("@@")(func.websearch_to_tsquery("english", clients))
+            matched = await self.session.exec(stmt.where(matches_clients).order_by(*order).limit(limit))
+            rows.update((lead.id, lead) for lead in matched.all())
+        if len(rows) < limit:
+            ranked = await self.session.exec(stmt.order_by(*order).limit(limit))
+            for lead in ranked.all():
+                if len(rows) >= limit:
+                    break
+                rows.setdefault(lead.id, lead)
+
+        leads = []
+        for lead in rows.values():
+            try:
+                leads.append(LeadCreate.model_validate(lead, from_attributes=True))
+            except ValidationError as e:
+                print(f"[Error] Skipping stored lead {lead.id}: {e}")
+        return leads
@@ -0,0 +1,289 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Integer, String, bindparam, delete, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.lead import Lead
+from app.models.lead_merge import LeadMergeRun
+from app.utils.lead_normalize import name_similarity, resolution_keys
+
+settings = get_settings()
+
+# Two leads are one company when they share a registrable domain and their
+# names are alike (leadx.domain_name_similarity) or one is missing, or when
+# their canonical names are trigram-similar in a compatible country and at
+# most one side has a domain. `%` is answered by ix_leads_name_key_trgm using
+# pg_trgm.similarity_threshold, so candidates come from index probes only.
+MATCH_PREDICATE = """(
+    (
+        {a}.domain_key = {b}.domain_key
+        AND (
+            {a}.name_key IS NULL OR {b}.name_key IS NULL
+            OR similarity({a}.name_key, {b}.name_key)
+                >= current_setting('leadx.domain_name_similarity')::float
+        )
+    )
+    OR (
+        {a}.name_key % {b}.name_key
+        AND ({a}.domain_key IS NULL OR {b}.domain_key IS NULL)
+        AND ({a}.country IS NULL OR {b}.country IS NULL OR lower({a}.country) = lower({b}.country))
+    )
+)"""
+
+
+def match_existing_sql(src: str) -> str:
+    """Correlated subquery picking the best stored match for the keys on `src`."""
+    return f"""(
+        SELECT l.id FROM leads l
+        WHERE {MATCH_PREDICATE.format(a="l", b=src)}
+        ORDER BY l.domain_key = {src}.domain_key DESC NULLS LAST,
+                 similarity(l.name_key, {src}.name_key) DESC,
+                 l.lead_score DESC
+        LIMIT 1
+    )"""
+
+
+RESOLVE_SQL = text(
+    f"""
+    SELECT k.ord, {match_existing_sql("k")} AS match_id
+    FROM unnest(:ords, :domains, :names, :countries) AS k(ord, domain_key, name_key, country)
+    """
+).bindparams(
+    bindparam("ords", type_=ARRAY(Integer)),
+    bindparam("domains", type_=ARRAY(String)),
+    bindparam("names", type_=ARRAY(String)),
+    bindparam("countries", type_=ARRAY(String)),
+)
+
+PAIRS_SQL = text(
+    f"""
+    SELECT a.id AS a_id, b.id AS b_id
+    FROM leads a
+    JOIN leads b ON b.id <> a.id AND {MATCH_PREDICATE.format(a="b", b="a")}
+    WHERE a.id = ANY(:ids)
+    """
+).bindparams(bindparam("ids", type_=ARRAY(UUID(as_uuid=True))))
+
+BACKFILL_SQL = text(
+    """
+    UPDATE leads SET domain_key = k.domain_key, name_key = k.name_key
+    FROM unnest(:ids, :domains, :names) AS k(id, domain_key, name_key)
+    WHERE leads.id = k.id
+    """
+).bindparams(
+    bindparam("ids", type_=ARRAY(UUID(as_uuid=True))),
+    bindparam("domains", type_=ARRAY(String)),
+    bindparam("names", type_=ARRAY(String)),
+)
+
+
+async def use_match_threshold(session: AsyncSession):
+    """Set the name similarity thresholds used by MATCH_PREDICATE for the current transaction."""
+    await session.execute(
+        text(
+            "SELECT set_config('pg_trgm.similarity_threshold', :threshold, true), "
+            "set_config('leadx.domain_name_similarity', :domain_threshold, true)"
+        ),
+        {
+            "threshold": str(settings.LEAD_MATCH_NAME_SIMILARITY),
+            "domain_threshold": str(settings.LEAD_MATCH_DOMAIN_NAME_SIMILARITY),
+        },
+    )
+
+
+async def resolve_existing(session: AsyncSession, rows: list[dict]) -> dict[int, uuid.UUID]:
+    """
+    Map positions in `rows` (leads rows carrying domain_key, name_key and
+    country) to the id of an existing lead describing the same company.
+    """
+    keyed = [(i, row) for i, row in enumerate(rows) if row["domain_key"] or row["name_key"]]
+    if not keyed:
+        return {}
+    await use_match_threshold(session)
+    result = await session.execute(
+        RESOLVE_SQL,
+        {
+            "ords": [i for i, _ in keyed],
+            "domains": [row["domain_key"] for _, row in keyed],
+            "names": [row["name_key"] for _, row in keyed],
+            "countries": [row["country"] for _, row in keyed],
+        },
+    )
+    return {row.ord: row.match_id for row in result.all() if row.match_id is not None}
+
+
+# ---------- batch merge ----------
+MERGE_FILL_COLUMNS = [
+    "contact_person", "designation", "address", "country",
+    "contact_number", "email", "website", "summary",
+]
+
+
+async def create_merge_run(session: AsyncSession, dry_run: bool) -> LeadMergeRun:
+    run = LeadMergeRun(dry_run=dry_run)
+    session.add(run)
+    await session.commit()
+    await session.refresh(run)
+    return run
+
+
+async def _backfill_keys(session: AsyncSession, run: LeadMergeRun, batch_size: int):
+    """Compute resolution keys for rows stored before they existed."""
+    last_id = None
+    while True:
+        stmt = select(Lead.id, Lead.business_name, Lead.website, Lead.email).where(Lead.name_key.is_(None))
+        if last_id is not None:
+            stmt = stmt.where(Lead.id > last_id)
+        result = await session.exec(stmt.order_by(Lead.id).limit(batch_size))
+        rows = result.all()
+        if not rows:
+            return
+        keys = [resolution_keys(row) for row in rows]
+        await session.execute(
+            BACKFILL_SQL,
+            {
+                "ids": [row.id for row in rows],
+                "domains": [k[0] for k in keys],
+                "names": [k[1] for k in keys],
+            },
+        )
+        last_id = rows[-1].id
+        run.rows_backfilled += len(rows)
+        session.add(run)
+        await session.commit()
+
+
+def _clusters(pairs: list[tuple[uuid.UUID, uuid.UUID]]) -> list[set[uuid.UUID]]:
+    """Connected components of the duplicate graph (union-find)."""
+    parent: dict[uuid.UUID, uuid.UUID] = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    groups: dict[uuid.UUID, set[uuid.UUID]] = {}
+    for x in parent:
+        groups.setdefault(find(x), set()).add(x)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def _same_company(a: Lead, b: Lead) -> bool:
+    """MATCH_PREDICATE applied to a pair before one of them is deleted."""
+    if a.domain_key and b.domain_key:
+        if a.domain_key != b.domain_key:
+            return False
+        return (
+            not a.name_key or not b.name_key
+            or name_similarity(a.name_key, b.name_key) >= settings.LEAD_MATCH_DOMAIN_NAME_SIMILARITY
+        )
+    if a.country and b.country and a.country.lower() != b.country.lower():
+        return False
+    return name_similarity(a.name_key, b.name_key) >= settings.LEAD_MATCH_NAME_SIMILARITY
+
+
+async def _merge_cluster(session: AsyncSession, ids: set[uuid.UUID]) -> int:
+    """
+    Fold a cluster into its best lead; returns how many rows were removed.
+    Clusters are transitive, so only members that match the survivor itself
+    are merged.
+    """
+    result = await session.exec(select(Lead).where(Lead.id.in_(ids)))
+    leads = sorted(result.all(), key=lambda l: (not l.verified, -l.lead_score, l.created_at))
+    if len(leads) < 2:
+        return 0
+    survivor = leads[0]
+    duplicates = [l for l in leads[1:] if _same_company(survivor, l)]
+    if not duplicates:
+        return 0
+    leads = [survivor, *duplicates]
+
+    merged = {}
+    for col in MERGE_FILL_COLUMNS:
+        if getattr(survivor, col) is None:
+            merged[col] = next((getattr(d, col) for d in duplicates if getattr(d, col) is not None), None)
+    merged["lead_score"] = max(l.lead_score for l in leads)
+    merged["verified"] = any(l.verified for l in leads)
+
+    # Delete first so a duplicate's email can move to the survivor
+    await session.execute(delete(Lead).where(Lead.id.in_([d.id for d in duplicates])))
+    for col, value in merged.items():
+        setattr(survivor, col, value)
+    survivor.domain_key, survivor.name_key = resolution_keys(survivor)
+    session.add(survivor)
+    await session.flush()
+    return len(duplicates)
+
+
+async def run_merge(run_id: uuid.UUID):
+    """
+    Merge duplicate leads already stored. Candidate pairs come from index
+    probes per lead (domain equality and name trigram similarity), never a
+    pairwise scan; clusters are merged into the verified, highest-scoring,
+    oldest lead, filling its empty fields from the rest.
+    """
+    batch_size = settings.LEAD_MERGE_BATCH_SIZE
+
+    async with async_session() as session:
+        run = await session.get(LeadMergeRun, run_id)
+        run.status = "running"
+        await session.commit()
+
+        try:
+            await _backfill_keys(session, run, batch_size)
+
+            pairs = []
+            last_id = None
+            while True:
+                stmt = select(Lead.id).order_by(Lead.id).limit(batch_size)
+                if last_id is not None:
+                    stmt = stmt.where(Lead.id > last_id)
+                result = await session.exec(stmt)
+                ids = result.all()
+                if not ids:
+                    break
+                await use_match_threshold(session)
+                result = await session.execute(PAIRS_SQL, {"ids": ids})
+                pairs.extend((row.a_id, row.b_id) for row in result.all())
+                last_id = ids[-1]
+                run.rows_scanned += len(ids)
+                session.add(run)
+                await session.commit()
+
+            clusters = _clusters(pairs)
+            run.clusters_found = len(clusters)
+            session.add(run)
+            await session.commit()
+
+            if not run.dry_run:
+                for i, cluster in enumerate(clusters, start=1):
+                    run.leads_merged += await _merge_cluster(session, cluster)
+                    if i % 100 == 0 or i == len(clusters):
+                        session.add(run)
+                        await session.commit()
+
+            run.status = "completed"
+            run.finished_at = datetime.now(timezone.utc)
+            session.add(run)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            run = await session.get(LeadMergeRun, run_id)
+            run.status = "failed"
+            run.error = str(e)
+            run.finished_at = datetime.now(timezone.utc)
+            session.add(run)
+            await session.commit()
+            print(f"[Error] Merge run {run_id} failed: {e}")
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import numpy as np
+from pydantic import BaseModel, field_validator
+from sqlalchemy import Float, Integer, and_, bindparam, cast, func, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.lead import Lead
+from app.models.lead_scoring import LeadScoringRun
+from app.schemas.lead import LeadFilter
+from app.services.lead_query import apply_lead_filters
+
+settings = get_settings()
+
+
+class ScoringProfile(BaseModel):
+    """Weights for the deterministic lead score (clipped to 1-100)."""
+    base: float = 10
+    # Points awarded when the field is present and non-empty
+    completeness: dict[str, float] = {
+        "contact_person": 6,
+        "designation": 4,
+        "contact_number": 8,
+        "email": 12,
+        "address": 3,
+        "country": 3,
+        "website": 8,
+        "summary": 4,
+    }
+    verified: float = 20
+    industry_weights: dict[str, float] = {}
+    industry_default: float = 5
+    country_weights: dict[str, float] = {}
+    country_default: float = 5
+    # Full recency points for a brand-new lead, halving every half-life
+    recency: float = 15
+    recency_half_life_days: float = 90
+
+    @field_validator("industry_weights", "country_weights")
+    @classmethod
+    def lowercase_keys(cls, weights: dict[str, float]) -> dict[str, float]:
+        return {k.strip().lower(): v for k, v in weights.items()}
+
+
+@lru_cache()
+def get_scoring_profiles() -> dict[str, ScoringProfile]:
+    profiles = {"default": ScoringProfile()}
+    if settings.LEAD_SCORING_PROFILES_PATH:
+        with open(settings.LEAD_SCORING_PROFILES_PATH, encoding="utf-8") as f:
+            for name, data in json.load(f).items():
+                profiles[name] = ScoringProfile(**data)
+    return profiles
+
+
+def get_scoring_profile(name: str) -> ScoringProfile:
+    profile = get_scoring_profiles().get(name)
+    if not profile:
+        raise ValueError(f"Unknown scoring profile: {name}")
+    return profile
+
+
+# ---------- vectorised scoring ----------
+def _score_columns(profile: ScoringProfile) -> list:
+    """
+    Columns read for scoring. Presence, category keys and creation time are
+    reduced in SQL, so every column loads straight into a typed array.
+    """
+    present = [
+        and_(getattr(Lead, field).isnot(None), getattr(Lead, field) != "").label(f"has_{field}")
+        for field in profile.completeness
+    ]
+    return [
+        Lead.id,
+        Lead.lead_score,
+        Lead.updated_at,
+        func.coalesce(Lead.verified, False).label("verified"),
+        func.lower(func.trim(func.coalesce(Lead.industry, ""))).label("industry_key"),
+        func.lower(func.trim(func.coalesce(Lead.country, ""))).label("country_key"),
+        cast(func.extract("epoch", Lead.created_at), Float).label("created_epoch"),
+        *present,
+    ]
+
+
+def _weight_lookup(keys: np.ndarray, weights: dict[str, float], default: float) -> np.ndarray:
+    """Map each normalised category key to its weight, looking up each distinct key once."""
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    table = np.array([weights.get(k, default) for k in uniq], dtype=np.float64)
+    return table[inverse]
+
+
+def compute_scores(columns: dict[str, np.ndarray], profile: ScoringProfile, now: datetime) -> np.ndarray:
+    """Score a batch given typed column arrays; returns int scores in [1, 100]."""
+    score = np.full(len(columns["verified"]), profile.base, dtype=np.float64)
+
+    for field, weight in profile.completeness.items():
+        score += columns[f"has_{field}"] * weight
+
+    score += columns["verified"] * profile.verified
+    score += _weight_lookup(columns["industry_key"], profile.industry_weights, profile.industry_default)
+    score += _weight_lookup(columns["country_key"], profile.country_weights, profile.country_default)
+
+    age_days = np.maximum(now.timestamp() - columns["created_epoch"], 0) / 86400
+    score += profile.recency * np.power(0.5, age_days / profile.recency_half_life_days)
+
+    return np.clip(np.rint(score), 1, 100).astype(np.int64)
+
+
+_COLUMN_DTYPES = {"lead_score": np.int64, "verified": np.bool_, "created_epoch": np.float64}
+
+
+def _score_batch(rows: list, names: list[str], profile: ScoringProfile, now: datetime):
+    """Return (ids, scores) for rows whose score changed."""
+    columns = {}
+    for name, values in zip(names, zip(*rows)):
+        if name in ("id", "updated_at"):
+            continue
+        dtype = np.bool_ if name.startswith("has_") else _COLUMN_DTYPES.get(name, np.str_)
+        columns[name] = np.array(values, dtype=dtype)
+    scores = compute_scores(columns, profile, now)
+    changed = np.nonzero(scores != columns["lead_score"])[0]
+    return [rows[i].id for i in changed], scores[changed].tolist()
+
+
+# ---------- runs ----------
+UPDATE_SCORES_SQL = text(
+    """
+    UPDATE leads SET lead_score = s.score
+    FROM unnest(:ids, :scores) AS s(id, score)
+    WHERE leads.id = s.id
+    """
+).bindparams(
+    bindparam("ids", type_=ARRAY(UUID(as_uuid=True))),
+    bindparam("scores", type_=ARRAY(Integer)),
+)
+
+
+async def _last_watermark(session: AsyncSession, profile: str) -> datetime | None:
+    result = await session.exec(
+        select(func.max(LeadScoringRun.watermark)).where(
+            LeadScoringRun.profile == profile,
+            LeadScoringRun.status == "completed",
+            LeadScoringRun.filtered == False,
+        )
+    )
+    return result.one()
+
+
+async def create_scoring_run(
+    session: AsyncSession, profile: str, full: bool, filtered: bool
+) -> LeadScoringRun:
+    get_scoring_profile(profile)
+    run = LeadScoringRun(profile=profile, full=full, filtered=filtered)
+    session.add(run)
+    await session.commit()
+    await session.refresh(run)
+    return run
+
+
+async def run_scoring(run_id: uuid.UUID, filters: LeadFilter | None = None):
+    """
+    Recompute lead_score in keyset batches ordered by (updated_at, id).
+    Incremental runs only visit rows updated since the last completed,
+    unfiltered run of the same profile, less LEAD_SCORING_WATERMARK_OVERLAP_SECONDS
+    so rows committed late with an earlier updated_at are not skipped.
+    Unchanged scores are not written, and score writes do not touch updated_at.
+    """
+    batch_size = settings.LEAD_SCORING_BATCH_SIZE
+    now = datetime.now(timezone.utc)
+
+    async with async_session() as session:
+        run = await session.get(LeadScoringRun, run_id)
+        profile = get_scoring_profile(run.profile)
+        columns = _score_columns(profile)
+        names = [column.key for column in columns]
+        watermark = None if run.full else await _last_watermark(session, run.profile)
+        run.status = "running"
+        await session.commit()
+
+        last_key = None
+        try:
+            while True:
+                stmt = select(*columns).order_by(Lead.updated_at, Lead.id)
+                if watermark is not None:
+                    # Re-read an overlap window: a row can commit after a later-stamped one was scored
+                    overlap = timedelta(seconds=settings.LEAD_SCORING_WATERMARK_OVERLAP_SECONDS)
+                    stmt = stmt.where(Lead.updated_at > watermark - overlap)
+                if last_key is not None:
+                    stmt = stmt.where(tuple_(Lead.updated_at, Lead.id) > tuple_(*last_key))
+                if filters is not None:
+                    stmt = apply_lead_filters(stmt, filters)
+                result = await session.exec(stmt.limit(batch_size))
+                rows = result.all()
+                if not rows:
+                    break
+
+                ids, scores = await asyncio.to_thread(_score_batch, rows, names, profile, now)
+                if ids:
+                    await session.execute(UPDATE_SCORES_SQL, {"ids": ids, "scores": scores})
+
+                last_key = (rows[-1].updated_at, rows[-1].id)
+                run.rows_scored += len(rows)
+                run.rows_changed += len(ids)
+                run.watermark = max(filter(None, [run.watermark, last_key[0]]))
+                session.add(run)
+                await session.commit()
+
+            if run.watermark is None:
+                run.watermark = watermark
+            run.status = "completed"
+            run.finished_at = datetime.now(timezone.utc)
+            session.add(run)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            run = await session.get(LeadScoringRun, run_id)
+            run.status = "failed"
+            run.error = str(e)
+            run.finished_at = datetime.now(timezone.utc)
+            session.add(run)
+            await session.commit()
+            print(f"[Error] Scoring run {run_id} failed: {e}")
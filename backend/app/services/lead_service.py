@@ -1,24 +1,32 @@
+import asyncio
 import json
-from fastapi import APIRouter, Depends
+import math
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from app.core.config import get_settings
-from app.db.session import get_session
-from app.schemas.lead import LeadPreview, LeadResponse, LeadCreate
-from langchain.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+from app.db.session import async_session, get_session
+from app.schemas.lead import LeadCreate
+from app.services.conversation_store import conversation_store
+from app.services.lead_cache import lead_cache
+from app.services.lead_intent import INTENT_SLOTS, extract_intent_rules, intent_prompt, parse_intent
+from app.services.lead_jobs import ACTIVE_STATUSES, finish_job, get_job, submit_job
+from app.services.lead_persistence import bulk_upsert_leads, summarize_outcomes
+from app.services.lead_query import LeadQueryService
+from app.services.llm_client import LLMPrompt, build_llm_client
+from app.utils.json_stream import JsonArrayStreamParser
+from app.utils.lead_wire import LEAD_WIRE_FIELDS, LeadTableStreamParser, parse_lead_content, validate_leads
+from app.utils.lead_normalize import LeadDeduplicator
+from app.utils.rate_limit import AsyncRateLimiter
+from app.utils.single_flight import SingleFlight
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.models.lead import Lead
-from sqlmodel import select
 
 settings = get_settings()
 router = APIRouter(prefix="/chat")
 
-llm = ChatGoogleGenerativeAI(
-    model= settings.GEMINI_MODEL,
-    google_api_key=settings.GEMINI_API_KEY,
-)
+llm_client = build_llm_client()
 
 
-lead_prompt = ChatPromptTemplate.from_template(
+lead_prompt = LLMPrompt(
     """
     You are a lead generation assistant.
     Generate {limit} company leads in JSON array format.
@@ -40,114 +48,636 @@ lead_prompt = ChatPromptTemplate.from_template(
     Clients: {clients}
     Industry: {industry}
     Location: {location}
+    {focus}
 
     Format strictly as JSON array.
     """
 )
 
-chat_memory = {}
+# Compact variant: the keys are sent once as a header instead of on every lead
+lead_table_prompt = LLMPrompt(
+    """
+    You are a lead generation assistant.
+    Generate {limit} company leads as tab-separated values.
 
+    The first line must be exactly this header:
+    """ + "\t".join(LEAD_WIRE_FIELDS) + """
 
-async def chat(user_id: str, message: str = None, db: AsyncSession = Depends(get_session)):
-    if user_id not in chat_memory:
-        chat_memory[user_id] = {"step": 1}
+    Then write one line per lead with the values in the same order, separated by single tab characters.
+    Leave a value empty if unknown. Never put tabs or line breaks inside a value.
+    lead_score is an integer from 1 to 100.
 
-    mem = chat_memory[user_id]
-    step = mem["step"]
+    Target:
+    Clients: {clients}
+    Industry: {industry}
+    Location: {location}
+    {focus}
 
-    if step == 1:
-        mem["step"] = 2
-        print(f"[User {user_id}] asked: {message}")
-        return {"bot": "What type of clients are you looking for?"}
+    Output only the header and the rows.
+    """
+)
+LEAD_PROMPTS = {"json": lead_prompt, "tsv": lead_table_prompt}
 
-    if step == 2:
-        mem["clients"] = message
-        mem["step"] = 3
-        print(f"[User {user_id}] answered clients: {message}")
-        return {"bot": "Got it! What industry are you targeting?"}
+PREVIEW_COLUMNS = ["Business Name", "Industry", "Country", "Email", "Website", "Source"]
 
-    if step == 3:
-        mem["industry"] = message
-        mem["step"] = 4
-        print(f"[User {user_id}] answered industry: {message}")
-        return {"bot": "Great! What location do you prefer?"}
+# Caps the number of outstanding Gemini calls across the whole worker
+llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+llm_rate_limiter = AsyncRateLimiter(settings.LLM_REQUESTS_PER_MINUTE)
+# Identical generations running at the same time share one LLM call
+llm_flights = SingleFlight()
 
-    if step == 4:
-        mem["location"] = message
-        return await generate_preview(mem)
+# Diversification hints for sharded generation
+SHARD_COMPANY_SIZES = ["startups", "small businesses", "mid-sized companies", "large enterprises"]
+SHARD_NAME_RANGES = ["A-C", "D-F", "G-I", "J-L", "M-O", "P-R", "S-U", "V-Z"]
+# Extra leads requested across shards to make up for cross-shard duplicates
+SHARD_OVERGENERATION = 1.2
+
+
+async def _watch_disconnect(request: Request, task: asyncio.Task, interval: float = 0.5):
+    """Cancel the LLM task as soon as the HTTP client goes away."""
+    while not task.done():
+        if await request.is_disconnected():
+            print("[LLM] Client disconnected, cancelling generation")
+            task.cancel()
+            return
+        await asyncio.sleep(interval)
+
+
+async def _run_chain(inputs: dict, prompt: LLMPrompt | None = None) -> str:
+    async with llm_semaphore:
+        await llm_rate_limiter.acquire()
+        # Only the model call is timed; queueing for a slot is not the model being slow
+        return await asyncio.wait_for(
+            llm_client.generate(prompt or LEAD_PROMPTS[settings.LEAD_WIRE_FORMAT], inputs),
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+
+
+async def invoke_lead_chain(
+    inputs: dict,
+    request: Request | None = None,
+    prompt: LLMPrompt | None = None,
+    flight_key: str | None = None,
+):
+    """
+    Run the lead chain on the event loop without blocking it.
+    The model call is bounded by LLM_TIMEOUT_SECONDS once it holds a
+    concurrency slot, and the whole call is cancelled if the client disconnects.
+    Calls sharing a flight_key while one is in progress join that call;
+    a disconnect then only drops this caller unless it was the last one.
+    """
+    def call():
+        return _run_chain(inputs, prompt)
+
+    task = asyncio.create_task(llm_flights.do(flight_key, call) if flight_key else call())
+    watcher = asyncio.create_task(_watch_disconnect(request, task)) if request else None
+    try:
+        return await task
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Lead generation timed out",
+        )
+    finally:
+        if watcher:
+            watcher.cancel()
+        if not task.done():
+            task.cancel()
+
+
+async def chat(
+    user_id: str,
+    message: str = None,
+    db: AsyncSession = Depends(get_session),
+    request: Request | None = None,
+    use_cache: bool = True,
+    limit: int | None = None,
+):
+    mem = await conversation_store.load(user_id) or {"step": 1}
+    if limit:
+        mem["limit"] = limit
+    response = await _chat_step(user_id, mem, message, db, request, use_cache)
+    # Job submissions persist the conversation themselves, before the job can finish
+    if "job_id" not in response:
+        dropped = await conversation_store.save(user_id, mem)
+        if dropped:
+            response["preview_truncated"] = _truncation_notice(user_id, mem, dropped)
+    return response
+
+
+def _truncation_notice(user_id: str, mem: dict, dropped: int) -> dict:
+    """Preview rows that did not fit in the conversation state and will not be saved."""
+    kept = len(mem.get("preview", [])) - dropped
+    print(f"[Error] Conversation state for user {user_id} kept {kept} preview leads, dropped {dropped}")
+    return {"kept": kept, "dropped": dropped}
+
+
+SLOT_STEPS = {"clients": 2, "industry": 3, "location": 4}
+SLOT_QUESTIONS = {
+    "clients": "What type of clients are you looking for?",
+    "industry": "Got it! What industry are you targeting?",
+    "location": "Great! What location do you prefer?",
+}
+# Messages shorter than this are greetings or single answers, not worth an LLM call
+INTENT_LLM_MIN_WORDS = 3
+
+
+async def _chat_step(
+    user_id: str,
+    mem: dict,
+    message: str,
+    db: AsyncSession,
+    request: Request | None,
+    use_cache: bool,
+):
+    step = mem["step"]
+
+    if step <= 4:
+        if settings.LEAD_GENERATION_MODE == "job" and mem.get("job_id"):
+            pending = await _poll_job(mem, db)
+            if pending:
+                return pending
+
+        question = await _collect_slots(user_id, mem, message, request)
+        if question:
+            return question
+
+        if settings.LEAD_GENERATION_MODE == "job":
+            return await _submit_generation_job(user_id, mem, db, use_cache)
+        return await generate_preview(mem, request, use_cache)
 
     if step == 5:
         return await save_leads(mem, db)
     return {"bot": "Step not implemented yet."}
 
 
-async def generate_preview(mem: dict):
+async def _collect_slots(user_id: str, mem: dict, message: str, request: Request | None) -> dict | None:
     """
-    Generates lead preview using Gemini API and returns a table with more fields.
+    Record the user's answer and return the next question, or None once
+    clients, industry and location are all known.
+    """
+    step = mem["step"]
+
+    if not settings.LEAD_CHAT_ONE_SHOT:
+        if step == 1:
+            mem["step"] = 2
+            print(f"[User {user_id}] asked: {message}")
+            return {"bot": SLOT_QUESTIONS["clients"]}
+        if step == 2:
+            mem["clients"] = message
+            mem["step"] = 3
+            print(f"[User {user_id}] answered clients: {message}")
+            return {"bot": SLOT_QUESTIONS["industry"]}
+        if step == 3:
+            mem["industry"] = message
+            mem["step"] = 4
+            print(f"[User {user_id}] answered industry: {message}")
+            return {"bot": SLOT_QUESTIONS["location"]}
+        mem["location"] = message
+        return None
+
+    print(f"[User {user_id}] said: {message}")
+    slots = await extract_intent(message, request, use_llm=step == 1)
+    # An answer to a follow-up fills the slot that was asked for
+    if step > 1 and message:
+        asked = next(slot for slot, n in SLOT_STEPS.items() if n == step)
+        mem[asked] = slots.pop(asked, None) or message.strip()
+    for slot, value in slots.items():
+        mem.setdefault(slot, value)
+
+    missing = [slot for slot in INTENT_SLOTS if not mem.get(slot)]
+    if not missing:
+        return None
+    mem["step"] = SLOT_STEPS[missing[0]]
+    return {"bot": SLOT_QUESTIONS[missing[0]], "missing": missing}
+
+
+async def extract_intent(message: str | None, request: Request | None = None, use_llm: bool = True) -> dict:
+    """
+    Find clients, industry and location in free text with the rule extractor,
+    asking the LLM only when rules leave slots empty in a substantive message.
+    """
+    slots = extract_intent_rules(message)
+    if (
+        not use_llm
+        or not settings.LEAD_INTENT_LLM_FALLBACK
+        or len(slots) == len(INTENT_SLOTS)
+        or len((message or "").split()) < INTENT_LLM_MIN_WORDS
+    ):
+        return slots
+
+    try:
+        content = await invoke_lead_chain({"message": message}, request, prompt=intent_prompt)
+        return {**parse_intent(content), **slots}
+    except Exception as e:
+        print(f"[Error] Intent extraction failed: {e}")
+        return slots
+
+
+async def _poll_job(mem: dict, db: AsyncSession) -> dict | None:
+    """Status of the job already queued for this conversation, if it is still active."""
+    job = await get_job(db, uuid.UUID(mem["job_id"]))
+    if job and job.status in ACTIVE_STATUSES:
+        return {"bot": "Still working on your leads...", "job_id": mem["job_id"], "status": job.status}
+    # The previous job failed; treat this message as a new answer
+    mem.pop("job_id")
+    return None
+
+
+async def _submit_generation_job(user_id: str, mem: dict, db: AsyncSession, use_cache: bool):
+    """Queue the preview generation as a background job."""
+    job_id = uuid.uuid4()
+    mem["job_id"] = str(job_id)
+    await conversation_store.save(user_id, mem)
+    try:
+        job = await submit_job(db, user_id, {**_lead_inputs(mem), "use_cache": use_cache}, job_id)
+    except HTTPException:
+        mem.pop("job_id")
+        await conversation_store.save(user_id, mem)
+        raise
+    return {
+        "bot": "Generating your leads, the preview will be ready shortly.",
+        "job_id": str(job.id),
+        "status": job.status,
+    }
+
+
+async def run_generation_job(job_id: uuid.UUID):
     """
-    chain = lead_prompt | llm
-    result = chain.invoke({
+    Worker handler: generate the preview for a queued job, store the response
+    on the job and move the owning conversation on to the save step.
+    """
+    async with async_session() as session:
+        job = await get_job(session, job_id)
+    params = dict(job.params)
+    use_cache = params.pop("use_cache", True)
+    mem = {**params, "step": 4}
+
+    response = await generate_preview(mem, use_cache=use_cache)
+
+    conversation = await conversation_store.load(job.user_id)
+    if conversation and conversation.get("job_id") == str(job_id):
+        conversation.pop("job_id")
+        conversation["preview"] = mem["preview"]
+        conversation["preview_sources"] = mem["preview_sources"]
+        conversation["step"] = 5
+        dropped = await conversation_store.save(job.user_id, conversation)
+        if dropped:
+            response["preview_truncated"] = _truncation_notice(job.user_id, conversation, dropped)
+    await finish_job(job_id, result=response)
+
+
+def _lead_inputs(mem: dict) -> dict:
+    return {
         "clients": mem["clients"],
         "industry": mem["industry"],
         "location": mem["location"],
-        "limit": 5
-    })
+        "limit": mem.get("limit") or settings.LEAD_DEFAULT_LIMIT,
+        "focus": "",
+    }
+
+
+def _cache_key(inputs: dict) -> str:
+    # Raw responses are cached, so the wire format is part of the key
+    return lead_cache.make_key(
+        inputs["clients"], inputs["industry"], inputs["location"], inputs["limit"],
+        f"{settings.GEMINI_MODEL}:{settings.LEAD_WIRE_FORMAT}",
+        variant=inputs.get("focus", ""),
+    )
+
+
+def _is_sharded(inputs: dict) -> bool:
+    return inputs["limit"] > settings.LEAD_SHARD_SIZE
+
+
+def _parse_leads(content: str) -> tuple[list[LeadCreate], list[dict]]:
+    """Valid leads and per-row failures from a complete LLM response."""
+    leads, failures = validate_leads(parse_lead_content(content, settings.LEAD_WIRE_FORMAT))
+    for failure in failures:
+        print(f"[Error] Rejected generated lead row {failure['row']}: {failure['errors']}")
+    return leads, failures
+
+
+def _stream_parser():
+    if settings.LEAD_WIRE_FORMAT == "tsv":
+        return LeadTableStreamParser()
+    return JsonArrayStreamParser()
+
+
+def _shard_inputs(inputs: dict) -> list[dict]:
+    """Split a large request into smaller prompts, each steered to a different slice of the market."""
+    size = settings.LEAD_SHARD_SIZE
+    count = math.ceil(inputs["limit"] * SHARD_OVERGENERATION / size)
+    return [
+        {
+            **inputs,
+            "limit": size,
+            "focus": (
+                f"Focus on {SHARD_COMPANY_SIZES[i % len(SHARD_COMPANY_SIZES)]} whose names start with "
+                f"{SHARD_NAME_RANGES[i % len(SHARD_NAME_RANGES)]} (batch {i + 1} of {count})."
+            ),
+        }
+        for i in range(count)
+    ]
+
 
+async def _generate_shard(
+    inputs: dict, use_cache: bool, request: Request | None = None
+) -> tuple[list[LeadCreate], list[dict]]:
+    cache_key = _cache_key(inputs)
+    content = await lead_cache.get(cache_key) if use_cache else None
+    if content is not None:
+        return _parse_leads(content)
 
+    content = await invoke_lead_chain(inputs, request, flight_key=cache_key)
+    leads, failures = _parse_leads(content)
+    if leads:
+        await lead_cache.set(cache_key, content)
+    return leads, failures
+
+
+async def iter_sharded_leads(
+    inputs: dict,
+    use_cache: bool = True,
+    failures: list | None = None,
+    shard_errors: list | None = None,
+    request: Request | None = None,
+):
+    """
+    Run the shards of a large request concurrently (bounded by the LLM
+    semaphore and rate limiter) and yield unique leads as each shard lands.
+    Rejected rows are appended to `failures` and the errors of failed
+    shards to `shard_errors`; remaining shards are cancelled once the
+    requested number of leads has been produced, or when `request`'s
+    client disconnects.
+    """
+    dedup = LeadDeduplicator()
+    produced = 0
+    tasks = [
+        asyncio.create_task(_generate_shard(shard, use_cache, request)) for shard in _shard_inputs(inputs)
+    ]
     try:
-        cleaned_content = result.content.strip().replace("```json", "").replace("```", "")
-        print(f"[Cleaned Content] {cleaned_content}")
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                leads, shard_failures = await next_done
+            except Exception as e:
+                error = getattr(e, "detail", None) or str(e) or type(e).__name__
+                print(f"[Error] Lead generation shard failed: {error}")
+                if shard_errors is not None:
+                    shard_errors.append(error)
+                continue
+            if failures is not None:
+                failures.extend(shard_failures)
+            for lead in leads:
+                if dedup.add(lead):
+                    produced += 1
+                    yield lead
+                    if produced >= inputs["limit"]:
+                        return
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        preview = json.loads(cleaned_content)  
-        mem["preview"] = [LeadCreate(**lead) for lead in preview]
-    except Exception as e:
-        mem["preview"] = []
-        print(f"[Error] Failed to parse Gemini response: {e}")
+
+def _preview_row(lead: LeadCreate, source: str = "generated") -> list:
+    return [
+        lead.business_name,
+        lead.industry or "-",
+        lead.country or "-",
+        lead.email or "-",
+        lead.website or "-",
+        source,
+    ]
+
+
+async def _retrieve_existing(inputs: dict) -> list[LeadCreate]:
+    """Best stored leads for the requested segment, when retrieval-first is enabled."""
+    if not settings.LEAD_RETRIEVAL_FIRST:
+        return []
+    async with async_session() as session:
+        service = LeadQueryService(session)
+        return await service.find_segment_leads(
+            inputs["industry"], inputs["location"], inputs["clients"], inputs["limit"]
+        )
+
+
+def _seeded_deduplicator(leads: list[LeadCreate]) -> LeadDeduplicator:
+    dedup = LeadDeduplicator()
+    for lead in leads:
+        dedup.add(lead)
+    return dedup
+
+
+async def _generate_leads(
+    inputs: dict, request: Request | None, use_cache: bool
+) -> tuple[list[LeadCreate], list[dict], list[str]]:
+    """Leads, rejected rows and the errors of failed shards."""
+    if _is_sharded(inputs):
+        failures, shard_errors = [], []
+        leads = [lead async for lead in iter_sharded_leads(inputs, use_cache, failures, shard_errors, request)]
+        if shard_errors:
+            print(f"[Error] {len(shard_errors)} of {len(_shard_inputs(inputs))} lead generation shards failed")
+        return leads, failures, shard_errors
+
+    cache_key = _cache_key(inputs)
+    content = await lead_cache.get(cache_key) if use_cache else None
+    from_cache = content is not None
+    if not from_cache:
+        content = await invoke_lead_chain(inputs, request, flight_key=cache_key)
+
+    leads, failures = _parse_leads(content)
+    if leads and not from_cache:
+        await lead_cache.set(cache_key, content)
+    return leads, failures, []
 
 
+async def generate_preview(mem: dict, request: Request | None = None, use_cache: bool = True):
+    """
+    Generates lead preview using Gemini API and returns a table with more fields.
+    Matching leads already in the database are used first and Gemini is only
+    asked for the shortfall. Identical searches are served from the generation
+    cache unless use_cache is False.
+    """
+    inputs = _lead_inputs(mem)
+    existing = await _retrieve_existing(inputs)
+    generated, failures, shard_errors = [], [], []
+    shortfall = inputs["limit"] - len(existing)
+    if shortfall > 0:
+        generated, failures, shard_errors = await _generate_leads(
+            {**inputs, "limit": shortfall}, request, use_cache
+        )
+        dedup = _seeded_deduplicator(existing)
+        generated = [lead for lead in generated if dedup.add(lead)]
+
+    mem["preview"] = existing + generated
+    mem["preview_sources"] = ["database"] * len(existing) + ["generated"] * len(generated)
     table = {
-        "columns": [
-            "Business Name", "Industry", "Country", "Email", "Website"
-        ],
+        "columns": PREVIEW_COLUMNS,
         "rows": [
-            [
-                lead.business_name,
-                lead.industry or "-",
-                lead.country or "-",
-                lead.email or "-",
-                lead.website or "-"
-            ]
-            for lead in mem["preview"]
+            _preview_row(lead, source)
+            for lead, source in zip(mem["preview"], mem["preview_sources"])
         ]
     }
     mem["step"] = 5
-    return {
+    response = {
         "bot": "Here’s a preview of leads I found:",
         "table": table,
     }
+    if failures:
+        response["rejected"] = failures
+    if shard_errors:
+        response["failed_shards"] = len(shard_errors)
+    return response
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+
+
+async def stream_preview(mem: dict, use_cache: bool = True):
+    """
+    Streams the lead preview as Server-Sent Events. Each lead is validated
+    and emitted as a table row as soon as its row (or JSON object) is
+    complete, and rejected rows are reported as "rejected" events; the
+    collected rows are stored in mem["preview"] for the save step.
+    Client disconnects cancel this generator (and the LLM stream) via Starlette.
+    """
+    parser = _stream_parser()
+    preview, rejected, shard_errors = [], [], []
+    rows_seen = 0
+    yield _sse("columns", PREVIEW_COLUMNS)
+
+    inputs = _lead_inputs(mem)
+    existing = await _retrieve_existing(inputs)
+    for lead in existing:
+        yield _sse("row", _preview_row(lead, "database"))
+    dedup = _seeded_deduplicator(existing)
 
-async def save_leads(mem: dict, db: AsyncSession):
+    def accept(objects: list) -> list[str]:
+        """Validate newly parsed rows and return their events."""
+        nonlocal rows_seen
+        leads, failures = validate_leads(objects, start=rows_seen + 1)
+        rows_seen += len(objects)
+        rejected.extend(failures)
+        events = []
+        for lead in leads:
+            if dedup.add(lead):
+                preview.append(lead)
+                events.append(_sse("row", _preview_row(lead)))
+        events.extend(_sse("rejected", failure) for failure in failures)
+        return events
+
+    inputs["limit"] -= len(existing)
+    cache_key = _cache_key(inputs)
+    cached = (
+        await lead_cache.get(cache_key)
+        if use_cache and inputs["limit"] > 0 and not _is_sharded(inputs)
+        else None
+    )
+
+    if inputs["limit"] <= 0:
+        pass
+    elif _is_sharded(inputs):
+        async for lead in iter_sharded_leads(inputs, use_cache, rejected, shard_errors):
+            if dedup.add(lead):
+                preview.append(lead)
+                yield _sse("row", _preview_row(lead))
+        for failure in rejected:
+            yield _sse("rejected", failure)
+        for error in shard_errors:
+            yield _sse("shard_failed", {"detail": error})
+    elif cached is not None:
+        for event in accept(parser.feed(cached) + parser.close()):
+            yield event
+    else:
+        loop = asyncio.get_running_loop()
+        parts = []
+        timed_out = False
+        async with llm_semaphore:
+            await llm_rate_limiter.acquire()
+            stream = llm_client.stream(LEAD_PROMPTS[settings.LEAD_WIRE_FORMAT], inputs)
+            deadline = loop.time() + settings.LLM_TIMEOUT_SECONDS
+            try:
+                while True:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    try:
+                        chunk = await asyncio.wait_for(stream.__anext__(), timeout=remaining)
+                    except StopAsyncIteration:
+                        break
+
+                    parts.append(chunk)
+                    for event in accept(parser.feed(chunk)):
+                        yield event
+                for event in accept(parser.close()):
+                    yield event
+            except asyncio.TimeoutError:
+                timed_out = True
+                yield _sse("error", {"detail": "Lead generation timed out"})
+            finally:
+                await stream.aclose()
+
+        if preview and not timed_out:
+            await lead_cache.set(cache_key, "".join(parts))
+
+    mem["preview"] = existing + preview
+    mem["preview_sources"] = ["database"] * len(existing) + ["generated"] * len(preview)
+    mem["step"] = 5
+    yield _sse("done", {
+        "bot": "Here’s a preview of leads I found:",
+        "count": len(mem["preview"]),
+        "from_database": len(existing),
+        "rejected": len(rejected),
+        "failed_shards": len(shard_errors),
+    })
+
+
+async def chat_stream(
+    user_id: str,
+    message: str = None,
+    db: AsyncSession = Depends(get_session),
+    request: Request | None = None,
+    use_cache: bool = True,
+    limit: int | None = None,
+):
+    """
+    Streaming variant of chat(). The preview step streams rows as they are
+    generated; every other step is sent as a single "message" event.
+    """
+    mem = await conversation_store.load(user_id) or {"step": 1}
+    if mem["step"] <= 4 and not mem.get("job_id"):
+        if limit:
+            mem["limit"] = limit
+        question = await _collect_slots(user_id, mem, message, request)
+        if question is None:
+            async for event in stream_preview(mem, use_cache):
+                yield event
+        dropped = await conversation_store.save(user_id, mem)
+        if dropped:
+            yield _sse("preview_truncated", _truncation_notice(user_id, mem, dropped))
+        if question:
+            yield _sse("message", question)
+        return
+
+    response = await chat(
+        user_id=user_id, message=message, db=db, request=request, use_cache=use_cache, limit=limit
+    )
+    yield _sse("message", response)
+
+async def save_leads(mem: dict, db: AsyncSession, on_conflict: str = "update"):
     if "preview" not in mem or not mem["preview"]:
         return {"bot": "No lead found to save."}
-    
-    for lead in mem['preview']:
-        lead_data = Lead(
-            business_name=lead.business_name,
-            industry=lead.industry,
-            contact_person=lead.contact_person,
-            designation=lead.designation,
-            address=lead.address,
-            country=lead.country,
-            contact_number=lead.contact_number,
-            email=lead.email,
-            website=lead.website,
-            summary=lead.summary,
-            lead_score=lead.lead_score,
-            verified=False
-        )
 
-        db.add(lead_data)
+    leads = mem["preview"]
+    # Leads retrieved from the database are already stored
+    sources = mem.get("preview_sources") or []
+    new_indexes = [i for i in range(len(leads)) if i >= len(sources) or sources[i] != "database"]
+    new_outcomes = await bulk_upsert_leads(db, [leads[i] for i in new_indexes], on_conflict=on_conflict)
 
-    await db.commit()
-    await db.refresh(lead_data)
-    return {"bot": "Leads saved successfully."}
\ No newline at end of file
+    outcomes = ["existing"] * len(leads)
+    for i, outcome in zip(new_indexes, new_outcomes):
+        outcomes[i] = outcome
+    return {"bot": "Leads saved successfully.", **summarize_outcomes(leads, outcomes)}
@@ -0,0 +1,289 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.latency import LatencyTracker
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class LLMPrompt:
+    """
+    A prompt template using str.format placeholders. Kept free of langchain
+    so that importing the app does not load the LLM stack.
+    """
+    template: str
+
+    def format(self, **inputs) -> str:
+        return self.template.format(**inputs)
+
+
+@lru_cache(maxsize=None)
+def _chat_prompt(prompt: LLMPrompt):
+    from langchain.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_template(prompt.template)
+
+
+class LLMClient(ABC):
+    """A chat model that renders a prompt template and returns text."""
+
+    model: str
+
+    @abstractmethod
+    async def generate(self, prompt: LLMPrompt, inputs: dict) -> str:
+        ...
+
+    @abstractmethod
+    def stream(self, prompt: LLMPrompt, inputs: dict) -> AsyncIterator[str]:
+        ...
+
+    async def warm_up(self):
+        """Load and connect ahead of the first request; optional."""
+
+
+class GeminiClient(LLMClient):
+    """Gemini through langchain, imported and constructed on first use."""
+
+    def __init__(self, model: str, api_key: str):
+        self.model = model
+        self.api_key = api_key
+        self._llm = None
+
+    def _chat_model(self):
+        if self._llm is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            self._llm = ChatGoogleGenerativeAI(model=self.model, google_api_key=self.api_key)
+        return self._llm
+
+    async def generate(self, prompt: LLMPrompt, inputs: dict) -> str:
+        result = await (_chat_prompt(prompt) | self._chat_model()).ainvoke(inputs)
+        return result.content
+
+    async def stream(self, prompt: LLMPrompt, inputs: dict) -> AsyncIterator[str]:
+        async for chunk in (_chat_prompt(prompt) | self._chat_model()).astream(inputs):
+            if isinstance(chunk.content, str):
+                yield chunk.content
+
+    async def warm_up(self):
+        # Import langchain off the event loop, then make one cheap API call to open the connection
+        llm = await asyncio.to_thread(self._chat_model)
+        await asyncio.to_thread(llm.get_num_tokens, "warm up")
+
+
+class LLMRouter(LLMClient):
+    """
+    Sends each request to the first healthy client and hedges it: when the
+    primary has not answered within its `hedge_percentile` latency, the next
+    client is started too and the first answer wins, the other is cancelled.
+    A failed attempt falls through to the next client. Each client has its
+    own circuit breaker and latency window (two clients may share a model),
+    so a degraded client is skipped until it recovers.
+    """
+
+    def __init__(
+        self,
+        clients: list[LLMClient],
+        hedge_percentile: float,
+        hedge_min_delay: float,
+        hedge_default_delay: float,
+        breaker_threshold: int,
+        breaker_reset_seconds: float,
+        trial_timeout_seconds: float = 60.0,
+        min_samples: int = 20,
+    ):
+        self.clients = clients
+        self.model = clients[0].model
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_default_delay = hedge_default_delay
+        self.min_samples = min_samples
+        self.breakers = {
+            c: CircuitBreaker(breaker_threshold, breaker_reset_seconds, trial_timeout_seconds)
+            for c in clients
+        }
+        self.latencies = {c: LatencyTracker() for c in clients}
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.fallbacks = 0
+
+    def _unavailable(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Lead generation is temporarily unavailable",
+        )
+
+    def hedge_delay(self, client: LLMClient) -> float:
+        latencies = self.latencies[client]
+        if len(latencies) < self.min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, latencies.percentile(self.hedge_percentile))
+
+    def _acquire(self, client: LLMClient) -> bool | None:
+        """None when the breaker rejects the call, else whether it is the half-open trial."""
+        breaker = self.breakers[client]
+        if not breaker.allow():
+            return None
+        return breaker.state != "closed"
+
+    async def _attempt(self, client: LLMClient, prompt: LLMPrompt, inputs: dict, trial: bool) -> str:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            content = await client.generate(prompt, inputs)
+        except asyncio.CancelledError:
+            # Timed out, lost a hedge race or the client went away: no verdict on the model
+            if trial:
+                self.breakers[client].cancel_trial()
+            raise
+        except Exception:
+            self.breakers[client].record_failure()
+            raise
+        self.breakers[client].record_success()
+        self.latencies[client].record(loop.time() - started)
+        return content
+
+    async def generate(self, prompt: LLMPrompt, inputs: dict) -> str:
+        loop = asyncio.get_running_loop()
+        queue = iter(self.clients)
+        pending: dict[asyncio.Task, LLMClient] = {}
+        started: dict[asyncio.Task, float] = {}
+        can_hedge = self.hedge_percentile > 0
+        last_error: Exception | None = None
+
+        def launch() -> LLMClient | None:
+            # Breakers are consulted only when a client is actually called
+            for client in queue:
+                trial = self._acquire(client)
+                if trial is not None:
+                    task = asyncio.create_task(self._attempt(client, prompt, inputs, trial))
+                    pending[task] = client
+                    started[task] = loop.time()
+                    return client
+            return None
+
+        primary = launch()
+        if primary is None:
+            raise self._unavailable()
+        try:
+            while pending:
+                timeout = self.hedge_delay(primary) if can_hedge else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if launch():
+                        self.hedges += 1
+                    else:
+                        can_hedge = False
+                    continue
+
+                for task in done:
+                    client = pending.pop(task)
+                    try:
+                        content = task.result()
+                    except Exception as e:
+                        print(f"[LLM] {client.model} failed: {e}")
+                        last_error = e
+                        continue
+                    if client is not primary:
+                        self.hedge_wins += 1
+                    return content
+
+                if not pending and launch():
+                    self.fallbacks += 1
+            raise last_error
+        finally:
+            for task, client in pending.items():
+                task.cancel()
+                # Censored sample: the call would have taken at least this long. Recording only
+                # finished calls would skew the window fast and keep shrinking the hedge delay.
+                self.latencies[client].record(max(loop.time() - started[task], self.hedge_delay(client)))
+
+    async def stream(self, prompt: LLMPrompt, inputs: dict) -> AsyncIterator[str]:
+        """Stream from the first healthy client; partial output cannot be hedged."""
+        client = trial = None
+        for candidate in self.clients:
+            trial = self._acquire(candidate)
+            if trial is not None:
+                client = candidate
+                break
+        if client is None:
+            raise self._unavailable()
+        try:
+            async for chunk in client.stream(prompt, inputs):
+                yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            if trial:
+                self.breakers[client].cancel_trial()
+            raise
+        except Exception:
+            self.breakers[client].record_failure()
+            raise
+        self.breakers[client].record_success()
+
+    async def warm_up(self):
+        results = await asyncio.gather(*(c.warm_up() for c in self.clients), return_exceptions=True)
+        for client, result in zip(self.clients, results):
+            if isinstance(result, Exception):
+                print(f"[LLM] Warm-up of {client.model} failed: {result}")
+
+    def _label(self, index: int, client: LLMClient) -> str:
+        if sum(c.model == client.model for c in self.clients) > 1:
+            return f"{client.model}#{index}"
+        return client.model
+
+    def stats(self) -> dict:
+        return {
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "fallbacks": self.fallbacks,
+            "models": {
+                self._label(i, c): {
+                    "breaker": self.breakers[c].state,
+                    "p50_seconds": self.latencies[c].percentile(50),
+                    "p95_seconds": self.latencies[c].percentile(95),
+                    "hedge_delay_seconds": self.hedge_delay(c),
+                }
+                for i, c in enumerate(self.clients)
+            },
+        }
+
+
+def _provider_client(model: str) -> LLMClient:
+    if settings.LLM_PROVIDER == "fake":
+        from app.services.fake_llm import FakeLLMClient
+
+        return FakeLLMClient(
+            model,
+            latency=settings.LLM_FAKE_LATENCY,
+            tokens_per_second=settings.LLM_FAKE_TOKENS_PER_SECOND,
+            error_rate=settings.LLM_FAKE_ERROR_RATE,
+            seed=settings.LLM_FAKE_SEED,
+        )
+    if settings.LLM_PROVIDER == "gemini":
+        return GeminiClient(model, settings.GEMINI_API_KEY)
+    raise ValueError(f"Unknown LLM provider: {settings.LLM_PROVIDER}")
+
+
+def build_llm_client() -> LLMRouter:
+    """GEMINI_MODEL first, then LLM_HEDGE_MODELS as hedges and fallbacks."""
+    models = [settings.GEMINI_MODEL]
+    models += [m.strip() for m in settings.LLM_HEDGE_MODELS.split(",") if m.strip()]
+    # Hedging with the primary model itself needs a second client of the same name
+    clients = [_provider_client(model) for model in models]
+    return LLMRouter(
+        clients,
+        hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+        hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+        hedge_default_delay=settings.LLM_HEDGE_DEFAULT_DELAY_SECONDS,
+        breaker_threshold=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+        breaker_reset_seconds=settings.LLM_BREAKER_RESET_SECONDS,
+        trial_timeout_seconds=settings.LLM_TIMEOUT_SECONDS,
+    )
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.session import async_session
+
+settings = get_settings()
+
+# One bounded batch per transaction; SKIP LOCKED lets several processes purge side by side
+PURGE_BATCH_SQL = text(
+    """
+    WITH doomed AS (
+        SELECT id FROM refresh_tokens
+        WHERE revoked OR expires_at < now()
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    DELETE FROM refresh_tokens t USING doomed WHERE t.id = doomed.id
+    """
+)
+
+
+class RefreshTokenPurger:
+    """
+    Periodically deletes expired and revoked refresh tokens. Each batch is
+    its own short transaction, and a run stops after max_batches so a large
+    backlog is worked off over several intervals instead of in one long pass.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int, max_batches: int, pause_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.pause_seconds = pause_seconds
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.rows_deleted = 0
+        self.last_run_at: datetime | None = None
+        self.last_run_deleted = 0
+        self.last_run_batches = 0
+        self.last_run_seconds: float | None = None
+        self.last_error: str | None = None
+
+    async def _purge_batch(self) -> int:
+        async with async_session() as session:
+            result = await session.execute(PURGE_BATCH_SQL, {"batch_size": self.batch_size})
+            await session.commit()
+            return result.rowcount
+
+    async def run_once(self) -> int:
+        """Delete up to max_batches batches; returns the number of rows removed."""
+        started = time.monotonic()
+        deleted = batches = 0
+        try:
+            while batches < self.max_batches:
+                count = await self._purge_batch()
+                batches += 1
+                deleted += count
+                if count < self.batch_size:
+                    break
+                await asyncio.sleep(self.pause_seconds)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"[Error] Refresh token purge failed: {e}")
+        finally:
+            self.runs += 1
+            self.rows_deleted += deleted
+            self.last_run_at = datetime.now(timezone.utc)
+            self.last_run_deleted = deleted
+            self.last_run_batches = batches
+            self.last_run_seconds = round(time.monotonic() - started, 3)
+        return deleted
+
+    async def _loop(self):
+        while True:
+            deleted = await self.run_once()
+            if deleted:
+                print(f"[Tokens] Purged {deleted} expired or revoked refresh tokens")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.interval_seconds > 0,
+            "interval_seconds": self.interval_seconds,
+            "batch_size": self.batch_size,
+            "runs": self.runs,
+            "rows_deleted": self.rows_deleted,
+            "last_run_at": self.last_run_at,
+            "last_run_deleted": self.last_run_deleted,
+            "last_run_batches": self.last_run_batches,
+            "last_run_seconds": self.last_run_seconds,
+            "last_error": self.last_error,
+        }
+
+
+refresh_token_purger = RefreshTokenPurger(
+    interval_seconds=settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    batch_size=settings.REFRESH_TOKEN_PURGE_BATCH_SIZE,
+    max_batches=settings.REFRESH_TOKEN_PURGE_MAX_BATCHES,
+    pause_seconds=settings.REFRESH_TOKEN_PURGE_PAUSE_SECONDS,
+)
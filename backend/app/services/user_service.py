@@ -8,6 +8,7 @@ from app.models.users import User
 from app.models.authorization import Role
 from app.schemas.users import UserCreate, UserUpdate, UserRead
 from app.core.security import hash_password
+from app.services.authz_cache import bump_authz_version, permission_cache
 
 
 class UserService:
@@ -41,7 +42,7 @@ class UserService:
         user = User(
             username=data.username,
             email=data.email,
-            password_hash=hash_password(data.password)
+            password_hash=await hash_password(data.password)
         )
 
         # assign roles
@@ -83,7 +84,7 @@ class UserService:
         if data.email is not None:
             user.email = data.email
         if data.password is not None:
-            user.password_hash = hash_password(data.password)
+            user.password_hash = await hash_password(data.password)
         if data.is_active is not None:
             user.is_active = data.is_active
 
@@ -94,7 +95,16 @@ class UserService:
             user.roles = roles_result.all()
 
         self.session.add(user)
+        # Role and is_active changes invalidate every worker's cache; a profile
+        # edit only refreshes this worker's entry, others catch up within the TTL
+        version = None
+        if data.role_ids is not None or data.is_active is not None:
+            version = await bump_authz_version(self.session)
         await self.session.commit()
+        if version is not None:
+            permission_cache.advance(version)
+        else:
+            permission_cache.evict(user_id)
         await self.session.refresh(user)
 
         return UserRead.model_validate(user, from_attributes=True)
@@ -105,4 +115,6 @@ class UserService:
             raise HTTPException(status_code=404, detail="User not found")
 
         await self.session.delete(user)
+        version = await bump_authz_version(self.session)
         await self.session.commit()
+        permission_cache.advance(version)
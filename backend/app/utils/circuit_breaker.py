@@ -0,0 +1,58 @@
+import time
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls
+    for `reset_seconds`; then lets a single trial call through (half-open)
+    and closes again on its success. A trial that never reports back (for
+    example a cancelled call that skipped `cancel_trial`) frees its slot
+    after `trial_timeout_seconds`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float, trial_timeout_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.trial_timeout_seconds = trial_timeout_seconds
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_running:
+            self._trial_started_at = time.monotonic()
+            return True
+        return False
+
+    @property
+    def trial_running(self) -> bool:
+        return (
+            self._trial_started_at is not None
+            and time.monotonic() - self._trial_started_at < self.trial_timeout_seconds
+        )
+
+    def cancel_trial(self):
+        """Release the half-open slot of a trial that ended without a result."""
+        self._trial_started_at = None
+
+    def record_success(self):
+        self.failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_started_at = None
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -0,0 +1,71 @@
+import json
+
+
+class JsonArrayStreamParser:
+    """
+    Incrementally extracts the objects of a top-level JSON array from a
+    stream of text chunks (e.g. LLM tokens). Anything before the opening
+    bracket, such as a ```json fence, is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._obj_start = None
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Consume a chunk and return every object completed by it."""
+        self._buffer += chunk
+        objects = []
+
+        while self._pos < len(self._buffer):
+            ch = self._buffer[self._pos]
+
+            if not self._started:
+                if ch == "[":
+                    self._started = True
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._obj_start = self._pos
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    raw = self._buffer[self._obj_start:self._pos + 1]
+                    try:
+                        objects.append(json.loads(raw))
+                    except json.JSONDecodeError as e:
+                        print(f"[Error] Skipping malformed lead object: {e}")
+                    self._obj_start = None
+            self._pos += 1
+
+        # Drop text that can no longer be part of a pending object
+        if self._obj_start is None:
+            self._buffer = ""
+            self._pos = 0
+        elif self._obj_start > 0:
+            self._buffer = self._buffer[self._obj_start:]
+            self._pos -= self._obj_start
+            self._obj_start = 0
+
+        return objects
+
+    def close(self) -> list[dict]:
+        """Objects are emitted as soon as they complete, so nothing is pending."""
+        return []
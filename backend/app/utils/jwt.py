@@ -1,4 +1,6 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
+from typing import Iterable
 from uuid import uuid4, UUID
 from jose import jwt, JWTError, ExpiredSignatureError
 from app.core.config import get_settings
@@ -8,20 +10,44 @@ settings = get_settings()
 ALGORITHM = settings.ALGORITHM
 SECRET_KEY = settings.SECRET_KEY
 
-def create_access_token(user_id: UUID, expires_minutes: int = 15) -> str:
+def create_access_token(
+    user_id: UUID,
+    expires_minutes: int = 15,
+    permissions: Iterable[str] | None = None,
+    authz_version: int | None = None,
+) -> str:
+    """
+    permissions: "module:name" codes embedded as the `perms` claim together
+    with the authz version (`azv`) they were read at, so require_permission
+    can authorize without a database lookup while that version is current.
+    """
     expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
     to_encode = {"sub": str(user_id), "exp": expire}
+    if permissions is not None:
+        to_encode["perms"] = sorted(permissions)
+        to_encode["azv"] = authz_version
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def create_refresh_token(user_id: UUID, expires_days: int = 7) -> str:
+def create_refresh_token(user_id: UUID, expires_days: int = 7, jti: str | None = None) -> str:
     expire = datetime.now(timezone.utc) + timedelta(days=expires_days)
-    to_encode = {"sub": str(user_id), "jti": str(uuid4()), "exp": expire}
+    to_encode = {"sub": str(user_id), "jti": jti or str(uuid4()), "exp": expire}
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def verify_token(token: str) -> UUID | None:
+def refresh_token_jti(token: str) -> str | None:
+    """jti of a correctly signed token, even if it has expired."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return UUID(payload.get("sub"))
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+    except JWTError:
+        return None
+    return payload.get("jti")
+
+def hash_jti(jti: str) -> bytes:
+    """Fixed-width (32 byte) key under which a refresh token is stored."""
+    return hashlib.sha256(jti.encode()).digest()
+
+def decode_token(token: str) -> dict:
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,3 +60,6 @@ def verify_token(token: str) -> UUID | None:
             detail="Invalid access token",
             headers={"WWW-Authenticate": "Bearer"}
         )
+
+def verify_token(token: str) -> UUID | None:
+    return UUID(decode_token(token).get("sub"))
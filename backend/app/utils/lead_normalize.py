@@ -0,0 +1,148 @@
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation",
+    "co", "company", "gmbh", "plc", "pvt", "private", "sa", "ag", "bv",
+}
+# Shared mailbox providers say nothing about the company behind an address
+_FREE_EMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
+    "msn.com", "aol.com", "icloud.com", "me.com", "proton.me", "protonmail.com",
+    "gmx.com", "mail.com", "yandex.com", "zoho.com",
+}
+# Sites that host many companies under one registrable domain (profiles, builders,
+# link pages). Hosts under private public suffixes such as acme.github.io or
+# acme.myshopify.com already resolve per company through the suffix list.
+_SHARED_HOST_DOMAINS = {
+    "linkedin.com", "facebook.com", "fb.com", "instagram.com", "twitter.com", "x.com",
+    "youtube.com", "tiktok.com", "pinterest.com", "github.com", "gitlab.com", "bitbucket.org",
+    "medium.com", "substack.com", "google.com", "goo.gl", "wordpress.com", "blogspot.com",
+    "wix.com", "wixsite.com", "squarespace.com", "weebly.com", "shopify.com", "myshopify.com",
+    "webflow.io", "godaddysites.com", "carrd.co", "notion.site", "linktr.ee", "about.me",
+    "yelp.com", "crunchbase.com", "wellfound.com", "angel.co", "bit.ly", "tinyurl.com",
+}
+
+
+@lru_cache(maxsize=1)
+def _suffix_extractor():
+    import tldextract
+
+    # Bundled public suffix list snapshot only: no network fetch, no disk cache
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True)
+
+
+def normalize_email(email: str | None) -> str | None:
+    return email.strip().lower() if email else None
+
+
+def normalize_domain(website: str | None = None, email: str | None = None) -> str | None:
+    """Host of the website (or the email domain) without scheme, port or www."""
+    host = None
+    if website:
+        website = website.strip().lower()
+        host = urlsplit(website if "//" in website else f"//{website}").hostname
+    elif email and "@" in email:
+        host = email.rsplit("@", 1)[1].strip().lower()
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+def registrable_domain(host: str | None) -> str | None:
+    """
+    Reduce a host to the part a company registers, using the public suffix
+    list: "shop.acme.co.uk" -> "acme.co.uk", "acme.github.io" stays as is.
+    """
+    if not host:
+        return None
+    parts = _suffix_extractor()(host.strip("."))
+    if not parts.domain or not parts.suffix:
+        return None
+    return f"{parts.domain}.{parts.suffix}"
+
+
+def company_domain(website: str | None = None, email: str | None = None) -> str | None:
+    """
+    Registrable domain of the website, else of the email address. Shared
+    hosts and webmail providers identify no company and give None.
+    """
+    for host in (normalize_domain(website) if website else None, normalize_domain(email=email)):
+        domain = registrable_domain(host)
+        if domain and domain not in _SHARED_HOST_DOMAINS and domain not in _FREE_EMAIL_DOMAINS:
+            return domain
+    return None
+
+
+def _trigrams(text: str) -> set[str]:
+    trigrams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def name_similarity(a: str | None, b: str | None) -> float:
+    """Trigram similarity of two name keys, as pg_trgm's similarity() computes it."""
+    if not a or not b:
+        return 0.0
+    ta, tb = _trigrams(a), _trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta and tb else 0.0
+
+
+def normalize_business_name(name: str | None) -> str | None:
+    """Lowercase, strip punctuation and legal suffixes: "ACME, Inc." -> "acme"."""
+    if not name:
+        return None
+    tokens = [t for t in _NON_ALNUM.split(name.lower()) if t]
+    while len(tokens) > 1 and tokens[-1] in _COMPANY_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens) or None
+
+
+def resolution_keys(lead) -> tuple[str | None, str | None]:
+    """(domain_key, name_key) stored on leads for entity resolution."""
+    return (
+        company_domain(lead.website, lead.email),
+        normalize_business_name(lead.business_name),
+    )
+
+
+class LeadDeduplicator:
+    """
+    Tracks leads already emitted and rejects repeats by email, canonical
+    name, or domain when the names are also alike (or one is missing).
+    """
+
+    def __init__(self, domain_name_similarity: float | None = None):
+        self.domain_name_similarity = (
+            settings.LEAD_MATCH_DOMAIN_NAME_SIMILARITY if domain_name_similarity is None else domain_name_similarity
+        )
+        self._seen: set[tuple[str, str]] = set()
+        self._domain_names: dict[str, list[str | None]] = {}
+
+    def _same_domain(self, domain_key: str | None, name_key: str | None) -> bool:
+        names = self._domain_names.get(domain_key) if domain_key else None
+        if not names:
+            return False
+        return any(
+            not name_key or not seen or name_similarity(name_key, seen) >= self.domain_name_similarity
+            for seen in names
+        )
+
+    def add(self, lead) -> bool:
+        domain_key, name_key = resolution_keys(lead)
+        keys = [("email", normalize_email(lead.email)), ("name", name_key)]
+        keys = [k for k in keys if k[1]]
+        if any(k in self._seen for k in keys) or self._same_domain(domain_key, name_key):
+            return False
+        self._seen.update(keys)
+        if domain_key:
+            self._domain_names.setdefault(domain_key, []).append(name_key)
+        return True
@@ -0,0 +1,104 @@
+import json
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.lead import LeadCreate
+
+WIRE_FORMATS = ("json", "tsv")
+# Column order of the compact tab-separated format
+LEAD_WIRE_FIELDS = [
+    "business_name", "industry", "contact_person", "designation", "address", "country",
+    "contact_number", "email", "website", "summary", "lead_score",
+]
+_EMPTY_CELLS = ("", "-", "null", "None", "N/A")
+
+lead_batch_adapter = TypeAdapter(list[LeadCreate])
+
+
+class LeadTableStreamParser:
+    """
+    Incrementally turns tab-separated lead rows into dicts as lines complete.
+    The first line is the header when it names business_name; otherwise the
+    columns are assumed to follow LEAD_WIRE_FIELDS. Code fences are ignored
+    and malformed rows come back as {"__error__": ...}.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._header: list[str] | None = None
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Consume a chunk and return every row completed by it."""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        return self._rows(lines)
+
+    def close(self) -> list[dict]:
+        """Return the final row if the text did not end with a newline."""
+        lines, self._buffer = [self._buffer], ""
+        return self._rows(lines)
+
+    def _rows(self, lines: list[str]) -> list[dict]:
+        rows = []
+        for line in lines:
+            line = line.rstrip("\r")
+            if not line.strip() or line.lstrip().startswith("```"):
+                continue
+            cells = [cell.strip() for cell in line.split("\t")]
+            if self._header is None:
+                names = [cell.lower() for cell in cells]
+                if "business_name" in names:
+                    self._header = names
+                    continue
+                self._header = LEAD_WIRE_FIELDS
+            if len(cells) != len(self._header):
+                rows.append({"__error__": f"Expected {len(self._header)} fields, got {len(cells)}"})
+                continue
+            rows.append({k: v for k, v in zip(self._header, cells) if v not in _EMPTY_CELLS})
+        return rows
+
+
+def parse_lead_content(content: str, fmt: str) -> list[dict]:
+    """Raw lead dicts from a complete LLM response in the given wire format."""
+    if fmt == "tsv":
+        parser = LeadTableStreamParser()
+        return parser.feed(content) + parser.close()
+
+    cleaned_content = content.strip().replace("```json", "").replace("```", "")
+    try:
+        data = json.loads(cleaned_content)
+    except json.JSONDecodeError as e:
+        return [{"__error__": f"Invalid JSON: {e}"}]
+    if not isinstance(data, list):
+        return [{"__error__": "Expected a JSON array of leads"}]
+    return data
+
+
+def validate_leads(objects: list, start: int = 1) -> tuple[list[LeadCreate], list[dict]]:
+    """
+    Validate a batch of raw leads in one TypeAdapter pass. Returns the valid
+    leads and one failure per rejected row, numbered from `start`.
+    """
+    failures = [
+        {"row": start + i, "errors": [{"field": None, "message": obj["__error__"]}]}
+        for i, obj in enumerate(objects)
+        if isinstance(obj, dict) and "__error__" in obj
+    ]
+    candidates = [
+        (i, obj) for i, obj in enumerate(objects) if not (isinstance(obj, dict) and "__error__" in obj)
+    ]
+    try:
+        leads = lead_batch_adapter.validate_python([obj for _, obj in candidates])
+    except ValidationError as e:
+        errors: dict[int, list[dict]] = {}
+        for err in e.errors(include_url=False):
+            field = ".".join(str(part) for part in err["loc"][1:]) or None
+            errors.setdefault(err["loc"][0], []).append({"field": field, "message": err["msg"]})
+        failures.extend(
+            {"row": start + candidates[k][0], "errors": errs} for k, errs in errors.items()
+        )
+        failures.sort(key=lambda f: f["row"])
+        leads = lead_batch_adapter.validate_python(
+            [obj for k, (_, obj) in enumerate(candidates) if k not in errors]
+        )
+    return leads, failures
@@ -0,0 +1,24 @@
+import asyncio
+
+
+class AsyncRateLimiter:
+    """
+    Spaces calls evenly so no more than `per_minute` start in any minute.
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, per_minute: int):
+        self.interval = 60 / per_minute if per_minute else 0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
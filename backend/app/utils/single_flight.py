@@ -0,0 +1,57 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one shared task.
+
+    Every caller awaits the shared task through asyncio.shield, so a caller
+    that is cancelled (e.g. its client disconnected) only stops waiting.
+    The shared task is cancelled once no caller is left waiting for it.
+    """
+
+    def __init__(self):
+        self._flights: dict[str, tuple[asyncio.Task, list[int]]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.create_task(fn())
+            flight = (task, [0])
+            self._flights[key] = flight
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        task, waiters = flight
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if waiters[0] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._flights.get(key, (None,))[0] is task:
+            del self._flights[key]
+        # Mark the exception as retrieved when every waiter has gone
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        total = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,105 @@
+"""recompute lead resolution keys
+
+Revision ID: 00171922a816
+Revises: 498f29db3861
+Create Date: 2026-10-18 10:35:00.000000
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+from app.utils.lead_normalize import normalize_business_name, normalize_domain, resolution_keys
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00171922a816'
+down_revision: Union[str, Sequence[str], None] = '498f29db3861'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 5000
+
+SELECT_BATCH_SQL = (
+    sa.text("SELECT id, business_name, website, email FROM leads WHERE id > :last_id ORDER BY id LIMIT :limit")
+    .bindparams(sa.bindparam("last_id", type_=postgresql.UUID(as_uuid=True)))
+    .columns(id=postgresql.UUID(as_uuid=True))
+)
+UPDATE_KEYS_SQL = sa.text(
+    """
+    UPDATE leads SET domain_key = k.domain_key, name_key = k.name_key
+    FROM unnest(:ids, :domains, :names) AS k(id, domain_key, name_key)
+    WHERE leads.id = k.id
+      AND (leads.domain_key IS DISTINCT FROM k.domain_key OR leads.name_key IS DISTINCT FROM k.name_key)
+    """
+).bindparams(
+    sa.bindparam("ids", type_=postgresql.ARRAY(postgresql.UUID(as_uuid=True))),
+    sa.bindparam("domains", type_=postgresql.ARRAY(sa.String)),
+    sa.bindparam("names", type_=postgresql.ARRAY(sa.String)),
+)
+
+# Heuristic the keys were computed with before this revision, kept here so
+# downgrade restores exactly what the previous code expects
+_LEGACY_SECOND_LEVEL_LABELS = {"co", "com", "net", "org", "gov", "edu", "ac", "ltd", "plc", "gen", "biz"}
+_LEGACY_FREE_EMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
+    "msn.com", "aol.com", "icloud.com", "me.com", "proton.me", "protonmail.com",
+    "gmx.com", "mail.com", "yandex.com", "zoho.com",
+}
+
+
+def _legacy_registrable_domain(host):
+    if not host:
+        return None
+    labels = [label for label in host.strip(".").split(".") if label]
+    if len(labels) < 2:
+        return None
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _LEGACY_SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def _legacy_resolution_keys(row):
+    domain = _legacy_registrable_domain(normalize_domain(row.website)) if row.website else None
+    if not domain and row.email:
+        domain = _legacy_registrable_domain(normalize_domain(email=row.email))
+        if domain in _LEGACY_FREE_EMAIL_DOMAINS:
+            domain = None
+    return domain, normalize_business_name(row.business_name)
+
+
+def _recompute_keys(keys_for):
+    """Rewrite the keys of every lead in id order, committing each batch."""
+    bind = op.get_bind()
+    last_id = uuid.UUID(int=0)
+    with op.get_context().autocommit_block():
+        while True:
+            rows = bind.execute(SELECT_BATCH_SQL, {"last_id": last_id, "limit": BATCH_SIZE}).all()
+            if not rows:
+                return
+            keys = [keys_for(row) for row in rows]
+            bind.execute(
+                UPDATE_KEYS_SQL,
+                {
+                    "ids": [row.id for row in rows],
+                    "domains": [k[0] for k in keys],
+                    "names": [k[1] for k in keys],
+                },
+            )
+            last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Domain keys now come from the public suffix list and skip shared hosts
+    _recompute_keys(resolution_keys)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recompute_keys(_legacy_resolution_keys)
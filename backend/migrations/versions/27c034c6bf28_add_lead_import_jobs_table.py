@@ -0,0 +1,47 @@
+"""add lead import jobs table
+
+Revision ID: 27c034c6bf28
+Revises: 5623082b68a5
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27c034c6bf28'
+down_revision: Union[str, Sequence[str], None] = '5623082b68a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('lead_import_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('source_path', sa.String(), nullable=False),
+    sa.Column('rejects_path', sa.String(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('rows_processed', sa.BigInteger(), nullable=False),
+    sa.Column('rows_inserted', sa.BigInteger(), nullable=False),
+    sa.Column('rows_updated', sa.BigInteger(), nullable=False),
+    sa.Column('rows_skipped', sa.BigInteger(), nullable=False),
+    sa.Column('rows_rejected', sa.BigInteger(), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_lead_import_jobs_status'), 'lead_import_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_lead_import_jobs_status'), table_name='lead_import_jobs')
+    op.drop_table('lead_import_jobs')
@@ -0,0 +1,52 @@
+"""add lead entity resolution keys
+
+Revision ID: 38c9e7da4483
+Revises: 3f674dc91711
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '38c9e7da4483'
+down_revision: Union[str, Sequence[str], None] = '3f674dc91711'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('leads', sa.Column('domain_key', sa.String(), nullable=True))
+    op.add_column('leads', sa.Column('name_key', sa.String(), nullable=True))
+    op.create_index(op.f('ix_leads_domain_key'), 'leads', ['domain_key'], unique=False)
+    op.create_index(
+        'ix_leads_name_key_trgm', 'leads', ['name_key'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name_key': 'gin_trgm_ops'},
+    )
+    op.create_table('lead_merge_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('dry_run', sa.Boolean(), nullable=False),
+    sa.Column('rows_backfilled', sa.BigInteger(), nullable=False),
+    sa.Column('rows_scanned', sa.BigInteger(), nullable=False),
+    sa.Column('clusters_found', sa.BigInteger(), nullable=False),
+    sa.Column('leads_merged', sa.BigInteger(), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('lead_merge_runs')
+    op.drop_index('ix_leads_name_key_trgm', table_name='leads')
+    op.drop_index(op.f('ix_leads_domain_key'), table_name='leads')
+    op.drop_column('leads', 'name_key')
+    op.drop_column('leads', 'domain_key')
@@ -0,0 +1,32 @@
+"""add lower industry lead score index
+
+Revision ID: 3f674dc91711
+Revises: 88d986857862
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f674dc91711'
+down_revision: Union[str, Sequence[str], None] = '88d986857862'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_leads_lower_industry_score', 'leads',
+        [sa.text('lower(industry)'), sa.text('lead_score DESC')], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_leads_lower_industry_score', table_name='leads')
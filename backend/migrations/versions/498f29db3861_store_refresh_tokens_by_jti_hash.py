@@ -0,0 +1,69 @@
+"""store refresh tokens by jti hash
+
+Revision ID: 498f29db3861
+Revises: b4fe1d0debd9
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '498f29db3861'
+down_revision: Union[str, Sequence[str], None] = 'b4fe1d0debd9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_tokens', sa.Column('jti_hash', sa.LargeBinary(length=32), nullable=True))
+    # Derive the hash from the jti in each stored token's (base64url JSON) payload
+    op.execute(
+        """
+        UPDATE refresh_tokens SET jti_hash = sha256(convert_to(
+            convert_from(decode(
+                rpad(
+                    translate(split_part(token, '.', 2), '-_', '+/'),
+                    ((length(split_part(token, '.', 2)) + 3) / 4) * 4,
+                    '='
+                ),
+                'base64'
+            ), 'UTF8')::json ->> 'jti',
+            'UTF8'
+        ))
+        """
+    )
+    op.execute("DELETE FROM refresh_tokens WHERE jti_hash IS NULL")
+    op.alter_column('refresh_tokens', 'jti_hash', nullable=False)
+    op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token')
+    op.drop_index(op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens')
+    op.create_index(op.f('ix_refresh_tokens_jti_hash'), 'refresh_tokens', ['jti_hash'], unique=True)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+    op.create_index(
+        'ix_refresh_tokens_active_user_id', 'refresh_tokens', ['user_id'], unique=False,
+        postgresql_where=sa.text('NOT revoked'),
+    )
+    op.create_index(
+        'ix_refresh_tokens_revoked_expires_at', 'refresh_tokens', ['expires_at'], unique=False,
+        postgresql_where=sa.text('revoked'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Stored tokens cannot be recovered from their hashes; every session has to log in again
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_index('ix_refresh_tokens_revoked_expires_at', table_name='refresh_tokens')
+    op.drop_index('ix_refresh_tokens_active_user_id', table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_jti_hash'), table_name='refresh_tokens')
+    op.create_index(op.f('ix_refresh_tokens_user_id'), 'refresh_tokens', ['user_id'], unique=False)
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=False))
+    op.create_index(op.f('ix_refresh_tokens_token'), 'refresh_tokens', ['token'], unique=True)
+    op.drop_column('refresh_tokens', 'jti_hash')
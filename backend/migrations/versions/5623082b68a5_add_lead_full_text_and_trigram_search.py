@@ -0,0 +1,107 @@
+"""add lead full text and trigram search
+
+Revision ID: 5623082b68a5
+Revises: 90bba1d98d04
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5623082b68a5'
+down_revision: Union[str, Sequence[str], None] = '90bba1d98d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Weighted document over the columns of NEW (in the trigger) or of leads (in the backfill)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce({row}business_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}industry, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce({row}contact_person, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce({row}website, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce({row}summary, '')), 'D')"
+)
+SOURCE_COLUMNS = ('business_name', 'industry', 'contact_person', 'website', 'summary')
+TRGM_COLUMNS = ('business_name', 'contact_person', 'website')
+BACKFILL_BATCH_SIZE = 5000
+
+BACKFILL_SQL = sa.text(
+    f"""
+    UPDATE leads SET search_vector = {SEARCH_VECTOR_SQL.format(row="")}
+    WHERE id IN (SELECT id FROM leads WHERE id > :last_id ORDER BY id LIMIT :limit)
+    RETURNING id
+    """
+).bindparams(sa.bindparam("last_id", type_=postgresql.UUID(as_uuid=True))).columns(
+    id=postgresql.UUID(as_uuid=True)
+)
+
+
+def _backfill_search_vector():
+    """Fill search_vector in id order, one committed batch at a time."""
+    bind = op.get_bind()
+    last_id = uuid.UUID(int=0)
+    while True:
+        ids = bind.execute(BACKFILL_SQL, {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}).scalars().all()
+        if not ids:
+            return
+        last_id = max(ids)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # A plain nullable column is a catalog-only change; a STORED generated
+    # column would rewrite the whole table under ACCESS EXCLUSIVE
+    op.add_column('leads', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"""
+        CREATE FUNCTION leads_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER leads_search_vector_update
+        BEFORE INSERT OR UPDATE OF {", ".join(SOURCE_COLUMNS)} ON leads
+        FOR EACH ROW EXECUTE FUNCTION leads_search_vector_update()
+        """
+    )
+
+    # Rows written from here on are covered by the trigger; fill the rest in
+    # short transactions, then build the indexes without blocking writes
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            op.execute(f"UPDATE leads SET search_vector = {SEARCH_VECTOR_SQL.format(row='')}")
+        else:
+            _backfill_search_vector()
+        op.create_index(
+            'ix_leads_search_vector', 'leads', ['search_vector'], unique=False,
+            postgresql_using='gin', postgresql_concurrently=True,
+        )
+        for col in TRGM_COLUMNS:
+            op.create_index(
+                f'ix_leads_{col}_trgm', 'leads', [col], unique=False,
+                postgresql_using='gin', postgresql_ops={col: 'gin_trgm_ops'}, postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for col in reversed(TRGM_COLUMNS):
+            op.drop_index(f'ix_leads_{col}_trgm', table_name='leads', postgresql_concurrently=True)
+        op.drop_index('ix_leads_search_vector', table_name='leads', postgresql_concurrently=True)
+    op.execute("DROP TRIGGER leads_search_vector_update ON leads")
+    op.execute("DROP FUNCTION leads_search_vector_update()")
+    op.drop_column('leads', 'search_vector')
@@ -0,0 +1,46 @@
+"""add lead scoring runs table
+
+Revision ID: 8070ac2f1184
+Revises: 27c034c6bf28
+Create Date: 2026-10-18 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8070ac2f1184'
+down_revision: Union[str, Sequence[str], None] = '27c034c6bf28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('lead_scoring_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('profile', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('full', sa.Boolean(), nullable=False),
+    sa.Column('filtered', sa.Boolean(), nullable=False),
+    sa.Column('rows_scored', sa.BigInteger(), nullable=False),
+    sa.Column('rows_changed', sa.BigInteger(), nullable=False),
+    sa.Column('watermark', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_lead_scoring_runs_profile'), 'lead_scoring_runs', ['profile'], unique=False)
+    op.create_index('ix_leads_updated_at_id', 'leads', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_leads_updated_at_id', table_name='leads')
+    op.drop_index(op.f('ix_lead_scoring_runs_profile'), table_name='lead_scoring_runs')
+    op.drop_table('lead_scoring_runs')
@@ -0,0 +1,44 @@
+"""add lead generation jobs table
+
+Revision ID: 88d986857862
+Revises: 8070ac2f1184
+Create Date: 2026-10-18 09:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '88d986857862'
+down_revision: Union[str, Sequence[str], None] = '8070ac2f1184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('lead_generation_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('params', sa.JSON(), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_lead_generation_jobs_status_created', 'lead_generation_jobs', ['status', 'created_at'], unique=False)
+    op.create_index('ix_lead_generation_jobs_user_status', 'lead_generation_jobs', ['user_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_lead_generation_jobs_user_status', table_name='lead_generation_jobs')
+    op.drop_index('ix_lead_generation_jobs_status_created', table_name='lead_generation_jobs')
+    op.drop_table('lead_generation_jobs')
@@ -0,0 +1,33 @@
+"""add lead keyset pagination indexes
+
+Revision ID: 90bba1d98d04
+Revises: b18bc88a197d
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '90bba1d98d04'
+down_revision: Union[str, Sequence[str], None] = 'b18bc88a197d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_leads_score_created_id', 'leads', ['lead_score', 'created_at', 'id'], unique=False)
+    op.create_index('ix_leads_industry_score_created_id', 'leads', ['industry', 'lead_score', 'created_at', 'id'], unique=False)
+    op.create_index('ix_leads_country_score_created_id', 'leads', ['country', 'lead_score', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_leads_country_score_created_id', table_name='leads')
+    op.drop_index('ix_leads_industry_score_created_id', table_name='leads')
+    op.drop_index('ix_leads_score_created_id', table_name='leads')
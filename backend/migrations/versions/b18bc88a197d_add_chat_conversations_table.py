@@ -0,0 +1,37 @@
+"""add chat conversations table
+
+Revision ID: b18bc88a197d
+Revises: 40d7520514a1
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b18bc88a197d'
+down_revision: Union[str, Sequence[str], None] = '40d7520514a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('chat_conversations',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('state', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_chat_conversations_expires_at'), 'chat_conversations', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_chat_conversations_expires_at'), table_name='chat_conversations')
+    op.drop_table('chat_conversations')
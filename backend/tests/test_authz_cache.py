@@ -0,0 +1,162 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.authz_cache as authz_cache
+from app.services.authz_cache import PermissionCache, load_principal
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_user(*codes: str, user_id: uuid.UUID | None = None):
+    """User row with a single role granting "module:name" codes."""
+    permissions = [
+        SimpleNamespace(id=uuid.uuid4(), module=code.split(":")[0], name=code.split(":")[1])
+        for code in codes
+    ]
+    role = SimpleNamespace(id=uuid.uuid4(), name="role", permissions=permissions)
+    return SimpleNamespace(
+        id=user_id or uuid.uuid4(), username="ada", email="ada@example.com", is_active=True,
+        created_at=NOW, updated_at=NOW, roles=[role], profile_pic=None, google_sub=None,
+    )
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def one_or_none(self):
+        return self._value
+
+
+class FakeSession:
+    """Answers the authz version read and the user load of load_principal."""
+
+    def __init__(self, users: dict, version: int = 1):
+        self.users = users
+        self.version = version
+        self.user_loads = 0
+
+    async def execute(self, stmt):
+        return _Result(self.version)
+
+    async def exec(self, stmt):
+        self.user_loads += 1
+        user_id = stmt.whereclause.right.value
+        return _Result(self.users.get(user_id))
+
+
+@pytest.fixture
+def cache(monkeypatch) -> PermissionCache:
+    cache = PermissionCache(ttl_seconds=60, max_entries=100, version_check_seconds=0)
+    monkeypatch.setattr(authz_cache, "permission_cache", cache)
+    return cache
+
+
+def test_principal_is_cached_while_version_is_current(cache):
+    user = make_user("lead:read")
+    session = FakeSession({user.id: user})
+
+    async def scenario():
+        first = await load_principal(session, user.id)
+        second = await load_principal(session, user.id)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+    assert first.permissions == {"lead:read"}
+    assert session.user_loads == 1
+
+
+def test_version_bump_reloads_permissions(cache):
+    user = make_user("lead:read")
+    session = FakeSession({user.id: user})
+
+    async def scenario():
+        await load_principal(session, user.id)
+        # Another worker revokes the role's permission and bumps the version
+        user.roles[0].permissions = []
+        session.version += 1
+        return await load_principal(session, user.id)
+
+    principal = asyncio.run(scenario())
+    assert principal.permissions == frozenset()
+    assert principal.version == 2
+    assert session.user_loads == 2
+
+
+def test_evict_reloads_only_that_user(cache):
+    ada, bob = make_user("lead:read"), make_user("lead:read")
+    session = FakeSession({ada.id: ada, bob.id: bob})
+
+    async def scenario():
+        await load_principal(session, ada.id)
+        await load_principal(session, bob.id)
+        cache.evict(ada.id)
+        await load_principal(session, ada.id)
+        await load_principal(session, bob.id)
+
+    asyncio.run(scenario())
+    assert session.user_loads == 3
+
+
+def test_entries_from_an_older_version_are_not_served(cache):
+    user_id = uuid.uuid4()
+    cache.advance(1)
+    cache.set(user_id, SimpleNamespace(version=1))
+    assert cache.get(user_id, 1) is not None
+
+    cache.advance(2)
+    assert cache.get(user_id, 2) is None
+    # A late reader still holding version 1 cannot resurrect the entry
+    assert cache.get(user_id, 1) is None
+
+
+class UserUpdateSession(FakeSession):
+    async def exec(self, stmt):
+        if isinstance(stmt.whereclause.right.value, list):
+            # Role lookup for role_ids; no roles exist
+            return SimpleNamespace(all=lambda: [])
+        return await super().exec(stmt)
+
+    def add(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+@pytest.mark.parametrize(
+    "changes, bumps",
+    [({"username": "ada2"}, 0), ({"email": "ada2@example.com"}, 0), ({"is_active": False}, 1), ({"role_ids": []}, 1)],
+)
+def test_update_user_bumps_version_only_for_access_changes(cache, monkeypatch, changes, bumps):
+    import app.services.user_service as user_service
+    from app.schemas.users import UserUpdate
+
+    user = make_user("lead:read")
+    session = UserUpdateSession({user.id: user})
+    bumped = []
+
+    async def fake_bump(session):
+        bumped.append(True)
+        return len(bumped) + 1
+
+    monkeypatch.setattr(user_service, "bump_authz_version", fake_bump)
+    monkeypatch.setattr(user_service, "permission_cache", cache)
+    cache.advance(1)
+    cache.set(user.id, SimpleNamespace(version=1))
+
+    asyncio.run(user_service.UserService(session).update_user(user.id, UserUpdate(**changes)))
+    assert len(bumped) == bumps
+    # Either way this user's cached principal is no longer served
+    assert cache.get(user.id, cache.stats()["version"]) is None
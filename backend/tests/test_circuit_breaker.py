@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.llm_client import LLMClient, LLMPrompt, LLMRouter
+from app.utils.circuit_breaker import CircuitBreaker
+
+PROMPT = LLMPrompt("{question}")
+
+
+class HangingClient(LLMClient):
+    """Never answers until released, so calls can be cancelled mid-flight."""
+
+    def __init__(self, model: str = "test-model"):
+        self.model = model
+        self.calls = 0
+
+    async def generate(self, prompt, inputs) -> str:
+        self.calls += 1
+        await asyncio.Event().wait()
+
+    async def stream(self, prompt, inputs):
+        self.calls += 1
+        yield "partial"
+        await asyncio.Event().wait()
+
+
+def _half_open_router(client: LLMClient) -> LLMRouter:
+    router = LLMRouter(
+        [client],
+        hedge_percentile=0,
+        hedge_min_delay=1,
+        hedge_default_delay=1,
+        breaker_threshold=1,
+        breaker_reset_seconds=0,
+    )
+    router.breakers[client].record_failure()
+    assert router.breakers[client].state == "half_open"
+    return router
+
+
+def test_cancelled_trial_releases_half_open_slot():
+    client = HangingClient()
+    router = _half_open_router(client)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(router.generate(PROMPT, {"question": "q"}), timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(router.generate(PROMPT, {"question": "q"}), timeout=0.05)
+
+    asyncio.run(scenario())
+    # The second call reached the model instead of being rejected with 503
+    assert client.calls == 2
+    assert router.breakers[client].allow()
+
+
+def test_closed_stream_releases_half_open_slot():
+    client = HangingClient()
+    router = _half_open_router(client)
+
+    async def scenario():
+        stream = router.stream(PROMPT, {"question": "q"})
+        assert await stream.__anext__() == "partial"
+        await stream.aclose()
+
+    asyncio.run(scenario())
+    assert router.breakers[client].allow()
+
+
+def test_lost_trial_expires_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0, trial_timeout_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+def test_trial_success_closes_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+class AnsweringClient(LLMClient):
+    def __init__(self, model: str = "test-model", answer: str = "ok"):
+        self.model = model
+        self.answer = answer
+
+    async def generate(self, prompt, inputs) -> str:
+        return self.answer
+
+    async def stream(self, prompt, inputs):
+        yield self.answer
+
+
+def _hedging_router(clients: list[LLMClient], delay: float = 0.02) -> LLMRouter:
+    return LLMRouter(
+        clients,
+        hedge_percentile=95,
+        hedge_min_delay=delay,
+        hedge_default_delay=delay,
+        breaker_threshold=1,
+        breaker_reset_seconds=60,
+    )
+
+
+def test_hedge_loser_is_not_charged_a_failure():
+    slow, fast = HangingClient("primary"), AnsweringClient("backup")
+    router = _hedging_router([slow, fast])
+
+    assert asyncio.run(router.generate(PROMPT, {"question": "q"})) == "ok"
+    assert router.hedge_wins == 1
+    assert router.breakers[slow].state == "closed"
+
+
+def test_hedge_loser_records_censored_latency():
+    slow, fast = HangingClient("primary"), AnsweringClient("backup")
+    router = _hedging_router([slow, fast], delay=0.02)
+
+    asyncio.run(router.generate(PROMPT, {"question": "q"}))
+    # The cancelled primary ran for at least the hedge delay
+    assert len(router.latencies[slow]) == 1
+    assert router.latencies[slow].percentile(50) >= 0.02
+
+
+def test_clients_sharing_a_model_keep_separate_state():
+    first, second = HangingClient("same-model"), AnsweringClient("same-model")
+    router = _hedging_router([first, second])
+    router.breakers[first].record_failure()
+
+    assert router.breakers[first].state == "open"
+    assert router.breakers[second].state == "closed"
+    assert set(router.stats()["models"]) == {"same-model#0", "same-model#1"}
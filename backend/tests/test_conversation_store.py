@@ -0,0 +1,37 @@
+import asyncio
+
+from app.services.conversation_store import InMemoryConversationStore
+
+
+def _store(max_entries: int = 100, max_total_bytes: int = 10_000) -> InMemoryConversationStore:
+    return InMemoryConversationStore(
+        ttl_seconds=60, max_bytes=10_000, max_entries=max_entries, max_total_bytes=max_total_bytes
+    )
+
+
+def test_total_bytes_cap_evicts_least_recently_used():
+    store = _store(max_total_bytes=250)
+
+    async def scenario():
+        for user in ("a", "b", "c"):
+            await store.save(user, {"step": 1, "clients": user * 80})
+        # "a" was evicted to make room for "c"
+        assert await store.load("a") is None
+        assert await store.load("b") is not None
+        assert await store.load("c") is not None
+
+    asyncio.run(scenario())
+    assert store.total_bytes <= 250
+
+
+def test_total_bytes_tracks_overwrites_and_deletes():
+    store = _store()
+
+    async def scenario():
+        await store.save("a", {"step": 1, "clients": "x" * 500})
+        await store.save("a", {"step": 2})
+        assert store.total_bytes == len('{"step":2}')
+        await store.delete("a")
+
+    asyncio.run(scenario())
+    assert store.total_bytes == 0
@@ -0,0 +1,25 @@
+import pytest
+
+from app.services.lead_intent import extract_intent_rules
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("fintech startups in Berlin", {"industry": "Fintech", "clients": "fintech startups", "location": "Berlin"}),
+        ("In Germany I want banks", {"clients": "banks", "location": "Germany"}),
+        ("Based in New York, USA we need saas companies", {"industry": "SaaS", "clients": "saas companies", "location": "New York, USA"}),
+        ("Around London find retail brands", {"industry": "Retail", "clients": "retail brands", "location": "London"}),
+        ("In the UK, I need healthcare clinics", {"industry": "Healthcare", "clients": "healthcare clinics", "location": "UK"}),
+    ],
+)
+def test_extract_intent_rules(message, expected):
+    assert extract_intent_rules(message) == expected
+
+
+def test_location_stops_at_lowercase_words():
+    assert extract_intent_rules("hotels in Paris that have spas")["location"] == "Paris"
+
+
+def test_lowercase_words_after_preposition_are_not_a_location():
+    assert "location" not in extract_intent_rules("in need of logistics firms")
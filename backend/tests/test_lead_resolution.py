@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import app.db.base  # noqa: F401  (registers every table for the Lead model)
+from app.models.lead import Lead
+from app.services.lead_resolution import _clusters, _merge_cluster, _same_company
+from app.utils.lead_normalize import resolution_keys
+
+NOW = datetime.now(timezone.utc)
+
+
+def _lead(name: str, website: str | None = None, country: str | None = None, score: int = 50, age: int = 0) -> Lead:
+    lead = Lead(
+        business_name=name,
+        industry="Software",
+        lead_score=score,
+        verified=False,
+        website=website,
+        country=country,
+        created_at=NOW - timedelta(days=age),
+    )
+    lead.domain_key, lead.name_key = resolution_keys(lead)
+    return lead
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Just enough of AsyncSession for _merge_cluster."""
+
+    def __init__(self, leads: list[Lead]):
+        self.leads = {lead.id: lead for lead in leads}
+        self.deleted: set = set()
+
+    async def exec(self, stmt):
+        return _Result(list(self.leads.values()))
+
+    async def execute(self, stmt):
+        ids = stmt.whereclause.right.value
+        self.deleted.update(ids)
+
+    def add(self, obj):
+        pass
+
+    async def flush(self):
+        pass
+
+
+def test_different_domains_never_match():
+    assert not _same_company(_lead("Acme", "acme.com"), _lead("Acme", "acme.de"))
+
+
+def test_same_domain_requires_similar_names():
+    assert _same_company(_lead("Acme", "acme.com"), _lead("Acme Inc", "https://www.acme.com/about"))
+    assert not _same_company(_lead("Acme", "acme.com"), _lead("Globex", "acme.com"))
+
+
+def test_name_match_respects_country():
+    assert _same_company(_lead("Acme", "acme.com", "Germany"), _lead("ACME Ltd", None, "germany"))
+    assert _same_company(_lead("Acme", "acme.com", "Germany"), _lead("Acme", None, None))
+    assert not _same_company(_lead("Acme", "acme.com", "Germany"), _lead("Acme", None, "France"))
+
+
+def test_cluster_bridged_by_domainless_lead_keeps_other_domain():
+    survivor = _lead("Acme", "acme.com", score=90, age=10)
+    bridge = _lead("Acme", None, score=40)
+    other = _lead("Acme", "acme.de", score=60)
+
+    # The domainless lead matches both sides, so all three share a cluster
+    clusters = _clusters([(survivor.id, bridge.id), (bridge.id, other.id)])
+    assert clusters == [{survivor.id, bridge.id, other.id}]
+
+    session = FakeSession([survivor, bridge, other])
+    removed = asyncio.run(_merge_cluster(session, clusters[0]))
+
+    assert removed == 1
+    assert session.deleted == {bridge.id}
+    assert survivor.lead_score == 90
@@ -0,0 +1,150 @@
+import asyncio
+import base64
+import hashlib
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+import app.db.base  # noqa: F401  (registers every table for the RefreshToken model)
+from app.services.auth_service import AuthService
+from app.services.refresh_token_purge import RefreshTokenPurger
+from app.utils.jwt import create_refresh_token, hash_jti, refresh_token_jti
+
+
+class TokenTableSession:
+    """
+    refresh_tokens held in a dict. The rotation UPDATE is applied as one
+    check-and-set, as the row lock makes it in Postgres.
+    """
+
+    def __init__(self):
+        self.rows = {}
+
+    def add(self, token):
+        self.rows[token.jti_hash] = token
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+    async def execute(self, stmt):
+        # The conditions this fake applies must be the ones the statement carries
+        sql = str(stmt)
+        assert "refresh_tokens.revoked = false" in sql and "refresh_tokens.expires_at > now()" in sql
+        params = stmt.compile().params
+        jti_hash = next(v for v in params.values() if isinstance(v, bytes))
+        user_id = next(v for v in params.values() if isinstance(v, uuid.UUID))
+        row = self.rows.get(jti_hash)
+        matched = (
+            row is not None
+            and row.user_id == user_id
+            and not row.revoked
+            and row.expires_at > datetime.now(timezone.utc)
+        )
+        if matched:
+            row.revoked = True
+        return type("Result", (), {"scalar_one_or_none": lambda _: row.user_id if matched else None})()
+
+
+@pytest.fixture
+def service() -> AuthService:
+    return AuthService(TokenTableSession())
+
+
+def _issue(service: AuthService, user_id: uuid.UUID) -> str:
+    return asyncio.run(service.create_and_store_refresh_token(user_id))
+
+
+def test_rotation_revokes_the_old_token_and_stores_the_new_one(service):
+    user_id = uuid.uuid4()
+    token = _issue(service, user_id)
+
+    new_token = asyncio.run(service.rotate_refresh_token(token, user_id))
+
+    rows = service.session.rows
+    assert rows[hash_jti(refresh_token_jti(token))].revoked
+    assert not rows[hash_jti(refresh_token_jti(new_token))].revoked
+
+
+def test_second_use_of_a_refresh_token_is_rejected(service):
+    user_id = uuid.uuid4()
+    token = _issue(service, user_id)
+    asyncio.run(service.rotate_refresh_token(token, user_id))
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.rotate_refresh_token(token, user_id))
+    assert exc.value.status_code == 401
+
+
+def test_concurrent_rotations_of_one_token_issue_one_replacement(service):
+    user_id = uuid.uuid4()
+    token = _issue(service, user_id)
+
+    async def scenario():
+        return await asyncio.gather(
+            service.rotate_refresh_token(token, user_id),
+            service.rotate_refresh_token(token, user_id),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert sum(isinstance(r, str) for r in results) == 1
+    assert sum(isinstance(r, HTTPException) and r.status_code == 401 for r in results) == 1
+
+
+def test_rotation_rejects_another_users_and_expired_tokens(service):
+    user_id = uuid.uuid4()
+    token = _issue(service, user_id)
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.rotate_refresh_token(token, uuid.uuid4()))
+
+    row = service.session.rows[hash_jti(refresh_token_jti(token))]
+    row.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    with pytest.raises(HTTPException):
+        asyncio.run(service.rotate_refresh_token(token, user_id))
+
+
+def test_jti_hash_is_fixed_width_and_deterministic():
+    assert len(hash_jti("a")) == 32
+    assert hash_jti("a") == hash_jti("a") != hash_jti("b")
+
+
+def test_jti_is_read_from_expired_but_not_from_tampered_tokens():
+    expired = create_refresh_token(uuid.uuid4(), expires_days=-1, jti="jti-1")
+    assert refresh_token_jti(expired) == "jti-1"
+
+    header, payload, signature = expired.split(".")
+    assert refresh_token_jti(f"{header}.{payload}.{signature[::-1]}") is None
+    assert refresh_token_jti("not-a-token") is None
+
+
+def test_migration_derives_the_same_hash_as_the_app():
+    # Mirrors the UPDATE in 498f29db3861: second JWT segment, base64url with
+    # padding restored, JSON ->> 'jti', sha256 of its UTF-8 bytes
+    token = create_refresh_token(uuid.uuid4(), jti=str(uuid.uuid4()))
+    segment = token.split(".")[1]
+    padded = segment.translate(str.maketrans("-_", "+/")).ljust((len(segment) + 3) // 4 * 4, "=")
+    jti = json.loads(base64.b64decode(padded).decode("utf-8"))["jti"]
+
+    assert hashlib.sha256(jti.encode("utf-8")).digest() == hash_jti(refresh_token_jti(token))
+
+
+def test_purge_stops_at_a_short_batch_or_max_batches():
+    purger = RefreshTokenPurger(interval_seconds=60, batch_size=100, max_batches=3, pause_seconds=0)
+    backlog = [100, 100, 100, 100, 40]
+
+    async def purge_batch():
+        return backlog.pop(0)
+
+    purger._purge_batch = purge_batch
+    assert asyncio.run(purger.run_once()) == 300
+    assert purger.last_run_batches == 3
+    # The rest of the backlog is worked off by the next run
+    assert asyncio.run(purger.run_once()) == 140
+    assert purger.stats()["rows_deleted"] == 440
@@ -0,0 +1,77 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+import app.dependencies.dependencies as dependencies
+import app.services.authz_cache as authz_cache
+from app.services.authz_cache import PermissionCache, Principal
+from app.utils.jwt import create_access_token
+
+
+class VersionSession:
+    """Answers only the authz version read."""
+
+    def __init__(self, version: int):
+        self.version = version
+
+    async def execute(self, stmt):
+        return type("Result", (), {"scalar_one_or_none": lambda _: self.version})()
+
+
+@pytest.fixture
+def loads(monkeypatch) -> list:
+    """Fresh permission cache; records database fallbacks, which grant nothing."""
+    cache = PermissionCache(ttl_seconds=60, max_entries=100, version_check_seconds=0)
+    monkeypatch.setattr(authz_cache, "permission_cache", cache)
+    monkeypatch.setattr(dependencies, "permission_cache", cache)
+    calls = []
+
+    async def fake_load_principal(session, user_id):
+        calls.append(user_id)
+        return Principal(user=None, permissions=frozenset(), version=session.version)
+
+    monkeypatch.setattr(dependencies, "load_principal", fake_load_principal)
+    return calls
+
+
+def _check(token: str, session: VersionSession, code: str = "lead:read"):
+    module, action = code.split(":")
+    return asyncio.run(dependencies.require_permission(module, action)(token=token, session=session))
+
+
+def test_current_token_claims_authorize_without_loading_the_user(loads):
+    token = create_access_token(uuid.uuid4(), permissions={"lead:read"}, authz_version=3)
+
+    assert _check(token, VersionSession(3)) is True
+    assert loads == []
+
+
+def test_stale_token_claims_fall_back_to_the_database(loads):
+    user_id = uuid.uuid4()
+    token = create_access_token(user_id, permissions={"lead:read"}, authz_version=2)
+
+    # Roles changed after the token was issued and the user lost lead:read
+    with pytest.raises(HTTPException) as exc:
+        _check(token, VersionSession(3))
+    assert exc.value.status_code == 403
+    assert loads == [user_id]
+
+
+def test_token_without_claims_falls_back_to_the_database(loads):
+    user_id = uuid.uuid4()
+    token = create_access_token(user_id)
+
+    with pytest.raises(HTTPException):
+        _check(token, VersionSession(1))
+    assert loads == [user_id]
+
+
+def test_missing_permission_in_current_claims_is_forbidden(loads):
+    token = create_access_token(uuid.uuid4(), permissions={"lead:read"}, authz_version=3)
+
+    with pytest.raises(HTTPException) as exc:
+        _check(token, VersionSession(3), "lead:delete")
+    assert exc.value.status_code == 403
+    assert loads == []